@@ -35,6 +35,8 @@ setup(
         ':python_version=="3.3"': ['pysocks'],
         ':python_version=="3.4"': ['pysocks'],
         ':python_version=="3.5"': ['pysocks'],
+        # Optional transports
+        'urllib3': ['urllib3'],
     },
     packages = find_packages(),
     include_package_data=True,
@@ -11,4 +11,5 @@ def test_phone_numbers(mock):
     client.phone_numbers.get("+15108675309")
     uri = "https://lookups.twilio.com/v1/PhoneNumbers/+15108675309"
     mock.assert_called_with("GET", uri, params={}, auth=("ACCOUNT_SID", "AUTH_TOKEN"),
-                            use_json_extension=False)
+                            use_json_extension=False,
+                            transport=client.transport)
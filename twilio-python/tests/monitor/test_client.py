@@ -11,4 +11,5 @@ def test_events(mock):
     mock.return_value = resp
     client.events.get("AEaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa")
     uri = "https://monitor.twilio.com/v1/Events/AEaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
-    mock.assert_called_with("GET", uri, auth=("ACCOUNT_SID", "AUTH_TOKEN"), use_json_extension=False)
+    mock.assert_called_with("GET", uri, auth=("ACCOUNT_SID", "AUTH_TOKEN"), use_json_extension=False,
+                            transport=client.transport)
@@ -15,6 +15,7 @@ class AccountTest(unittest.TestCase):
 
         mock = Mock()
         mock.uri = "/base"
+        mock.client = None
         account = Account(mock, 'AC123')
         account.load_subresources()
         records = account.usage_records.list()
@@ -27,6 +28,7 @@ class AccountTest(unittest.TestCase):
 
         mock = Mock()
         mock.uri = "/base"
+        mock.client = None
         account = Account(mock, 'AC123')
         account.load_subresources()
         triggers = account.usage_triggers.list()
@@ -0,0 +1,351 @@
+import json
+import sys
+import unittest
+
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from mock import patch
+    from twilio.rest.aio import (
+        AsyncTwilioLookupsClient,
+        AsyncTwilioRestClient,
+    )
+    from twilio.rest.resources.aio import AiohttpTransport, AsyncTransport
+
+
+class FakeTransport(object):
+    """ Answers requests with canned responses, in order """
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        status, body = self.responses.pop(0)
+        headers = {"retry-after": "0"} if status >= 500 else {}
+        future = asyncio.Future()
+        future.set_result((status, headers, json.dumps(body).encode('utf-8')))
+        return future
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "asyncio clients need 3.5+")
+class AsyncClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def client(self, *responses):
+        self.transport = FakeTransport(*responses)
+        return AsyncTwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                     transport=self.transport)
+
+    def run_coroutine(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def collect(self, iterator):
+        iterator = iterator.__aiter__()
+        items = []
+        while True:
+            try:
+                items.append(self.run_coroutine(iterator.__anext__()))
+            except StopAsyncIteration:
+                return items
+
+    def test_get(self):
+        client = self.client((200, {"sid": "CA123", "to": "+15555555555"}))
+        call = self.run_coroutine(client.calls.get("CA123"))
+        assert_equal(call.to, "+15555555555")
+        method, url, kwargs = self.transport.requests[0]
+        assert_equal(method, "GET")
+        assert_true(url.endswith("/Accounts/ACCOUNT_SID/Calls/CA123.json"))
+        assert_equal(kwargs["auth"], ("ACCOUNT_SID", "AUTH_TOKEN"))
+
+    def test_create(self):
+        client = self.client((201, {"sid": "SM123", "body": "Hi"}))
+        message = self.run_coroutine(
+            client.messages.create(to="+1", from_="+2", body="Hi"))
+        assert_equal(message.sid, "SM123")
+        method, url, kwargs = self.transport.requests[0]
+        assert_equal(method, "POST")
+        assert_true("Body=Hi" in kwargs["body"])
+
+    def test_update_instance(self):
+        client = self.client(
+            (200, {"sid": "CA123", "status": "in-progress"}),
+            (200, {"sid": "CA123", "status": "completed"}),
+        )
+        call = self.run_coroutine(client.calls.get("CA123"))
+        self.run_coroutine(call.hangup())
+        assert_equal(call.status, "completed")
+
+    def test_delete(self):
+        client = self.client((204, {}))
+        assert_true(self.run_coroutine(client.calls.delete("CA123")))
+        assert_equal(self.transport.requests[0][0], "DELETE")
+
+    def test_list(self):
+        client = self.client((200, {"calls": [{"sid": "CA1"}]}))
+        calls = self.run_coroutine(client.calls.list(status="completed"))
+        assert_equal([c.sid for c in calls], ["CA1"])
+        assert_true("Status=completed" in self.transport.requests[0][1])
+
+    def test_iter(self):
+        client = self.client(
+            (200, {"calls": [{"sid": "CA1"}, {"sid": "CA2"}],
+                   "next_page_uri": "/Calls.json?Page=1&PageToken=PA2"}),
+            (200, {"calls": [{"sid": "CA3"}], "next_page_uri": None}),
+        )
+        calls = self.collect(client.calls.iter(status="completed"))
+        assert_equal([c.sid for c in calls], ["CA1", "CA2", "CA3"])
+        assert_true("PageToken=PA2" in self.transport.requests[1][1])
+
+    def test_iter_raw(self):
+        client = self.client((200, {"calls": [{"sid": "CA1"}],
+                                    "next_page_uri": None}))
+        calls = self.collect(client.calls.iter(raw=True))
+        assert_equal(calls, [{"sid": "CA1"}])
+
+    def test_iter_rows(self):
+        client = self.client((200, {"calls": [{"sid": "CA1", "to": "+1"}],
+                                    "next_page_uri": None}))
+        calls = self.collect(client.calls.iter(rows=True, fields=["sid"]))
+        assert_equal(calls, [("CA1",)])
+        assert_equal(calls[0].sid, "CA1")
+
+    @raises(TwilioException)
+    def test_iter_prefetch(self):
+        self.client().calls.iter(prefetch=1)
+
+    @raises(TwilioException)
+    def test_delete_many(self):
+        self.client().recordings.delete_many(["RE1"])
+
+    @raises(TwilioException)
+    def test_sync(self):
+        from twilio.rest.resources import MemoryCheckpointStore
+        self.client().messages.sync(MemoryCheckpointStore())
+
+    @raises(TwilioException)
+    def test_scan(self):
+        self.client().calls.scan("2015-05-01", "2015-05-31")
+
+    def test_tracing(self):
+        from twilio.rest.resources.tracing import Span, Tracer
+
+        spans = []
+
+        class RecordingTracer(Tracer):
+            def start_span(self, name, parent=None, attributes=None):
+                span = Span()
+                span.name, span.parent = name, parent
+                spans.append(span)
+                return span
+
+        self.transport = FakeTransport(
+            (201, {"sid": "SM1"}),
+            (200, {"calls": [{"sid": "CA1"}], "next_page_uri": "/C?Page=1"}),
+            (200, {"calls": [], "next_page_uri": None}),
+        )
+        client = AsyncTwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       transport=self.transport,
+                                       tracer=RecordingTracer())
+
+        self.run_coroutine(client.messages.create(to="+1", body="Hi"))
+        self.collect(client.calls.iter())
+
+        names = [span.name for span in spans]
+        assert_equal(names[0], "Messages.create")
+        assert_true(spans[1].parent is spans[0])
+        assert_equal(names[2], "Calls.iter")
+        assert_true(spans[3].parent is spans[2])
+        assert_true(spans[4].parent is spans[2])
+
+    def test_next_gen_iter(self):
+        self.transport = FakeTransport(
+            (200, {"meta": {"key": "phone_numbers",
+                            "next_page_url": "https://lookups/p2"},
+                   "phone_numbers": [{"phone_number": "+1"}]}),
+            (200, {"meta": {"key": "phone_numbers"},
+                   "phone_numbers": [{"phone_number": "+2"}]}),
+        )
+        client = AsyncTwilioLookupsClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                          transport=self.transport)
+        numbers = self.collect(client.phone_numbers.iter())
+        assert_equal([n.phone_number for n in numbers], ["+1", "+2"])
+        assert_equal(self.transport.requests[1][1], "https://lookups/p2")
+
+    def test_iter_response_cache(self):
+        from twilio.rest.resources import ResponseCache
+
+        self.transport = FakeTransport(
+            (200, {"queues": [{"sid": "QU1"}], "next_page_uri": None}),
+        )
+        client = AsyncTwilioRestClient(
+            "ACCOUNT_SID", "AUTH_TOKEN", transport=self.transport,
+            response_cache=ResponseCache({"Queues": 60}))
+
+        for _ in range(2):
+            queues = self.collect(client.queues.iter())
+            assert_equal([q.sid for q in queues], ["QU1"])
+        assert_equal(len(self.transport.requests), 1)
+
+    def test_validate_caller_id(self):
+        client = self.client((200, {"validation_code": "123456"}))
+        validation = self.run_coroutine(
+            client.caller_ids.validate("+15555555555"))
+        assert_equal(validation["validation_code"], "123456")
+        assert_equal(self.transport.requests[0][0], "POST")
+
+    def test_search_phone_numbers(self):
+        client = self.client(
+            (200, {"available_phone_numbers": [{"phone_number": "+1"}]}),
+            (200, {"incoming_phone_numbers": [{"sid": "PN1"}]}),
+            (201, {"sid": "PN2"}),
+        )
+        numbers = self.run_coroutine(
+            client.phone_numbers.search(area_code="415"))
+        assert_equal([n.phone_number for n in numbers], ["+1"])
+
+        numbers = self.run_coroutine(client.phone_numbers.list())
+        assert_equal([n.sid for n in numbers], ["PN1"])
+
+        number = self.run_coroutine(
+            client.phone_numbers.purchase(phone_number="+1"))
+        assert_equal(number.sid, "PN2")
+
+    def test_sandbox_update(self):
+        client = self.client((200, {"pin": "1234", "voice_url": "http://a"}))
+        sandbox = self.run_coroutine(
+            client.sandboxes.update(voice_url="http://a"))
+        assert_equal(sandbox.voice_url, "http://a")
+        method, url, kwargs = self.transport.requests[0]
+        assert_equal(method, "POST")
+        assert_true("VoiceUrl=http" in kwargs["body"])
+
+    def test_call_feedback(self):
+        client = self.client((200, {"sid": "CA1"}),
+                             (200, {"quality_score": 5}),
+                             (200, {"quality_score_average": 4.5}))
+        call = self.run_coroutine(client.calls.get("CA1"))
+        feedback = self.run_coroutine(call.feedback.get())
+        assert_equal(feedback.quality_score, 5)
+        summary = self.run_coroutine(client.calls.summary.get())
+        assert_equal(summary.quality_score_average, 4.5)
+
+    def test_pricing_countries(self):
+        from twilio.rest.aio import AsyncTwilioPricingClient
+
+        self.transport = FakeTransport(
+            (200, {"countries": [{"iso_country": "US"}]}),
+        )
+        client = AsyncTwilioPricingClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                          transport=self.transport)
+        countries = self.run_coroutine(client.voice.countries.list())
+        assert_equal([c.iso_country for c in countries], ["US"])
+
+    def test_workspace_statistics(self):
+        from twilio.rest.aio import AsyncTwilioTaskRouterClient
+
+        self.transport = FakeTransport((200, {"sid": "WS1"}),
+                                       (200, {"cumulative": {}}))
+        client = AsyncTwilioTaskRouterClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                             transport=self.transport)
+        workspace = self.run_coroutine(client.workspaces.get("WS1"))
+        statistics = self.run_coroutine(workspace.statistics.get())
+        assert_equal(statistics.cumulative, {})
+
+    def test_lookup(self):
+        self.transport = FakeTransport((200, {"phone_number": "+1"}))
+        client = AsyncTwilioLookupsClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                          transport=self.transport)
+        number = self.run_coroutine(client.phone_numbers.get("+1"))
+        assert_equal(number.phone_number, "+1")
+
+    def test_subresources(self):
+        client = self.client((200, {"sid": "AC123"}))
+        account = self.run_coroutine(client.accounts.get("AC123"))
+        assert_true(account.calls.client is client)
+        assert_true(type(account.calls) is
+                    client.resource_class(type(client.calls)))
+
+    @raises(TwilioRestException)
+    def test_error(self):
+        client = self.client((404, {"code": 20404, "message": "Not found"}))
+        self.run_coroutine(client.calls.get("CA123"))
+
+    def test_retry(self):
+        client = self.client((503, {}), (200, {"sid": "CA123"}))
+        call = self.run_coroutine(client.calls.get("CA123"))
+        assert_equal(call.sid, "CA123")
+        assert_equal(len(self.transport.requests), 2)
+
+    def test_sync_client_unaffected(self):
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+        async_client = self.client()
+        assert_true(type(client.calls) is not type(async_client.calls))
+        assert_true(isinstance(async_client.calls, type(client.calls)))
+
+    def test_warm_up(self):
+        class HeadTransport(AsyncTransport):
+            requests = []
+
+            async def request(self, method, url, **kwargs):
+                self.requests.append((method, url))
+                if len(self.requests) == 3:
+                    raise IOError
+                return 200, {}, b''
+
+        transport = HeadTransport()
+        client = AsyncTwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       transport=transport)
+
+        assert_equal(self.run_coroutine(client.warm_up(3)), 2)
+        assert_equal(transport.requests,
+                     [("HEAD", "https://api.twilio.com")] * 3)
+
+    def test_single_flight(self):
+        class SlowTransport(AsyncTransport):
+            requests = 0
+
+            async def request(self, method, url, **kwargs):
+                SlowTransport.requests += 1
+                await asyncio.sleep(0.01)
+                return 200, {}, b'{"sid": "QU1"}'
+
+        client = AsyncTwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       transport=SlowTransport())
+
+        async def fetch():
+            return await asyncio.gather(client.queues.get("QU1"),
+                                        client.queues.get("QU1"),
+                                        client.queues.get("QU2"))
+
+        queues = self.run_coroutine(fetch())
+        assert_equal([q.sid for q in queues], ["QU1", "QU1", "QU1"])
+        assert_equal(SlowTransport.requests, 2)
+        assert_equal(client.single_flight.stats()["shared"], 1)
+
+    @raises(TwilioException)
+    def test_create_many(self):
+        self.client().messages.create_many([])
+
+    def test_pool_size(self):
+        with patch('twilio.rest.resources.aio.aiohttp'):
+            client = AsyncTwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                           pool_size=5)
+        assert_true(client.owns_transport)
+        assert_equal(client.transport.pool_size, 5)
+
+    @raises(TwilioException)
+    def test_aiohttp_missing(self):
+        with patch('twilio.rest.resources.aio.aiohttp', None):
+            AiohttpTransport()
@@ -184,7 +184,9 @@ class testInstanceResourceInit(unittest.TestCase):
         m = Mock()
         self.r.subresources = [m]
         self.r.load_subresources()
-        m.assert_called_with(self.r.uri, self.r.auth, self.r.timeout)
+        m.assert_called_with(self.r.uri, self.r.auth, self.r.timeout,
+                             client=self.r.client,
+                             transport=self.r.transport)
 
 
 class NextGenInstanceResourceTest(unittest.TestCase):
@@ -214,7 +216,7 @@ class testTimeoutPropagation(unittest.TestCase):
     def testPassThrough(self, mock_request):
         mock_response = Mock()
         mock_response.ok = True,
-        mock_response.content = json.dumps({'key': 'value'})
+        mock_response.raw = json.dumps({'key': 'value'}).encode('utf-8')
         mock_request.return_value = mock_response
 
         assert_equal(self.r.timeout, sentinel.timeout)
@@ -0,0 +1,232 @@
+import threading
+import time
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Response
+from twilio.rest.resources.bulk import (
+    BULK_DELETE_RETRY_POLICY,
+    BulkReport,
+    BulkResult,
+    call_with_retries,
+    map_ordered,
+)
+from twilio.rest.resources.retry import RetryPolicy
+
+
+class MapOrderedTest(unittest.TestCase):
+
+    def test_order(self):
+        def slow_square(n):
+            # Later items finish first
+            time.sleep((5 - n) * 0.002)
+            return n * n
+
+        results = list(map_ordered(slow_square, range(6), concurrency=3))
+        assert_equal([r.index for r in results], list(range(6)))
+        assert_equal([r.result for r in results], [0, 1, 4, 9, 16, 25])
+        assert_true(all(r.ok for r in results))
+
+    def test_errors(self):
+        def check(n):
+            if n % 2:
+                raise ValueError(n)
+            return n
+
+        results = list(map_ordered(check, range(4), concurrency=2))
+        assert_equal([r.ok for r in results], [True, False, True, False])
+        assert_equal(results[1].item, 1)
+        assert_true(isinstance(results[1].error, ValueError))
+        assert_equal(results[1].result, None)
+
+    def test_backpressure(self):
+        consumed = []
+
+        def items():
+            for n in range(100):
+                consumed.append(n)
+                yield n
+
+        results = map_ordered(lambda n: n, items(), concurrency=2)
+        next(results)
+        # The first result plus a window of four
+        assert_true(len(consumed) <= 5)
+        results.close()
+
+    def test_concurrency(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work(n):
+            with lock:
+                running.append(n)
+                peak.append(len(running))
+            time.sleep(0.005)
+            with lock:
+                running.remove(n)
+
+        list(map_ordered(work, range(12), concurrency=3))
+        assert_true(max(peak) <= 3)
+
+    def test_base_exception(self):
+        class Stop(BaseException):
+            pass
+
+        def stop(n):
+            if n == 1:
+                raise Stop()
+            return n
+
+        results = []
+
+        def consume():
+            try:
+                for result in map_ordered(stop, range(4), concurrency=2):
+                    results.append(result.result)
+            except Stop:
+                results.append("stopped")
+
+        # Consume on a thread, so that the test fails rather than hangs
+        consumer = threading.Thread(target=consume)
+        consumer.daemon = True
+        consumer.start()
+        consumer.join(5)
+        assert_equal(results, [0, "stopped"])
+
+    @raises(ValueError)
+    def test_bad_concurrency(self):
+        list(map_ordered(lambda n: n, [1], concurrency=0))
+
+    def test_repr(self):
+        assert_equal(repr(BulkResult(0, "a", result=1)), "<BulkResult 0: 1>")
+
+
+@patch("twilio.rest.resources.bulk.time.sleep")
+def test_call_with_retries(sleep):
+    policy = RetryPolicy(max_attempts=3, statuses=[429], methods=["POST"])
+    fn = Mock(side_effect=[TwilioRestException(429, "url", headers={}),
+                           "done"])
+    assert_equal(call_with_retries(policy, "POST", fn), "done")
+    assert_equal(sleep.call_count, 1)
+
+    fn = Mock(side_effect=TwilioRestException(400, "url", headers={}))
+    try:
+        call_with_retries(policy, "POST", fn)
+    except TwilioRestException as e:
+        assert_equal(e.status, 400)
+    assert_equal(fn.call_count, 1)
+
+
+class CreateManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+
+    @patch("twilio.rest.resources.bulk.time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_create_many(self, request, sleep):
+        def respond(method, uri, data=None, **kwargs):
+            if data["To"] == "+2" and not sleep.called:
+                raise TwilioRestException(429, uri, headers={})
+            if data["To"] == "+3":
+                raise TwilioRestException(400, uri, headers={})
+            body = '{"sid": "SM%s", "to": "%s"}' % (data["To"][1:],
+                                                    data["To"])
+            return Response(201, {}, body.encode('utf-8'), uri)
+        request.side_effect = respond
+
+        messages = [{"to": "+%d" % n, "from_": "+15017250604", "body": "Hi"}
+                    for n in range(1, 5)]
+        results = list(self.client.messages.create_many(messages,
+                                                        concurrency=2))
+
+        assert_equal([r.ok for r in results], [True, True, False, True])
+        assert_equal(results[1].result.sid, "SM2")
+        assert_equal(results[2].error.status, 400)
+        assert_equal(results[3].item, messages[3])
+        assert_equal(messages[0], {"to": "+1", "from_": "+15017250604",
+                                   "body": "Hi"})
+
+    @patch("time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_no_retry_server_error(self, request, sleep):
+        request.side_effect = TwilioRestException(503, "url", headers={})
+
+        messages = [{"to": "+1", "from_": "+15017250604", "body": "Hi"}]
+        results = list(self.client.messages.create_many(messages))
+
+        # The message may have been sent before the API failed
+        assert_equal(results[0].error.status, 503)
+        assert_equal(request.call_count, 1)
+
+
+class DeleteManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+
+    @patch("twilio.rest.resources.bulk.time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_delete_many(self, request, sleep):
+        def respond(method, uri, **kwargs):
+            if uri.endswith("/RE2") and not sleep.called:
+                raise TwilioRestException(429, uri, headers={})
+            if uri.endswith("/RE3"):
+                raise TwilioRestException(404, uri, headers={})
+            return Response(204, {}, b'', uri)
+        request.side_effect = respond
+
+        recordings = self.client.recordings
+        items = ["RE1", recordings.load_instance({"sid": "RE2"}), "RE3"]
+        report = BulkReport(recordings.delete_many(items, concurrency=2))
+
+        assert_equal(report.succeeded, ["RE1", "RE2"])
+        assert_equal([r.item for r in report.failed], ["RE3"])
+        assert_equal(report.failed[0].error.status, 404)
+        assert_equal(repr(report), "<BulkReport: 2 succeeded, 1 failed>")
+        assert_equal(set(c[0][0] for c in request.call_args_list),
+                     set(["DELETE"]))
+
+    @patch("time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_no_stacked_retries(self, request, sleep):
+        request.side_effect = TwilioRestException(429, "url", headers={})
+
+        results = list(self.client.recordings.delete_many(["RE1"]))
+
+        assert_equal(results[0].error.status, 429)
+        # The client's own policy would retry each DELETE on a 429 too
+        max_attempts = BULK_DELETE_RETRY_POLICY.max_attempts
+        assert_equal(request.call_count, max_attempts)
+        assert_equal(sleep.call_count, max_attempts - 1)
+
+    @patch("twilio.rest.resources.bulk.time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_retry_server_error(self, request, sleep):
+        def respond(method, uri, **kwargs):
+            if uri.endswith("/RE2") and not sleep.called:
+                raise TwilioRestException(503, uri, headers={})
+            return Response(204, {}, b'', uri)
+        request.side_effect = respond
+
+        report = BulkReport(self.client.recordings.delete_many(["RE1",
+                                                                "RE2"]))
+
+        assert_equal(report.succeeded, ["RE1", "RE2"])
+        assert_equal(report.failed, [])
+        assert_equal(sleep.call_count, 1)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_redact_many(self, request):
+        request.return_value = Response(200, {}, b'{"sid": "SM1", '
+                                        b'"body": ""}', "url")
+
+        results = list(self.client.messages.redact_many(["SM1"]))
+        assert_equal(results[0].result.body, "")
+        assert_equal(request.call_args[1]["data"], {"Body": ""})
+        assert_true(request.call_args[0][1].endswith("/Messages/SM1"))
@@ -17,6 +17,7 @@ class CallFeedbackTest(unittest.TestCase):
 
         mock = Mock()
         mock.uri = '/base'
+        mock.client = None
         call = Call(mock, 'CA123')
         call.load_subresources()
         feedback = call.feedback.get()
@@ -32,6 +33,8 @@ class CallFeedbackTest(unittest.TestCase):
         mock = Mock()
         mock.uri = '/base'
         mock.auth = AUTH
+        mock.client = None
+        mock.transport = None
         call = Call(mock, 'CA123')
         call.load_subresources()
         feedback = call.feedback.create(
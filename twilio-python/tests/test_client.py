@@ -22,7 +22,8 @@ class RestClientTest(unittest.TestCase):
         mock.assert_called_with("GET", "https://api.twilio.com/2010-04-01",
                                 headers={"User-Agent": ANY,
                                          'Accept-Charset': 'utf-8'},
-                                params={}, auth=AUTH, data=None)
+                                params={}, auth=AUTH, data=None,
+                                transport=self.client.transport)
         called_kwargs = mock.mock_calls[0][2]
         self.assertTrue(
             'twilio-python' in called_kwargs['headers']['User-Agent']
@@ -40,7 +41,7 @@ class RestClientTest(unittest.TestCase):
     def test_conferences(self, mock):
         mock.return_value = Mock()
         mock.return_value.ok = True
-        mock.return_value.content = '{"conferences": []}'
+        mock.return_value.raw = b'{"conferences": []}'
         self.client.conferences.list()
 
     @patch("twilio.rest.resources.base.make_twilio_request")
@@ -51,7 +52,8 @@ class RestClientTest(unittest.TestCase):
         uri = "https://api.twilio.com/2010-04-01/Accounts/ACCOUNT_SID" \
               "/Queues/QU123/Members"
         mock.assert_called_with("GET", uri, params={}, auth=AUTH,
-                                use_json_extension=True)
+                                use_json_extension=True,
+                                transport=self.client.transport)
 
     @patch("twilio.rest.resources.base.make_request")
     def test_workflows(self, request):
@@ -64,7 +66,33 @@ class RestClientTest(unittest.TestCase):
         assert_true(workflows[0].sid is not None)
         uri = "https://taskrouter.twilio.com/v1/Workspaces/WS123/Workflows"
         request.assert_called_with("GET", uri, headers=ANY, params={},
-                                   auth=AUTH)
+                                   auth=AUTH,
+                                   transport=self.task_router_client.transport)
+
+
+class ClientOptionsTest(unittest.TestCase):
+
+    def test_options_by_keyword(self):
+        from twilio.rest import (
+            TwilioIpMessagingClient, TwilioLookupsClient,
+            TwilioPricingClient, TwilioTrunkingClient,
+        )
+        from twilio.rest.monitor import TwilioMonitorClient
+        from twilio.rest.resources import RetryPolicy, SingleFlight
+
+        policy = RetryPolicy(max_attempts=1)
+        flight = SingleFlight()
+        for cls in (TwilioRestClient, TwilioIpMessagingClient,
+                    TwilioLookupsClient, TwilioMonitorClient,
+                    TwilioPricingClient, TwilioTaskRouterClient,
+                    TwilioTrunkingClient):
+            client = cls("ACCOUNT_SID", "AUTH_TOKEN", timeout=5,
+                         single_flight=flight, retry_policy=policy,
+                         preemptive_auth=True)
+            assert_true(client.retry_policy is policy)
+            assert_true(client.single_flight is flight)
+            assert_equal(client.timeout, 5)
+            assert_true(client.auth_header is not None)
 
 
 class RestClientTimeoutTest(unittest.TestCase):
@@ -79,15 +107,53 @@ class RestClientTimeoutTest(unittest.TestCase):
         self.client.members("QU123").list()
         mock_request.assert_called_with("GET", ANY, params=ANY, auth=AUTH,
                                         timeout=sentinel.timeout,
-                                        use_json_extension=True)
+                                        use_json_extension=True,
+                                        transport=self.client.transport)
 
     @patch("twilio.rest.resources.base.make_twilio_request")
     def test_arbitrary_member(self, mock_request):
         mock_response = Mock()
         mock_response.ok = True
-        mock_response.content = json.dumps({"short_codes": []})
+        mock_response.raw = json.dumps({"short_codes": []}).encode('utf-8')
         mock_request.return_value = mock_response
         assert_equal([], self.client.sms.short_codes.list())
         mock_request.assert_called_once_with("GET", ANY, params=ANY, auth=AUTH,
                                              timeout=sentinel.timeout,
-                                             use_json_extension=True)
+                                             use_json_extension=True,
+                                             transport=self.client.transport)
+
+
+class RestClientPreemptiveAuthTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       preemptive_auth=True)
+        self.header = "Basic QUNDT1VOVF9TSUQ6QVVUSF9UT0tFTg=="
+
+    def test_auth_header(self):
+        assert_equal(self.client.auth_header, self.header)
+
+    def test_no_auth_header_by_default(self):
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+        assert_true(client.auth_header is None)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_resource_request(self, mock_request):
+        resp = create_mock_json("tests/resources/members_list.json")
+        mock_request.return_value = resp
+        self.client.members("QU123").list()
+        mock_request.assert_called_with("GET", ANY, params=ANY, auth=None,
+                                        headers={
+                                            "Authorization": self.header,
+                                        },
+                                        use_json_extension=True,
+                                        transport=self.client.transport)
+
+    @patch("twilio.rest.base.make_request")
+    def test_request(self, mock):
+        self.client.request("2010-04-01", method="GET")
+        mock.assert_called_with("GET", "https://api.twilio.com/2010-04-01",
+                                headers={"User-Agent": ANY,
+                                         "Accept-Charset": "utf-8",
+                                         "Authorization": self.header},
+                                params={}, auth=None, data=None,
+                                transport=self.client.transport)
@@ -0,0 +1,151 @@
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import Response
+from twilio.rest.resources.conditional import ConditionalCache, copy_body
+
+BASE_URI = "https://api.twilio.com/2010-04-01/Accounts/ACCOUNT_SID"
+
+
+class ConditionalCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ConditionalCache(max_entries=2)
+
+    def test_key(self):
+        assert_equal(self.cache.key("/Calls"), "/Calls")
+        assert_equal(self.cache.key("/Calls", {"To": "+1", "From": "+2"}),
+                     "/Calls?From=%2B2&To=%2B1")
+
+    def test_remember(self):
+        resp = Response(200, {"etag": '"abc"'}, b'', "url")
+        body = {"sid": "CA1"}
+        assert_true(self.cache.update("a", None, resp, body) is body)
+
+        cached = self.cache.get("a")
+        assert_equal(cached.headers(), {"If-None-Match": '"abc"'})
+        body["sid"] = "changed"
+        assert_equal(cached.body, {"sid": "CA1"})
+
+    def test_not_modified(self):
+        self.cache.update("a", None, Response(
+            200, {"last-modified": "Mon, 01 Jun 2015 00:00:00 GMT"}, b'',
+            "url"), {"sid": "CA1"})
+        cached = self.cache.get("a")
+
+        body = self.cache.update("a", cached, Response(304, {}, b'', "url"),
+                                 {})
+        assert_equal(body, {"sid": "CA1"})
+        assert_true(body is not cached.body)
+        assert_equal(self.cache.stats(),
+                     {"hits": 1, "misses": 1, "entries": 1, "bytes": 0})
+
+    def test_no_validators(self):
+        self.cache.update("a", None, Response(200, {"etag": "1"}, b'', "u"),
+                          {})
+        self.cache.update("a", None, Response(200, {}, b'', "u"), {})
+        assert_equal(self.cache.get("a"), None)
+
+    def test_lru(self):
+        resp = Response(200, {"etag": "1"}, b'', "url")
+        self.cache.update("a", None, resp, {})
+        self.cache.update("b", None, resp, {})
+        self.cache.get("a")
+        self.cache.update("c", None, resp, {})
+
+        assert_true(self.cache.get("a") is not None)
+        assert_equal(self.cache.get("b"), None)
+
+        self.cache.clear()
+        assert_equal(self.cache.stats()["entries"], 0)
+
+    def test_max_bytes(self):
+        cache = ConditionalCache(max_bytes=10)
+        cache.update("a", None, Response(200, {"etag": "1"}, b'x' * 4, "u"),
+                     {})
+        cache.update("b", None, Response(200, {"etag": "1"}, b'x' * 4, "u"),
+                     {})
+        assert_equal(cache.stats()["bytes"], 8)
+
+        cache.update("c", None, Response(200, {"etag": "1"}, b'x' * 4, "u"),
+                     {})
+        assert_equal(cache.get("a"), None)
+        assert_equal(cache.stats()["entries"], 2)
+        assert_equal(cache.stats()["bytes"], 8)
+
+        # Too large to remember at all, and replaces the older response
+        cache.update("b", None, Response(200, {"etag": "2"}, b'x' * 11, "u"),
+                     {})
+        assert_equal(cache.get("b"), None)
+        assert_true(cache.get("c") is not None)
+        assert_equal(cache.stats()["bytes"], 4)
+
+        cache.clear()
+        assert_equal(cache.stats()["bytes"], 0)
+
+    def test_copy_body(self):
+        body = {"calls": [{"sid": "CA1"}], "meta": {"key": "calls"}}
+        copy = copy_body(body)
+        copy["calls"][0]["sid"] = "CA2"
+        copy["meta"]["key"] = "other"
+        assert_equal(body, {"calls": [{"sid": "CA1"}],
+                            "meta": {"key": "calls"}})
+
+
+class ConditionalRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_get(self, request):
+        request.side_effect = [
+            Response(200, {"etag": '"v1"'},
+                     b'{"sid": "PN1", "from": "+1", "uri": "/PN1"}', "url"),
+            Response(304, {}, b'', "url"),
+        ]
+
+        first = self.client.phone_numbers.get("PN1")
+        second = self.client.phone_numbers.get("PN1")
+
+        assert_equal(second.sid, "PN1")
+        assert_equal(second.from_, first.from_)
+        headers = request.call_args[1]["headers"]
+        assert_equal(headers["If-None-Match"], '"v1"')
+        assert_equal(self.client.conditional_cache.stats()["hits"], 1)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_list(self, request):
+        modified = "Mon, 01 Jun 2015 00:00:00 GMT"
+        request.side_effect = [
+            Response(200, {"last-modified": modified},
+                     b'{"queues": [{"sid": "QU1"}]}', "url"),
+            Response(304, {}, b'', "url"),
+            Response(200, {}, b'{"queues": []}', "url"),
+        ]
+
+        self.client.queues.list(page_size=5)
+        queues = self.client.queues.list(page_size=5)
+        assert_equal([q.sid for q in queues], ["QU1"])
+        assert_equal(request.call_args[1]["headers"]["If-Modified-Since"],
+                     modified)
+
+        # Different parameters are a different page
+        self.client.queues.list(page_size=10)
+        assert_true("If-Modified-Since" not in
+                    request.call_args[1].get("headers", {}))
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_disabled(self, request):
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                  conditional_cache=ConditionalCache(0))
+        request.return_value = Response(200, {"etag": '"v1"'},
+                                        b'{"sid": "QU1"}', "url")
+
+        client.queues.get("QU1")
+        client.queues.get("QU1")
+        assert_true("If-None-Match" not in
+                    request.call_args[1].get("headers", {}))
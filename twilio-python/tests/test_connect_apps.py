@@ -16,7 +16,7 @@ class ConnectAppTest(unittest.TestCase):
     @patch("twilio.rest.resources.base.make_twilio_request")
     def test_get(self, mock):
         mock.return_value = Mock()
-        mock.return_value.content = '{"sid": "SID"}'
+        mock.return_value.raw = b'{"sid": "SID"}'
 
         self.resource.get("SID")
         mock.assert_called_with("GET", "/base/ConnectApps/SID",
@@ -25,7 +25,7 @@ class ConnectAppTest(unittest.TestCase):
     @patch("twilio.rest.resources.base.make_twilio_request")
     def test_list_with_paging(self, mock):
         mock.return_value = Mock()
-        mock.return_value.content = '{"connect_apps": []}'
+        mock.return_value.raw = b'{"connect_apps": []}'
 
         self.resource.list(page=1, page_size=50)
         mock.assert_called_with("GET", "/base/ConnectApps",
@@ -36,7 +36,7 @@ class ConnectAppTest(unittest.TestCase):
     @patch("twilio.rest.resources.base.make_twilio_request")
     def test_list(self, mock):
         mock.return_value = Mock()
-        mock.return_value.content = '{"connect_apps": []}'
+        mock.return_value.raw = b'{"connect_apps": []}'
 
         self.resource.list()
         mock.assert_called_with("GET", "/base/ConnectApps",
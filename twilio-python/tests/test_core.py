@@ -9,6 +9,7 @@ from twilio.rest.resources import convert_keys
 from twilio.rest.resources import convert_case
 from twilio.rest.resources import convert_boolean
 from twilio.rest.resources import normalize_dates
+from twilio.rest.resources import basic_auth_header
 
 
 def test_date():
@@ -100,3 +101,7 @@ def test_convert_keys():
     }
 
     assert_equal(ed, convert_keys(d))
+
+
+def test_basic_auth_header():
+    assert_equal(basic_auth_header("user", "pass"), "Basic dXNlcjpwYXNz")
@@ -0,0 +1,94 @@
+import socket
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest.resources import dns_cache
+from twilio.rest.resources.dns_cache import (
+    DnsCache,
+    disable_dns_cache,
+    enable_dns_cache,
+    get_dns_cache,
+)
+
+ADDRESSES = [(socket.AF_INET, socket.SOCK_STREAM, 6, '',
+              ('54.172.60.1', 443))]
+
+
+class DnsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.resolver = Mock(return_value=ADDRESSES)
+        self.cache = DnsCache(ttl=60, resolver=self.resolver)
+
+    def test_covers(self):
+        assert_true(self.cache.covers("twilio.com"))
+        assert_true(self.cache.covers("api.twilio.com"))
+        assert_true(self.cache.covers("API.Twilio.com."))
+        assert_true(not self.cache.covers("eviltwilio.com"))
+        assert_true(not self.cache.covers("example.com"))
+        assert_true(not self.cache.covers(None))
+
+    @patch("twilio.rest.resources.dns_cache._clock")
+    def test_ttl(self, clock):
+        clock.return_value = 100
+        self.cache.getaddrinfo("api.twilio.com", 443)
+        clock.return_value = 159
+        addresses = self.cache.getaddrinfo("api.twilio.com", 443)
+        assert_equal(addresses, ADDRESSES)
+        assert_equal(self.resolver.call_count, 1)
+
+        clock.return_value = 160
+        self.cache.getaddrinfo("api.twilio.com", 443)
+        assert_equal(self.resolver.call_count, 2)
+        assert_equal(self.cache.stats(),
+                     {"hits": 1, "misses": 2, "entries": 1})
+
+    def test_key(self):
+        self.cache.getaddrinfo("api.twilio.com", 443)
+        self.cache.getaddrinfo("api.twilio.com", 443, socket.AF_INET)
+        self.cache.getaddrinfo("lookups.twilio.com", 443)
+        assert_equal(self.resolver.call_count, 3)
+
+        self.cache.clear()
+        assert_equal(self.cache.stats()["entries"], 0)
+
+
+class EnableDnsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.resolver = Mock(return_value=ADDRESSES)
+        self.patcher = patch.object(socket, "getaddrinfo", self.resolver)
+        self.patcher.start()
+
+    def tearDown(self):
+        disable_dns_cache()
+        self.patcher.stop()
+
+    def test_enable(self):
+        cache = enable_dns_cache(ttl=30)
+        assert_true(get_dns_cache() is cache)
+        assert_equal(cache.ttl, 30)
+
+        socket.getaddrinfo("api.twilio.com", 443, 0, socket.SOCK_STREAM)
+        socket.getaddrinfo("api.twilio.com", 443, 0, socket.SOCK_STREAM)
+        socket.getaddrinfo("example.com", 443)
+        socket.getaddrinfo("example.com", 443)
+
+        assert_equal(self.resolver.call_count, 3)
+        assert_equal(cache.stats()["hits"], 1)
+
+    def test_enable_twice(self):
+        enable_dns_cache()
+        enable_dns_cache()
+        disable_dns_cache()
+        assert_true(socket.getaddrinfo is self.resolver)
+        assert_equal(get_dns_cache(), None)
+
+    def test_disabled_passthrough(self):
+        enable_dns_cache()
+        dns_cache._cache = None
+        socket.getaddrinfo("api.twilio.com", 443)
+        socket.getaddrinfo("api.twilio.com", 443)
+        assert_equal(self.resolver.call_count, 2)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest.resources import Calls
+from twilio.rest.resources.base import StreamedResponse
+from twilio.rest.resources.export import ExportWriter, numbered_path
+
+AUTH = ("AC123", "token")
+
+CALLS = [
+    {"sid": "CA1", "to": "+1", "price": None, "subresource_uris": {"a": "/"}},
+    {"sid": "CA2", "to": u"+2 é", "price": "-0.02",
+     "subresource_uris": {}},
+]
+
+
+def read(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+class ExportWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_jsonl(self):
+        with ExportWriter(self.path("calls.jsonl")) as writer:
+            for call in CALLS:
+                writer.write(call)
+
+        lines = read(self.path("calls.jsonl")).splitlines()
+        assert_equal([json.loads(line) for line in lines], CALLS)
+        assert_equal(writer.records, 2)
+
+    def test_jsonl_fields(self):
+        with ExportWriter(self.path("calls.jsonl"),
+                          fields=["sid", "to"]) as writer:
+            writer.write(CALLS[0])
+
+        assert_equal(json.loads(read(self.path("calls.jsonl"))),
+                     {"sid": "CA1", "to": "+1"})
+
+    def test_csv(self):
+        with ExportWriter(self.path("calls.csv.gz"), format="csv") as writer:
+            for call in CALLS:
+                writer.write(call)
+
+        assert_equal(read(self.path("calls.csv.gz")).splitlines(), [
+            "price,sid,subresource_uris,to",
+            ',CA1,"{""a"": ""/""}",+1',
+            u"-0.02,CA2,{},+2 é",
+        ])
+
+    def test_rotation(self):
+        writer = ExportWriter(self.path("calls.csv"), format="csv",
+                              fields=["sid"], max_bytes=12)
+        for n in range(5):
+            writer.write({"sid": "CA%d" % n})
+        writer.close()
+
+        # Each file holds the header and two sids
+        assert_equal([os.path.basename(p) for p in writer.paths],
+                     ["calls-0001.csv", "calls-0002.csv", "calls-0003.csv"])
+        assert_equal(read(writer.paths[2]), "sid\nCA4\n")
+
+    def test_empty(self):
+        ExportWriter(self.path("calls.jsonl")).close()
+        assert_equal(read(self.path("calls.jsonl")), "")
+
+    def test_numbered_path(self):
+        assert_equal(numbered_path("out/calls.jsonl.gz", 2),
+                     os.path.join("out", "calls-0002.jsonl.gz"))
+
+    @raises(ValueError)
+    def test_bad_format(self):
+        ExportWriter(self.path("calls.xml"), format="xml")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_export(self, request):
+        pages = [
+            {"calls": CALLS[:1],
+             "next_page_uri": "/Calls.json?Page=1&PageToken=PA2"},
+            {"calls": CALLS[1:], "next_page_uri": None},
+        ]
+        request.side_effect = [
+            StreamedResponse(200, {}, iter([json.dumps(p).encode("utf-8")]),
+                             "url")
+            for p in pages
+        ]
+
+        calls = Calls("https://api.twilio.com", AUTH)
+        paths = calls.export(self.path("calls.jsonl"), status="completed")
+
+        assert_equal(paths, [self.path("calls.jsonl")])
+        lines = read(paths[0]).splitlines()
+        assert_equal([json.loads(line) for line in lines], CALLS)
+        assert_true(request.call_args[1]["stream"])
+        assert_equal(request.call_args[1]["params"]["Status"], "completed")
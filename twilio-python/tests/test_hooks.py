@@ -0,0 +1,142 @@
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Calls, Hooks, Response
+from twilio.rest.resources.hooks import uri_template
+
+SID = "CA7d1ed2fc9b2e1cf71e2c3ee5b9ab1d08"
+
+
+def test_uri_template():
+    assert_equal(
+        uri_template("https://api.twilio.com/2010-04-01/Accounts/"
+                     "AC7d1ed2fc9b2e1cf71e2c3ee5b9ab1d08/Calls/%s?Page=2"
+                     % SID),
+        "https://api.twilio.com/2010-04-01/Accounts/{sid}/Calls/{sid}")
+    assert_equal(
+        uri_template("https://lookups.twilio.com/v1/PhoneNumbers/"
+                     "+15108675309"),
+        "https://lookups.twilio.com/v1/PhoneNumbers/{phone_number}")
+    assert_equal(uri_template("https://api.twilio.com/Calls/CA123"),
+                 "https://api.twilio.com/Calls/CA123")
+
+
+class HooksTest(unittest.TestCase):
+
+    def test_register(self):
+        hooks = Hooks()
+        assert_true(not hooks)
+        callback = Mock()
+        hooks.register('on_error', callback)
+        assert_true(hooks)
+        hooks.fire('on_error', "info")
+        callback.assert_called_once_with("info")
+
+    def test_decorator(self):
+        hooks = Hooks()
+        seen = []
+
+        @hooks.register('before_request')
+        def record(info):
+            seen.append(info)
+
+        hooks.fire('before_request', 1)
+        hooks.unregister('before_request', record)
+        hooks.fire('before_request', 2)
+        assert_equal(seen, [1])
+
+    @raises(ValueError)
+    def test_unknown_event(self):
+        Hooks().register('after_request', Mock())
+
+    def test_broken_hook(self):
+        hooks = Hooks()
+        hooks.register('after_response', Mock(side_effect=KeyError))
+        callback = hooks.register('after_response', Mock())
+        hooks.fire('after_response', "info")
+        callback.assert_called_once_with("info")
+
+
+class ResourceHooksTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+        self.events = []
+        for event in ('before_request', 'after_response', 'on_error',
+                      'on_retry'):
+            self.client.hooks.register(event, self.recorder(event))
+
+    def recorder(self, event):
+        def record(info):
+            self.events.append((event, info.attempt, info.status))
+            self.info = info
+        return record
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_success(self, request):
+        request.return_value = Response(201, {}, b'{"sid": "CA1"}', "url")
+
+        self.client.calls.create(to="+1", from_="+2", url="http://a")
+
+        assert_equal(self.events, [('before_request', 1, None),
+                                   ('after_response', 1, 201)])
+        info = self.info
+        assert_equal(info.method, "POST")
+        assert_true(info.resource is Calls)
+        assert_equal(info.uri_template,
+                     "https://api.twilio.com/2010-04-01/Accounts/"
+                     "ACCOUNT_SID/Calls")
+        assert_equal(info.bytes_out,
+                     len("To=%2B1&From=%2B2&Url=http%3A%2F%2Fa"))
+        assert_equal(info.bytes_in, 14)
+        for phase in ('rate_limit', 'retry', 'request', 'parse', 'total'):
+            assert_true(info.timings[phase] >= 0)
+
+    @patch("twilio.rest.resources.base.time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_retry_then_error(self, request, sleep):
+        request.side_effect = TwilioRestException(503, "url", headers={})
+
+        try:
+            self.client.calls.get(SID)
+        except TwilioRestException:
+            pass
+
+        assert_equal(self.events, [
+            ('before_request', 1, None),
+            ('on_retry', 1, 503),
+            ('before_request', 2, None),
+            ('on_retry', 2, 503),
+            ('before_request', 3, None),
+            ('on_error', 3, 503),
+        ])
+        assert_true(isinstance(self.info.error, TwilioRestException))
+        assert_equal(self.info.timings['retry'],
+                     sum(c[0][0] for c in sleep.call_args_list))
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_transport_error(self, request):
+        request.side_effect = IOError
+
+        try:
+            self.client.calls.get(SID)
+        except IOError:
+            pass
+
+        assert_equal(self.events, [('before_request', 1, None),
+                                   ('on_error', 1, None)])
+
+    @patch("twilio.rest.base.make_request")
+    def test_deprecated_request(self, request):
+        request.return_value = Response(200, {}, b'<Response/>', "url")
+
+        self.client.request("/2010-04-01/Accounts", method="GET")
+
+        assert_equal(self.events, [('before_request', 1, None),
+                                   ('after_response', 1, 200)])
+        assert_true(self.info.resource is None)
+        assert_equal(self.info.bytes_in, 11)
@@ -0,0 +1,103 @@
+import json
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio import jwt
+from twilio.json_codec import JsonCodec, get_json_codec, set_json_codec
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import Calls
+from twilio.rest.resources.base import Response
+from twilio.task_router.workflow_config import WorkflowConfig
+
+AUTH = ("AC123", "token")
+
+
+class RecordingCodec(JsonCodec):
+
+    def __init__(self):
+        self.loaded = []
+        self.dumped = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super(RecordingCodec, self).loads(data)
+
+    def dumps(self, obj, **kwargs):
+        self.dumped.append(obj)
+        return super(RecordingCodec, self).dumps(obj, **kwargs)
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    def tearDown(self):
+        set_json_codec(None)
+
+    def test_loads_bytes_and_text(self):
+        codec = JsonCodec()
+        assert_equal(codec.loads(b'{"to": "+1\xc3\xa9"}'), {"to": u"+1\xe9"})
+        assert_equal(codec.loads(u'[1, 2]'), [1, 2])
+
+    def test_set_json_codec(self):
+        codec = RecordingCodec()
+        set_json_codec(codec)
+        assert_true(get_json_codec() is codec)
+        set_json_codec(None)
+        assert_true(type(get_json_codec()) is JsonCodec)
+
+    def test_jwt(self):
+        codec = RecordingCodec()
+        set_json_codec(codec)
+        token = jwt.encode({"iss": "AC123"}, "secret")
+        assert_equal(codec.dumped[1], {"iss": "AC123"})
+        assert_equal(jwt.decode(token, "secret"), {"iss": "AC123"})
+        assert_equal(len(codec.loaded), 2)
+
+    def test_workflow_config(self):
+        codec = RecordingCodec()
+        set_json_codec(codec)
+        config = WorkflowConfig([], None)
+        assert_equal(json.loads(config.to_json())["task_routing"],
+                     {"default_filter": None, "filters": []})
+        assert_equal(len(codec.dumped), 1)
+
+
+def test_response_content():
+    resp = Response(200, {}, b'{"body": "\xc3\xa9"}', "url")
+    assert_equal(resp.content, u'{"body": "\xe9"}')
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_client_codec(request):
+    request.return_value = Response(200, {}, b'{"sid": "CA123"}', "url")
+    codec = RecordingCodec()
+    client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN", json_codec=codec)
+
+    call = client.calls.get("CA123")
+
+    assert_equal(call.sid, "CA123")
+    assert_equal(codec.loaded, [b'{"sid": "CA123"}'])
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_get_raw(request):
+    request.return_value = Response(200, {}, b'{"sid": "CA123"}', "url")
+    calls = Calls("https://api.twilio.com", AUTH)
+
+    resp = calls.get_raw("CA123")
+
+    assert_equal(resp.raw, b'{"sid": "CA123"}')
+    request.assert_called_with("GET", "https://api.twilio.com/Calls/CA123",
+                               auth=AUTH, use_json_extension=True)
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_list_raw(request):
+    request.return_value = resp = Mock(raw=b'{"calls": []}')
+    calls = Calls("https://api.twilio.com", AUTH)
+
+    assert_true(calls.list_raw(status="completed", page_size=5) is resp)
+    request.assert_called_with("GET", "https://api.twilio.com/Calls",
+                               auth=AUTH, use_json_extension=True,
+                               params={"Status": "completed", "PageSize": 5})
@@ -12,6 +12,7 @@ from twilio.rest.exceptions import TwilioRestException
 from twilio.rest.resources.base import make_request, make_twilio_request
 from twilio.rest.resources.connection import Connection
 from twilio.rest.resources.connection import PROXY_TYPE_SOCKS5
+from twilio.rest.resources.transport import Httplib2Transport
 
 get_headers = {
     "User-Agent": "twilio-python/{version} (Python {python_version})".format(
@@ -20,6 +21,7 @@ get_headers = {
     ),
     "Accept-Charset": "utf-8",
     "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
 }
 
 post_headers = get_headers.copy()
@@ -32,7 +34,8 @@ def test_get_params(http_mock, response_mock):
     http = Mock()
     http.request.return_value = (Mock(), Mock())
     http_mock.return_value = http
-    make_request("GET", "http://httpbin.org/get", params={"hey": "you"})
+    make_request("GET", "http://httpbin.org/get", params={"hey": "you"},
+                 transport=Httplib2Transport())
     http.request.assert_called_with("http://httpbin.org/get?hey=you", "GET",
                                     body=None, headers=None)
 
@@ -43,7 +46,8 @@ def test_get_extra_params(http_mock, response_mock):
     http = Mock()
     http.request.return_value = (Mock(), Mock())
     http_mock.return_value = http
-    make_request("GET", "http://httpbin.org/get?foo=bar", params={"hey": "you"})
+    make_request("GET", "http://httpbin.org/get?foo=bar", params={"hey": "you"},
+                 transport=Httplib2Transport())
     http.request.assert_called_with("http://httpbin.org/get?foo=bar&hey=you", "GET",
                                     body=None, headers=None)
 
@@ -54,7 +58,8 @@ def test_resp_uri(http_mock, response_mock):
     http = Mock()
     http.request.return_value = (Mock(), Mock())
     http_mock.return_value = http
-    make_request("GET", "http://httpbin.org/get")
+    make_request("GET", "http://httpbin.org/get",
+                 transport=Httplib2Transport())
     http.request.assert_called_with("http://httpbin.org/get", "GET",
                                     body=None, headers=None)
 
@@ -69,6 +74,7 @@ def test_sequence_data(http_mock, response_mock):
         "POST",
         "http://httpbin.org/post",
         data={"a_list": ["here", "is", "some", "stuff"]},
+        transport=Httplib2Transport(),
     )
     http.request.assert_called_with(
         "http://httpbin.org/post",
@@ -111,7 +117,8 @@ def test_proxy_info(http_mock, resp_mock):
         8080,
         proxy_type=PROXY_TYPE_SOCKS5,
     )
-    make_request("GET", "http://httpbin.org/get")
+    make_request("GET", "http://httpbin.org/get",
+                 transport=Httplib2Transport())
     http_mock.assert_called_with(timeout=None, ca_certs=ANY, proxy_info=ANY)
     http.request.assert_called_with("http://httpbin.org/get", "GET",
                                     body=None, headers=None)
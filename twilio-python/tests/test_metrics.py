@@ -0,0 +1,105 @@
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import MetricsRegistry, Response
+from twilio.rest.resources.metrics import Histogram, prometheus_text
+
+
+class HistogramTest(unittest.TestCase):
+
+    def test_observe(self):
+        histogram = Histogram([0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        assert_equal(histogram.snapshot(), {
+            "count": 4,
+            "sum": 3.65,
+            "buckets": [(0.1, 2), (1, 3), (float('inf'), 4)],
+        })
+
+
+class MetricsRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = MetricsRegistry(buckets=[1])
+        self.transport = Mock()
+        self.transport.pool_stats.return_value = {"in_use": 1, "idle": 2}
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       transport=self.transport,
+                                       metrics=self.metrics)
+
+    @patch("twilio.rest.resources.base.time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_snapshot(self, request, sleep):
+        request.side_effect = [
+            Response(201, {}, b'{"sid": "SM1"}', "url"),
+            TwilioRestException(503, "url", headers={}),
+            Response(200, {}, b'{"sid": "SM1"}', "url"),
+            IOError(),
+        ]
+
+        self.client.messages.create(to="+1", from_="+2", body="Hi")
+        self.client.messages.get("SM1")
+        try:
+            self.client.messages.get("SM1")
+        except IOError:
+            pass
+
+        snapshot = self.metrics.snapshot()
+        assert_equal(snapshot["pool"], {"in_use": 1, "idle": 2})
+
+        post = snapshot["endpoints"]["Messages"]["POST"]
+        assert_equal(post["requests"], 1)
+        assert_equal(post["statuses"], {201: 1})
+        assert_equal(post["bytes_in"], 14)
+        assert_true(post["bytes_out"] > 0)
+
+        get = snapshot["endpoints"]["Messages"]["GET"]
+        assert_equal(get["requests"], 2)
+        assert_equal(get["retries"], 1)
+        assert_equal(get["statuses"], {200: 1})
+        assert_equal(get["errors"], {IOError.__name__: 1})
+        assert_equal(get["latency"]["count"], 2)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_shared_between_clients(self, request):
+        request.return_value = Response(200, {}, b'{"sid": "CA1"}', "url")
+        other = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                 transport=self.transport,
+                                 metrics=self.metrics)
+
+        self.client.calls.get("CA1")
+        other.calls.get("CA1")
+
+        snapshot = self.metrics.snapshot()
+        assert_equal(snapshot["endpoints"]["Calls"]["GET"]["requests"], 2)
+        # The transport is only counted once
+        assert_equal(snapshot["pool"], {"in_use": 1, "idle": 2})
+
+        self.metrics.reset()
+        assert_equal(self.metrics.snapshot()["endpoints"], {})
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_prometheus_text(self, request):
+        request.return_value = Response(200, {}, b'{"sid": "CA1"}', "url")
+        self.client.calls.get("CA1")
+
+        text = prometheus_text(self.metrics)
+        lines = text.splitlines()
+
+        assert_true("# TYPE twilio_requests_total counter" in lines)
+        assert_true('twilio_requests_total{method="GET",resource="Calls"} 1'
+                    in lines)
+        assert_true('twilio_responses_total{method="GET",resource="Calls",'
+                    'status="200"} 1' in lines)
+        assert_true('twilio_request_duration_seconds_bucket{le="+Inf",'
+                    'method="GET",resource="Calls"} 1' in lines)
+        assert_true('twilio_request_duration_seconds_count{method="GET",'
+                    'resource="Calls"} 1' in lines)
+        assert_true('twilio_pool_connections{state="idle"} 2' in lines)
+        assert_true(text.endswith("\n"))
@@ -0,0 +1,118 @@
+import json
+import unittest
+from datetime import date, datetime
+
+from mock import patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest import TwilioRestClient, TwilioTaskRouterClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Mirror, Response
+
+
+def message(sid, to, day, hour=10):
+    return {"sid": sid, "to": to, "from": "+15550000000",
+            "date_sent": "Fri, %02d May 2015 %02d:00:00 +0000" % (day, hour),
+            "date_updated": "u1", "body": "Hi %s" % sid}
+
+
+def page(key, *items):
+    body = {key: list(items), "next_page_uri": None}
+    return Response(200, {}, json.dumps(body).encode("utf-8"), "url")
+
+
+class MirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+        self.mirror = Mirror()
+
+    def tearDown(self):
+        self.mirror.close()
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_messages(self, request):
+        request.side_effect = [
+            page("messages", message("SM2", "+1", 2), message("SM1", "+2", 1)),
+            page("messages", message("SM3", "+1", 3, hour=9),
+                 message("SM2", "+1", 2)),
+        ]
+        messages = self.client.messages
+
+        assert_equal(self.mirror.refresh(messages), 2)
+        assert_equal(self.mirror.refresh(messages), 1)
+        assert_equal(request.call_args[1]["params"],
+                     {"DateSent>": "2015-05-02"})
+
+        found = self.mirror.find(messages, to="+1")
+        assert_equal([m.sid for m in found], ["SM3", "SM2"])
+        assert_equal(found[0].body, "Hi SM3")
+        assert_equal(found[0].from_, "+15550000000")
+
+        assert_equal([m.sid for m in self.mirror.find(
+            messages, from_="+15550000000", after=date(2015, 5, 2),
+            before=date(2015, 5, 2))], ["SM2"])
+        assert_equal([m.sid for m in self.mirror.find(
+            messages, before=datetime(2015, 5, 2, 10))], ["SM1"])
+        assert_equal(len(self.mirror.find(messages, limit=1)), 1)
+        assert_equal(self.mirror.get(messages, "SM1").to, "+2")
+        assert_equal(self.mirror.get(messages, "SM9"), None)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_full_refresh(self, request):
+        request.side_effect = [
+            page("incoming_phone_numbers",
+                 {"sid": "PN1", "phone_number": "+1"},
+                 {"sid": "PN2", "phone_number": "+2"}),
+            page("incoming_phone_numbers",
+                 {"sid": "PN2", "phone_number": "+2", "friendly_name": "b"}),
+        ]
+        numbers = self.client.phone_numbers
+
+        self.mirror.refresh(numbers)
+        self.mirror.refresh(numbers)
+        assert_equal(self.mirror.get(numbers, "PN1"), None)
+        assert_equal(self.mirror.find(numbers, phone_number="+2")[0]
+                     .friendly_name, "b")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_failed_refresh(self, request):
+        request.side_effect = [
+            page("incoming_phone_numbers", {"sid": "PN1"}),
+            TwilioRestException(400, "url"),
+        ]
+        numbers = self.client.phone_numbers
+        self.mirror.refresh(numbers)
+
+        try:
+            self.mirror.refresh(numbers)
+        except TwilioRestException:
+            pass
+        assert_true(self.mirror.get(numbers, "PN1") is not None)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_workers(self, request):
+        request.return_value = Response(200, {}, json.dumps({
+            "meta": {"key": "workers", "next_page_url": None},
+            "workers": [{"sid": "WK1", "activity_name": "Idle",
+                         "date_created": "2015-05-01T10:00:00Z"}],
+        }).encode("utf-8"), "url")
+
+        client = TwilioTaskRouterClient("ACCOUNT_SID", "AUTH_TOKEN")
+        workers = client.workers("WS1")
+        self.mirror.refresh(workers)
+
+        assert_equal([w.sid for w in self.mirror.find(
+            workers, activity_name="Idle", after=date(2015, 5, 1))], ["WK1"])
+        # Another workspace's workers are kept apart
+        assert_equal(self.mirror.find(client.workers("WS2")), [])
+
+    @raises(TwilioException)
+    def test_not_indexed(self):
+        self.mirror.find(self.client.messages, body="Hi")
+
+    def test_extra_fields(self):
+        mirror = Mirror(fields={"messages": ("to", "from", "status")})
+        mirror.find(self.client.messages, status="sent")
+        mirror.close()
@@ -0,0 +1,109 @@
+import threading
+import time
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import Response
+from twilio.rest.resources.prefetch import read_ahead
+
+
+def response(body):
+    return Response(200, {}, body, "url")
+
+
+class ReadAheadTest(unittest.TestCase):
+
+    def test_order(self):
+        # A plain iterator, which unlike a generator has no close()
+        pages = read_ahead(iter([[1, 2], [3], [4, 5]]), 2)
+        assert_equal(list(pages), [[1, 2], [3], [4, 5]])
+
+    def test_depth(self):
+        fetched = []
+        fetching = threading.Semaphore(0)
+
+        def pages():
+            for n in range(10):
+                fetched.append(n)
+                fetching.release()
+                yield n
+
+        reader = read_ahead(pages(), 2)
+        assert_equal(next(reader), 0)
+        # With page 0 taken, pages 1 and 2 wait and the worker stops
+        for _ in range(3):
+            fetching.acquire()
+        time.sleep(0.1)
+        assert_equal(fetched, [0, 1, 2])
+
+        assert_equal(next(reader), 1)
+        fetching.acquire()
+        assert_equal(fetched, [0, 1, 2, 3])
+
+    def test_error(self):
+        def pages():
+            yield 1
+            raise ValueError("boom")
+
+        reader = read_ahead(pages(), 3)
+        assert_equal(next(reader), 1)
+        self.assertRaises(ValueError, next, reader)
+
+    def test_close(self):
+        closed = threading.Event()
+
+        def pages():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        reader = read_ahead(pages(), 1)
+        next(reader)
+        reader.close()
+        assert_true(closed.wait(1))
+
+
+class PrefetchIterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_iter(self, request):
+        request.side_effect = [
+            response(b'{"calls": [{"sid": "CA1"}, {"sid": "CA2"}], '
+                     b'"next_page_uri": "/Calls.json?Page=1&PageToken=PA2"}'),
+            response(b'{"calls": [{"sid": "CA3"}], "next_page_uri": null}'),
+        ]
+
+        calls = self.client.calls.iter(status="completed", prefetch=2)
+        assert_equal([c.sid for c in calls], ["CA1", "CA2", "CA3"])
+        assert_equal(request.call_args[1]["params"]["PageToken"], ["PA2"])
+        assert_equal(request.call_args[1]["params"]["Status"], "completed")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_next_gen(self, request):
+        from twilio.rest import TwilioTaskRouterClient
+
+        client = TwilioTaskRouterClient("ACCOUNT_SID", "AUTH_TOKEN")
+        request.side_effect = [
+            response(b'{"meta": {"key": "workers", "next_page_url": '
+                     b'"https://taskrouter.twilio.com/v1/next"}, '
+                     b'"workers": [{"sid": "WK1"}]}'),
+            response(b'{"meta": {"key": "workers", "next_page_url": null},'
+                     b' "workers": [{"sid": "WK2"}]}'),
+        ]
+
+        workers = client.workers("WS1").iter(prefetch=1)
+        assert_equal([w.sid for w in workers], ["WK1", "WK2"])
+        assert_equal(request.call_args[0][1],
+                     "https://taskrouter.twilio.com/v1/next")
+
+    @raises(ValueError)
+    def test_stream(self):
+        self.client.calls.iter(stream=True, prefetch=1)
@@ -0,0 +1,139 @@
+import threading
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import RateLimiter
+from twilio.rest.resources.rate_limit import TokenBucket
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.patcher = patch('twilio.rest.resources.rate_limit._clock',
+                             self.clock)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_burst(self):
+        bucket = TokenBucket(2, capacity=2)
+        assert_equal(bucket.reserve(), 0)
+        assert_equal(bucket.reserve(), 0)
+        assert_equal(bucket.reserve(), 0.5)
+        assert_equal(bucket.reserve(), 1.0)
+
+    def test_refill(self):
+        bucket = TokenBucket(1)
+        bucket.reserve()
+        assert_equal(bucket.reserve(), 1.0)
+        self.clock.now += 5
+        # The bucket never holds more than its capacity
+        assert_equal(bucket.reserve(), 0)
+        assert_equal(bucket.reserve(), 1.0)
+
+    @raises(ValueError)
+    def test_invalid_rate(self):
+        TokenBucket(0)
+
+    def test_thread_safe(self):
+        bucket = TokenBucket(10, capacity=10)
+        waits = []
+
+        def take():
+            for _ in range(50):
+                waits.append(bucket.reserve())
+
+        threads = [threading.Thread(target=take) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every reservation after the first 10 waits one more tenth of a
+        # second than the one before it
+        assert_equal(sorted(round(w, 6) for w in waits)[-1], 19.0)
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.patcher = patch('twilio.rest.resources.rate_limit._clock',
+                             self.clock)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_unlimited(self):
+        limiter = RateLimiter()
+        assert_equal(limiter.reserve("AC123", "Calls"), 0)
+
+    def test_resource_buckets(self):
+        limiter = RateLimiter(resource_rates={"Calls": 1})
+        assert_equal(limiter.reserve("AC123", "Calls"), 0)
+        assert_equal(limiter.reserve("AC123", "Calls"), 1.0)
+        assert_equal(limiter.reserve("AC123", "Messages"), 0)
+        assert_equal(limiter.reserve("AC456", "Calls"), 0)
+
+    def test_account_bucket(self):
+        limiter = RateLimiter(account_rate=1)
+        limiter.reserve("AC123", "Calls")
+        assert_equal(limiter.reserve("AC123", "Messages"), 1.0)
+
+    def test_from_buckets(self):
+        limiter = RateLimiter(from_rate=1)
+        assert_equal(limiter.reserve("AC123", "Messages", {"From": "+1"}), 0)
+        assert_equal(limiter.reserve("AC123", "Messages", {"From": "+1"}),
+                     1.0)
+        assert_equal(limiter.reserve("AC123", "Messages", {"From": "+2"}), 0)
+        assert_equal(limiter.reserve("AC123", "Messages"), 0)
+
+    def test_stats(self):
+        limiter = RateLimiter(account_rate=1)
+        for _ in range(3):
+            limiter.reserve("AC123", "Calls")
+        assert_equal(limiter.stats(), {
+            "requests": 3,
+            "delayed": 2,
+            "total_wait": 3.0,
+            "max_wait": 2.0,
+        })
+
+    @patch('twilio.rest.resources.rate_limit.time.sleep')
+    def test_acquire(self, sleep):
+        limiter = RateLimiter(account_rate=2)
+        assert_equal(limiter.acquire("AC123", "Calls"), 0)
+        assert_equal(limiter.acquire("AC123", "Calls"), 0)
+        assert_equal(limiter.acquire("AC123", "Calls"), 0.5)
+        sleep.assert_called_once_with(0.5)
+
+
+@patch('twilio.rest.resources.base.time.sleep')
+@patch('twilio.rest.resources.base.make_twilio_request')
+def test_client_rate_limit(request, sleep):
+    request.return_value = Mock(status_code=201, raw=b'{"sid": "SM1"}')
+    limiter = RateLimiter(resource_rates={"Messages": 1}, from_rate=1)
+    client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                              rate_limiter=limiter)
+
+    client.messages.create(to="+1", from_="+2", body="Hi")
+    assert_equal(sleep.call_count, 0)
+    client.messages.create(to="+1", from_="+3", body="Hi")
+    assert_equal(sleep.call_count, 1)
+    assert_true(0 < sleep.call_args[0][0] <= 1)
+    assert_equal(limiter.stats()["delayed"], 1)
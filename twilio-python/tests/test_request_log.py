@@ -0,0 +1,116 @@
+import logging
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Response
+from twilio.rest.resources.base import StreamedResponse
+from twilio.rest.resources.request_log import RequestLogger
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class RequestLoggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = RecordingHandler()
+        self.logger = logging.getLogger('twilio.test_request_log')
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.request_logger = RequestLogger(logger=self.logger)
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       request_logger=self.request_logger)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_response(self, request):
+        request.return_value = Response(200, {}, b'{"sid": "CA1"}', "url")
+        self.client.calls.get("CA1")
+
+        record, = self.handler.records
+        assert_equal(record.levelno, logging.DEBUG)
+        assert_equal(record.method, "GET")
+        assert_equal(record.url, "https://api.twilio.com/2010-04-01/Accounts/"
+                                 "ACCOUNT_SID/Calls/CA1")
+        assert_equal(record.status, 200)
+        assert_equal(record.resource, "Calls")
+        assert_equal(record.attempt, 1)
+        assert_true(record.duration >= 0)
+        assert_equal(record.body, '{"sid": "CA1"}')
+        assert_true(record.getMessage().startswith("GET https://"))
+
+    @patch("twilio.rest.resources.base.time.sleep")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_retry_and_error(self, request, sleep):
+        request.side_effect = [
+            TwilioRestException(503, "url", headers={}),
+            IOError(),
+        ]
+        try:
+            self.client.calls.get("CA1")
+        except IOError:
+            pass
+
+        retry, error = self.handler.records
+        assert_equal(retry.status, 503)
+        assert_true("retrying" in retry.getMessage())
+        assert_equal(error.status, None)
+        assert_true("IOError" in error.getMessage() or
+                    "OSError" in error.getMessage())
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_disabled(self, request):
+        self.logger.setLevel(logging.INFO)
+        resp = Mock()
+        request.return_value = resp
+        resp.status_code = 200
+        resp.raw = b'{"sid": "CA1"}'
+        self.request_logger.sample_body = Mock()
+
+        self.client.calls.get("CA1")
+
+        assert_equal(self.handler.records, [])
+        assert_equal(self.request_logger.sample_body.call_count, 0)
+
+    def test_sample_rate(self):
+        resp = Response(200, {}, b'{}', "url")
+        with patch("twilio.rest.resources.request_log.random.random") as r:
+            r.return_value = 0.5
+            assert_equal(RequestLogger(body_sample_rate=0.4)
+                         .sample_body(resp), None)
+            assert_equal(RequestLogger(body_sample_rate=0.6)
+                         .sample_body(resp), '{}')
+        assert_equal(RequestLogger(body_sample_rate=0).sample_body(resp),
+                     None)
+
+    def test_truncate_and_redact(self):
+        request_logger = RequestLogger(max_body_size=40)
+        body = b'{"sid": "SK1", "secret": "abc\\"def", "friendly_name": "x"}'
+        assert_equal(request_logger.sample_body(Response(200, {}, body, "u")),
+                     '{"sid": "SK1", "secret": "[REDACTED]", "fr...')
+
+        # A value cut off by the size limit is still hidden
+        body = b'{"sid": "SK1", "auth_token": "0123456789abcdef"}'
+        request_logger = RequestLogger(max_body_size=36)
+        assert_equal(request_logger.sample_body(Response(200, {}, body, "u")),
+                     '{"sid": "SK1", "auth_token": "[REDACTED]"...')
+
+    def test_stream_not_read(self):
+        chunks = Mock()
+        resp = StreamedResponse(200, {}, chunks, "url")
+        assert_equal(RequestLogger().sample_body(resp), None)
+        assert_equal(chunks.mock_calls, [])
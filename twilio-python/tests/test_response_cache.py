@@ -0,0 +1,140 @@
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import (
+    TwilioPricingClient, TwilioRestClient, TwilioTaskRouterClient,
+)
+from twilio.rest.resources import Applications, Response
+from twilio.rest.resources.pricing import VoiceCountries
+from twilio.rest.resources.response_cache import ResponseCache
+
+
+def response(body, status=200):
+    return Response(status, {}, body, "url")
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache(ttls={VoiceCountries: 60,
+                                         "Applications": 10})
+        self.client = TwilioPricingClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                          response_cache=self.cache)
+
+    def test_ttl(self):
+        countries = self.client.voice.countries
+        assert_equal(self.cache.ttl(countries), 60)
+        assert_equal(self.cache.ttl(self.client.voice.numbers), None)
+
+        cache = ResponseCache(default_ttl=5)
+        assert_equal(cache.ttl(countries), 5)
+        cache = ResponseCache(ttls={"NextGenListResource": 30})
+        assert_equal(cache.ttl(countries), 30)
+
+    @patch("twilio.rest.resources.response_cache._clock")
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_hit_and_expiry(self, request, clock):
+        request.return_value = response(
+            b'{"countries": [{"iso_country": "US", "country": "US"}]}')
+
+        clock.return_value = 100
+        first = self.client.voice.countries.list()
+        clock.return_value = 159
+        second = self.client.voice.countries.list()
+        assert_equal(request.call_count, 1)
+        assert_equal([c.iso_country for c in second],
+                     [c.iso_country for c in first])
+
+        clock.return_value = 160
+        self.client.voice.countries.list()
+        assert_equal(request.call_count, 2)
+        assert_equal(self.cache.stats(), {
+            "hits": 1, "misses": 2, "evictions": 0, "entries": 1,
+        })
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_uncached_resource(self, request):
+        request.return_value = response(b'{"number": "+15555555555"}')
+        self.client.voice.numbers.get("+15555555555")
+        self.client.voice.numbers.get("+15555555555")
+        assert_equal(request.call_count, 2)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_params_and_account(self, request):
+        request.return_value = response(b'{"iso_country": "US"}')
+        other = TwilioPricingClient("ACCOUNT_SID_2", "AUTH_TOKEN",
+                                    response_cache=self.cache)
+
+        self.client.voice.countries.get("US")
+        self.client.voice.countries.get("US")
+        other.voice.countries.get("US")
+        self.client.voice.countries.get("GB")
+        assert_equal(request.call_count, 3)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_not_modified_not_cached(self, request):
+        request.return_value = response(b'', status=304)
+        countries = self.client.voice.countries
+        countries.request("GET", countries.uri + "/US")
+        assert_equal(self.cache.stats()["entries"], 0)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_invalidate(self, request):
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                  response_cache=self.cache)
+        request.side_effect = [
+            response(b'{"sid": "AP1", "friendly_name": "a"}'),
+            response(b'{"applications": [{"sid": "AP1"}]}'),
+            response(b'{"sid": "AP2"}'),
+            response(b'{"sid": "AP1", "friendly_name": "b"}'),
+            response(b'{"sid": "AP1", "friendly_name": "b"}'),
+        ]
+
+        client.applications.get("AP1")
+        client.applications.list()
+        client.applications.get("AP2")
+        assert_equal(self.cache.stats()["entries"], 3)
+
+        client.applications.update("AP1", friendly_name="b")
+        # The instance and the list are gone, the other instance stays
+        assert_equal(self.cache.stats()["entries"], 1)
+        assert_equal(client.applications.get("AP1").friendly_name, "b")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_invalidate_next_gen_pages(self, request):
+        client = TwilioTaskRouterClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                        response_cache=self.cache)
+        self.cache.ttls["Workspaces"] = 60
+        request.side_effect = [
+            response(b'{"meta": {"key": "workspaces"}, '
+                     b'"workspaces": [{"sid": "WS1"}]}'),
+            response(b'{"sid": "WS2"}', status=201),
+            response(b'{"meta": {"key": "workspaces"}, '
+                     b'"workspaces": [{"sid": "WS1"}, {"sid": "WS2"}]}'),
+        ]
+
+        workspaces = client.workspaces
+        assert_equal([w.sid for w in workspaces.iter(page_size=50)],
+                     ["WS1"])
+        workspaces.create("Support")
+        assert_equal([w.sid for w in workspaces.iter(page_size=50)],
+                     ["WS1", "WS2"])
+        assert_equal(request.call_count, 3)
+
+    def test_lru(self):
+        cache = ResponseCache(default_ttl=60, max_entries=2)
+        applications = Applications("https://api.twilio.com/Accounts/AC1",
+                                    ("AC1", "token"))
+        for sid in ("AP1", "AP2", "AP1", "AP3"):
+            uri = "%s/%s" % (applications.uri, sid)
+            if cache.get(applications, uri, {}) is None:
+                cache.put(applications, uri, {}, response(b''), {})
+
+        stats = cache.stats()
+        assert_equal(stats["evictions"], 1)
+        assert_true(cache.get(applications, applications.uri + "/AP1", {})
+                    is not None)
+        assert_equal(cache.get(applications, applications.uri + "/AP2", {}),
+                     None)
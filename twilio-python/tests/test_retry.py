@@ -0,0 +1,111 @@
+import time
+import unittest
+from email.utils import formatdate
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import RetryPolicy
+from twilio.rest.resources.retry import IDEMPOTENT_METHODS, parse_retry_after
+
+
+def error(status, headers=None):
+    return TwilioRestException(status, "https://api.twilio.com",
+                               headers=headers or {})
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+    def test_retries_idempotent_methods(self):
+        assert_true(self.policy.get_retry_delay("GET", error(503), 1)
+                    is not None)
+        assert_true(self.policy.get_retry_delay("DELETE", error(429), 1)
+                    is not None)
+
+    def test_post_not_retried_by_default(self):
+        assert_equal(self.policy.get_retry_delay("POST", error(503), 1), None)
+
+    def test_post_allowed(self):
+        policy = RetryPolicy(methods=IDEMPOTENT_METHODS | set(['POST']))
+        assert_true(policy.get_retry_delay("POST", error(503), 1)
+                    is not None)
+
+    def test_status_not_retried(self):
+        assert_equal(self.policy.get_retry_delay("GET", error(404), 1), None)
+
+    def test_max_attempts(self):
+        assert_true(self.policy.get_retry_delay("GET", error(503), 2)
+                    is not None)
+        assert_equal(self.policy.get_retry_delay("GET", error(503), 3), None)
+
+    @patch('twilio.rest.resources.retry.random.uniform')
+    def test_backoff(self, uniform):
+        uniform.side_effect = lambda low, high: high
+        assert_equal(self.policy.get_backoff(1), 1)
+        assert_equal(self.policy.get_backoff(2), 2)
+        assert_equal(self.policy.get_backoff(5), 4)
+
+    def test_retry_after(self):
+        e = error(429, {"retry-after": "7"})
+        assert_equal(self.policy.get_retry_delay("GET", e, 1), 7)
+
+    def test_retry_after_too_long(self):
+        e = error(503, {"retry-after": "3600"})
+        assert_equal(self.policy.get_retry_delay("GET", e, 1), None)
+
+    def test_parse_retry_after_date(self):
+        value = formatdate(time.time() + 30, usegmt=True)
+        delay = parse_retry_after({"retry-after": value})
+        assert_true(25 < delay <= 30)
+
+    def test_parse_retry_after_invalid(self):
+        assert_equal(parse_retry_after({"retry-after": "soon"}), None)
+        assert_equal(parse_retry_after(None), None)
+
+
+@patch('twilio.rest.resources.base.time.sleep')
+@patch('twilio.rest.resources.base.make_twilio_request')
+class ResourceRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+
+    def test_retries_get(self, request, sleep):
+        request.side_effect = [error(503, {"retry-after": "2"}),
+                               Mock(raw=b'{"sid": "CA123"}')]
+        call = self.client.calls.get("CA123")
+        assert_equal(call.sid, "CA123")
+        assert_equal(request.call_count, 2)
+        sleep.assert_called_once_with(2)
+
+    @raises(TwilioRestException)
+    def test_gives_up(self, request, sleep):
+        request.side_effect = error(500)
+        try:
+            self.client.calls.get("CA123")
+        finally:
+            assert_equal(request.call_count, 3)
+
+    @raises(TwilioRestException)
+    def test_post_not_retried(self, request, sleep):
+        request.side_effect = error(503)
+        try:
+            self.client.messages.create(to="+1", from_="+2", body="Hi")
+        finally:
+            assert_equal(request.call_count, 1)
+            assert_equal(sleep.call_count, 0)
+
+    @raises(TwilioRestException)
+    def test_retries_disabled(self, request, sleep):
+        client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                  retry_policy=RetryPolicy(max_attempts=1))
+        request.side_effect = error(503)
+        try:
+            client.calls.get("CA123")
+        finally:
+            assert_equal(request.call_count, 1)
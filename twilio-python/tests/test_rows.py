@@ -0,0 +1,125 @@
+import json
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_false, assert_true, raises
+
+from twilio.rest.resources import Calls, Messages, Row
+from twilio.rest.resources.base import Response, StreamedResponse
+from twilio.rest.resources.rows import projector, row_loader, row_type
+
+AUTH = ("AC123", "token")
+
+MESSAGES = [
+    {"sid": "SM1", "from": "+1", "to": "+2", "status": "sent",
+     "body": "hello", "subresource_uris": {"media": "/"}},
+    {"sid": "SM2", "from": "+3", "to": "+4", "status": "failed",
+     "body": "again", "subresource_uris": {}},
+]
+
+
+def page(key, records, next_page_uri=None):
+    return json.dumps({key: records,
+                       "next_page_uri": next_page_uri}).encode("utf-8")
+
+
+class RowTest(unittest.TestCase):
+
+    def test_fields(self):
+        row = row_loader(["sid", "from", "status"])(MESSAGES[0])
+
+        assert_true(isinstance(row, Row))
+        assert_equal(tuple(row), ("SM1", "+1", "sent"))
+        assert_equal(row.sid, "SM1")
+        assert_equal(row.from_, "+1")
+        assert_equal(row._asdict(),
+                     {"sid": "SM1", "from": "+1", "status": "sent"})
+        assert_equal(repr(row), "Row(sid='SM1', from='+1', status='sent')")
+
+    def test_missing_field(self):
+        row = row_loader(["sid", "price"])(MESSAGES[0])
+        assert_equal(row.price, None)
+
+    def test_all_fields(self):
+        row = row_loader()(MESSAGES[0])
+        assert_equal(row._fields, tuple(sorted(MESSAGES[0])))
+        assert_equal(row.subresource_uris, {"media": "/"})
+
+    def test_type_is_shared(self):
+        load = row_loader(["sid", "to"])
+        assert_true(type(load(MESSAGES[0])) is type(load(MESSAGES[1])))
+        assert_true(row_type(["sid", "to"]) is type(load(MESSAGES[0])))
+
+    @raises(AttributeError)
+    def test_read_only(self):
+        row = row_loader(["sid"])(MESSAGES[0])
+        row.sid = "SM3"
+
+    def test_no_dict(self):
+        row = row_loader(["sid"])(MESSAGES[0])
+        assert_false(hasattr(row, "__dict__"))
+
+    def test_projector(self):
+        project = projector(["sid", "status", "price"])
+        assert_equal(project(MESSAGES[0]), {"sid": "SM1", "status": "sent"})
+
+
+class RowModeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = Messages("https://api.twilio.com", AUTH)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_iter_rows(self, request):
+        request.side_effect = [
+            Response(200, {}, page("messages", MESSAGES[:1],
+                                   "/Messages.json?Page=1&PageToken=PA2"),
+                     "url"),
+            Response(200, {}, page("messages", MESSAGES[1:]), "url"),
+        ]
+
+        rows = list(self.messages.iter(rows=True, fields=["sid", "status"],
+                                       to="+2"))
+
+        assert_equal(rows, [("SM1", "sent"), ("SM2", "failed")])
+        assert_equal(rows[1].status, "failed")
+        assert_equal(request.call_args[1]["params"]["To"], "+2")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_iter_stream_rows(self, request):
+        request.return_value = StreamedResponse(
+            200, {}, iter([page("calls", [{"sid": "CA1", "to": "+1"}])]),
+            "url")
+
+        calls = Calls("https://api.twilio.com", AUTH)
+        rows = list(calls.iter(stream=True, rows=True))
+
+        assert_equal([row._asdict() for row in rows],
+                     [{"sid": "CA1", "to": "+1"}])
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_iter_fields(self, request):
+        request.return_value = Response(200, {}, page("messages", MESSAGES),
+                                        "url")
+
+        raw = list(self.messages.iter(raw=True, fields=["status"]))
+        assert_equal(raw, [{"status": "sent"}, {"status": "failed"}])
+
+        # Instances always keep their sid
+        message = next(self.messages.iter(fields=["status"]))
+        assert_equal(message.sid, "SM1")
+        assert_equal(message.status, "sent")
+        assert_false(hasattr(message, "body"))
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_list_rows(self, request):
+        request.return_value = Response(200, {}, page("messages", MESSAGES),
+                                        "url")
+
+        rows = self.messages.list(rows=True, fields=["sid", "from"],
+                                  status="sent")
+
+        assert_equal([row.from_ for row in rows], ["+1", "+3"])
+        params = request.call_args[1]["params"]
+        assert_equal(params["Status"], "sent")
+        assert_false("Rows" in params or "Fields" in params)
@@ -0,0 +1,105 @@
+from datetime import date, datetime
+import json
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Response
+from twilio.rest.resources.scan import date_windows, to_date
+
+PAGE_SIZE = 2
+
+# The number of calls started on each day of May 2015
+CALLS_PER_DAY = {1: 1, 2: 1, 3: 5, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1, 9: 1, 10: 1}
+
+
+def calls_between(start, end):
+    """ The calls from ``start`` to ``end``, the latest first """
+    return [{"sid": "CA%02d%d" % (day, n)}
+            for day in sorted(CALLS_PER_DAY, reverse=True)
+            if start <= date(2015, 5, day) <= end
+            for n in range(CALLS_PER_DAY[day])]
+
+
+def answer(method, url, params=None, **kwargs):
+    calls = calls_between(to_date(params["StartTime>"]),
+                          to_date(params["StartTime<"]))
+    page = int(params.get("Page", ["0"])[0])
+    body = {"calls": calls[page * PAGE_SIZE:(page + 1) * PAGE_SIZE],
+            "next_page_uri": None}
+    if len(calls) > (page + 1) * PAGE_SIZE:
+        body["next_page_uri"] = "/Calls.json?Page=%d" % (page + 1)
+    return Response(200, {}, json.dumps(body).encode("utf-8"), url)
+
+
+class DateWindowsTest(unittest.TestCase):
+
+    def test_windows(self):
+        windows = date_windows(date(2015, 5, 1), date(2015, 5, 10), 4)
+        assert_equal([(w.start.day, w.end.day) for w in windows],
+                     [(7, 10), (3, 6), (1, 2)])
+
+    def test_split(self):
+        window, = date_windows(date(2015, 5, 1), date(2015, 5, 5), 7)
+        assert_equal([(w.start.day, w.end.day) for w in window.split()],
+                     [(4, 5), (1, 3)])
+
+    def test_to_date(self):
+        assert_equal(to_date(datetime(2015, 5, 1, 12)), date(2015, 5, 1))
+        assert_equal(to_date("2015-05-01"), date(2015, 5, 1))
+
+
+class ScanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_scan(self, request):
+        request.side_effect = answer
+
+        calls = self.client.calls.scan(date(2015, 5, 1), "2015-05-10",
+                                       days=4, concurrency=3,
+                                       status="completed")
+        expected = calls_between(date(2015, 5, 1), date(2015, 5, 10))
+        assert_equal([c.sid for c in calls], [c["sid"] for c in expected])
+
+        params = request.call_args[1]["params"]
+        assert_equal(params["Status"], "completed")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_dense_windows_split(self, request):
+        request.side_effect = answer
+
+        list(self.client.calls.scan(date(2015, 5, 3), date(2015, 5, 4),
+                                    concurrency=1))
+        windows = [(c[1]["params"]["StartTime>"],
+                    c[1]["params"]["StartTime<"])
+                   for c in request.call_args_list]
+        # The two days don't fit in a page, and the 3rd can't be split
+        assert_equal(windows, [
+            ("2015-05-03", "2015-05-04"),
+            ("2015-05-04", "2015-05-04"),
+            ("2015-05-03", "2015-05-03"),
+            ("2015-05-03", "2015-05-03"),
+            ("2015-05-03", "2015-05-03"),
+        ])
+
+    @raises(TwilioRestException)
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_error(self, request):
+        request.side_effect = TwilioRestException(400, "url", "Bad Request")
+        list(self.client.calls.scan(date(2015, 5, 1), date(2015, 5, 10),
+                                    days=1))
+
+    @raises(TwilioException)
+    def test_not_scannable(self):
+        self.client.queues.scan(date(2015, 5, 1), date(2015, 5, 10))
+
+    @raises(ValueError)
+    def test_backwards(self):
+        self.client.messages.scan(date(2015, 5, 10), date(2015, 5, 1))
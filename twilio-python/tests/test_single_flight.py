@@ -0,0 +1,90 @@
+import threading
+import time
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Response
+from twilio.rest.resources.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       single_flight=self.flight)
+
+    def wait_for_followers(self, count):
+        """ Hold the first request until ``count`` others wait on it """
+        deadline = time.time() + 5
+        while (self.flight.stats()["shared"] < count and
+               time.time() < deadline):
+            time.sleep(0.001)
+
+    def run_threads(self, count, target):
+        results = [None] * count
+
+        def run(i):
+            try:
+                results[i] = target()
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_shared(self, request):
+        def respond(*args, **kwargs):
+            self.wait_for_followers(4)
+            return Response(200, {}, b'{"sid": "QU1", "uri": "/QU1"}',
+                            "url")
+        request.side_effect = respond
+
+        queues = self.run_threads(5, lambda: self.client.queues.get("QU1"))
+
+        assert_equal(request.call_count, 1)
+        assert_equal([q.sid for q in queues], ["QU1"] * 5)
+        assert_equal(len(set(id(q) for q in queues)), 5)
+        assert_equal(self.flight.stats(), {"in_flight": 0, "shared": 4})
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_error_shared(self, request):
+        error = TwilioRestException(404, "url", headers={})
+
+        def respond(*args, **kwargs):
+            self.wait_for_followers(2)
+            raise error
+        request.side_effect = respond
+
+        results = self.run_threads(3, lambda: self.client.queues.get("QU1"))
+
+        assert_equal(request.call_count, 1)
+        assert_true(all(result is error for result in results))
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_sequential_not_shared(self, request):
+        request.return_value = Response(200, {}, b'{"sid": "QU1"}', "url")
+        self.client.queues.get("QU1")
+        self.client.queues.get("QU1")
+        assert_equal(request.call_count, 2)
+
+    def test_key(self):
+        queues = self.client.queues
+        key = self.flight.key(queues, queues.uri, {"params": {"A": 1}})
+        assert_equal(key, self.flight.key(queues, queues.uri,
+                                          {"params": {"A": 1}}))
+        assert_true(key != self.flight.key(queues, queues.uri,
+                                           {"params": {"A": 2}}))
+        assert_true(key != self.flight.key(
+            queues, queues.uri,
+            {"params": {"A": 1}, "headers": {"If-None-Match": "1"}}))
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from mock import patch, Mock
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.rest.resources import Calls, make_request
+from twilio.rest.resources.base import StreamedResponse
+from twilio.rest.resources.lookups.phone_numbers import PhoneNumbers
+from twilio.rest.resources.streaming import PageParser
+
+AUTH = ("AC123", "token")
+
+
+def chunked(data, size):
+    data = data.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+PAGE = json.dumps({
+    "page": 0,
+    "calls": [{"sid": "CA%d" % i, "price": -0.02, "to": u"+1é"}
+              for i in range(20)],
+    "next_page_uri": "/Calls.json?Page=1&PageToken=PA1",
+    "total": 12345,
+})
+
+
+class PageParserTest(unittest.TestCase):
+
+    def test_parse(self):
+        for size in (1, 3, 7, 64, 100000):
+            parser = PageParser(chunked(PAGE, size), ["calls"])
+            items = list(parser)
+            assert_equal(items, json.loads(PAGE)["calls"])
+            assert_equal(parser.page, {
+                "page": 0,
+                "calls": [],
+                "next_page_uri": "/Calls.json?Page=1&PageToken=PA1",
+                "total": 12345,
+            })
+
+    def test_yields_before_end(self):
+        chunks = iter(chunked(PAGE, 10))
+        parser = iter(PageParser(chunks, ["calls"]))
+        assert_equal(next(parser)["sid"], "CA0")
+        assert_true(len(list(chunks)) > 0)
+
+    def test_other_lists_kept(self):
+        data = '{"meta": {"key": "alerts"}, "tags": [1, 2], "alerts": [{}]}'
+        parser = PageParser(chunked(data, 4), ["alerts"])
+        assert_equal(list(parser), [{}])
+        assert_equal(parser.page["tags"], [1, 2])
+
+    def test_any_list(self):
+        data = '{"alerts": [{"sid": "NO1"}], "meta": {"key": "alerts"}}'
+        parser = PageParser(chunked(data, 5))
+        assert_equal(list(parser), [{"sid": "NO1"}])
+        assert_equal(parser.page["meta"], {"key": "alerts"})
+
+    def test_empty(self):
+        assert_equal(list(PageParser([b'{}'])), [])
+        parser = PageParser([b'{"calls": []}'], ["calls"])
+        assert_equal(list(parser), [])
+        assert_equal(parser.page, {"calls": []})
+
+    def test_number_split_in_exponent(self):
+        for chunks, value in [
+            ([b'{"messages": [1.5e', b'3]}'], 1.5e3),
+            ([b'{"messages": [1.5E-', b'3]}'], 1.5e-3),
+            ([b'{"messages": [-', b'1.', b'5e+', b'3]}'], -1.5e3),
+        ]:
+            assert_equal(list(PageParser(chunks, ["messages"])), [value])
+
+        parser = PageParser([b'{"total": 2e', b'2}'])
+        assert_equal(list(parser), [])
+        assert_equal(parser.page, {"total": 200.0})
+
+    @raises(ValueError)
+    def test_truncated(self):
+        list(PageParser(chunked(PAGE[:-30], 16), ["calls"]))
+
+
+def test_make_request_stream():
+    transport = Mock()
+    transport.stream.return_value = (200, {}, iter([b'{"a"', b': 1}']))
+    resp = make_request("GET", "https://api.twilio.com", stream=True,
+                        transport=transport)
+    assert_true(isinstance(resp, StreamedResponse))
+    assert_equal(resp.content, '{"a": 1}')
+    assert_equal(transport.request.call_count, 0)
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_iter_stream(request):
+    pages = [
+        {"calls": [{"sid": "CA1"}, {"sid": "CA2"}],
+         "next_page_uri": "/Calls.json?Page=1&PageToken=PA2"},
+        {"calls": [{"sid": "CA3"}], "next_page_uri": None},
+    ]
+    request.side_effect = [
+        StreamedResponse(200, {}, iter(chunked(json.dumps(p), 8)), "url")
+        for p in pages
+    ]
+
+    calls = Calls("https://api.twilio.com", AUTH)
+    sids = [c.sid for c in calls.iter(stream=True, status="completed")]
+
+    assert_equal(sids, ["CA1", "CA2", "CA3"])
+    request.assert_called_with(
+        "GET", "https://api.twilio.com/Calls", auth=AUTH, stream=True,
+        params={"Status": "completed", "Page": ["1"], "PageToken": ["PA2"]},
+        use_json_extension=True,
+    )
+
+
+@patch("twilio.rest.resources.base.make_twilio_request")
+def test_next_gen_iter_stream(request):
+    pages = [
+        {"phone_numbers": [{"phone_number": "+1"}],
+         "meta": {"key": "phone_numbers", "next_page_url": "https://p2"}},
+        {"meta": {"key": "phone_numbers", "next_page_url": None},
+         "phone_numbers": [{"phone_number": "+2"}]},
+    ]
+    request.side_effect = [
+        StreamedResponse(200, {}, iter(chunked(json.dumps(p), 8)), "url")
+        for p in pages
+    ]
+
+    numbers = PhoneNumbers("https://lookups.twilio.com/v1", AUTH)
+    result = [n.phone_number for n in numbers.iter(stream=True)]
+
+    assert_equal(result, ["+1", "+2"])
+    request.assert_called_with("GET", "https://p2", auth=AUTH, stream=True,
+                               use_json_extension=False)
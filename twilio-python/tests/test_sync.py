@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+from mock import patch
+from nose.tools import assert_equal, raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest import TwilioRestClient
+from twilio.rest.resources import (
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    Response,
+)
+from twilio.rest.resources.sync import record_day
+
+
+def message(sid, day, updated="u1"):
+    return {"sid": sid, "date_sent": "Fri, %02d May 2015 10:00:00 +0000" % day,
+            "date_updated": updated}
+
+
+def page(*messages):
+    body = {"messages": list(messages), "next_page_uri": None}
+    return Response(200, {}, json.dumps(body).encode("utf-8"), "url")
+
+
+class SyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+        self.store = MemoryCheckpointStore()
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_sync(self, request):
+        request.side_effect = [
+            page(message("SM3", 2), message("SM2", 2), message("SM1", 1)),
+            page(message("SM4", 3), message("SM3", 2),
+                 message("SM2", 2, updated="u2")),
+            page(),
+        ]
+        messages = self.client.messages
+
+        first = messages.sync(self.store, key="messages", to="+1")
+        assert_equal([m.sid for m in first], ["SM3", "SM2", "SM1"])
+        assert_equal(request.call_args[1]["params"], {"To": "+1"})
+        assert_equal(self.store.load("messages"), {
+            "watermark": "2015-05-02", "seen": {"SM3": "u1", "SM2": "u1"},
+        })
+
+        # The 2nd is listed again: SM3 is skipped, the updated SM2 isn't
+        second = messages.sync(self.store, key="messages", to="+1")
+        assert_equal([m.sid for m in second], ["SM4", "SM2"])
+        assert_equal(request.call_args[1]["params"],
+                     {"To": "+1", "DateSent>": "2015-05-02"})
+
+        # Nothing new leaves the checkpoint alone
+        assert_equal(list(messages.sync(self.store, key="messages")), [])
+        assert_equal(self.store.load("messages")["watermark"], "2015-05-03")
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_since_and_overlap(self, request):
+        request.side_effect = [
+            page(message("SM2", 5), message("SM1", 4)),
+            page(message("SM2", 5), message("SM1", 4, updated="u2")),
+        ]
+        messages = self.client.messages
+
+        list(messages.sync(self.store, since=date(2015, 5, 4), overlap=1,
+                           raw=True))
+        assert_equal(request.call_args[1]["params"],
+                     {"DateSent>": "2015-05-03"})
+
+        updated = list(messages.sync(self.store, overlap=1, raw=True))
+        assert_equal(request.call_args[1]["params"],
+                     {"DateSent>": "2015-05-04"})
+        assert_equal([m["sid"] for m in updated], ["SM1"])
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_stopped_early(self, request):
+        request.return_value = page(message("SM2", 2), message("SM1", 1))
+        messages = self.client.messages.sync(self.store, key="messages")
+        next(messages)
+        messages.close()
+        assert_equal(self.store.load("messages"), None)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_default_key(self, request):
+        request.return_value = page(message("SM1", 1))
+        list(self.client.messages.sync(self.store, status="sent"))
+        assert_equal(list(self.store.checkpoints),
+                     [self.client.messages.uri + "?Status=sent"])
+
+    @raises(TwilioException)
+    def test_not_syncable(self):
+        self.client.queues.sync(self.store)
+
+    def test_record_day(self):
+        assert_equal(record_day("Fri, 01 May 2015 10:00:00 +0000"),
+                     date(2015, 5, 1))
+        assert_equal(record_day("2015-05-01T10:00:00Z"), date(2015, 5, 1))
+        assert_equal(record_day(None), None)
+        assert_equal(record_day("soon"), None)
+
+
+class FileCheckpointStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "checkpoints.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_store(self):
+        store = FileCheckpointStore(self.path)
+        assert_equal(store.load("a"), None)
+        store.save("a", {"watermark": "2015-05-01"})
+        store.save("b", {"watermark": "2015-05-02"})
+
+        store = FileCheckpointStore(self.path)
+        assert_equal(store.load("a"), {"watermark": "2015-05-01"})
+        assert_equal(os.listdir(self.dir), ["checkpoints.json"])
@@ -0,0 +1,171 @@
+import json
+import unittest
+
+from mock import patch
+from nose.tools import assert_equal, assert_true
+
+from twilio.rest import TwilioRestClient
+from twilio.rest.exceptions import TwilioRestException
+from twilio.rest.resources import Response
+from twilio.rest.resources.tracing import (
+    Span,
+    Tracer,
+    activate,
+    current_span,
+    traced,
+)
+
+
+class RecordedSpan(Span):
+
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def end(self):
+        self.ended = True
+
+
+class RecordingTracer(Tracer):
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, parent=None, attributes=None):
+        span = RecordedSpan(name, parent, attributes)
+        self.spans.append(span)
+        return span
+
+
+def response(status, body):
+    return Response(status, {}, json.dumps(body).encode('utf-8'), "url")
+
+
+class TracedTest(unittest.TestCase):
+
+    def test_nesting(self):
+        tracer = RecordingTracer()
+        with traced(tracer, "outer") as outer:
+            assert_true(current_span() is outer)
+            with traced(tracer, "inner") as inner:
+                assert_true(inner.parent is outer)
+            assert_true(current_span() is outer)
+        assert_equal(current_span(), None)
+        assert_true(outer.ended and inner.ended)
+
+    def test_exception(self):
+        tracer = RecordingTracer()
+        try:
+            with traced(tracer, "op"):
+                raise ValueError
+        except ValueError:
+            pass
+        assert_true(isinstance(tracer.spans[0].exceptions[0], ValueError))
+        assert_true(tracer.spans[0].ended)
+
+    def test_no_tracer(self):
+        with traced(None, "op") as span:
+            assert_equal(span, None)
+
+    def test_inactive(self):
+        with traced(RecordingTracer(), "op", active=False):
+            assert_equal(current_span(), None)
+
+    def test_activate(self):
+        span = Span()
+        with activate(span):
+            assert_true(current_span() is span)
+        assert_equal(current_span(), None)
+
+
+class ResourceTracingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tracer = RecordingTracer()
+        self.client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                       tracer=self.tracer)
+
+    def names(self):
+        return [span.name for span in self.tracer.spans]
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_iter(self, request):
+        request.side_effect = [
+            response(200, {"calls": [{"sid": "CA1"}],
+                           "next_page_uri": "/Calls.json?Page=1"}),
+            response(200, {"sid": "CA9"}),
+            response(200, {"calls": [{"sid": "CA2"}],
+                           "next_page_uri": None}),
+        ]
+
+        for call in self.client.calls.iter():
+            # Requests made by the caller inside the loop aren't part of it
+            if call.sid == "CA1":
+                self.client.calls.get("CA9")
+
+        iter_span, first, get, second = self.tracer.spans
+        assert_equal(iter_span.name, "Calls.iter")
+        assert_equal(first.name,
+                     "GET /2010-04-01/Accounts/ACCOUNT_SID/Calls")
+        assert_true(first.parent is iter_span)
+        assert_true(second.parent is iter_span)
+        assert_equal(get.parent, None)
+        assert_equal(first.attributes["http.status_code"], 200)
+        assert_true(all(span.ended for span in self.tracer.spans))
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_abandoned_iter(self, request):
+        request.return_value = response(200, {"calls": [{"sid": "CA1"}],
+                                              "next_page_uri": "/C?Page=1"})
+        calls = self.client.calls.iter()
+        next(calls)
+        calls.close()
+        assert_true(self.tracer.spans[0].ended)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_operations(self, request):
+        request.side_effect = [
+            response(201, {"sid": "CA1"}),
+            response(200, {"sid": "CA1"}),
+            Response(204, {}, b'', "url"),
+        ]
+
+        self.client.calls.create(to="+1", from_="+2", url="http://a")
+        self.client.calls.update("CA1", status="completed")
+        self.client.calls.delete("CA1")
+
+        assert_equal(self.names(), [
+            "Calls.create", "POST /2010-04-01/Accounts/ACCOUNT_SID/Calls",
+            "Calls.update", "POST /2010-04-01/Accounts/ACCOUNT_SID/Calls/CA1",
+            "Calls.delete",
+            "DELETE /2010-04-01/Accounts/ACCOUNT_SID/Calls/CA1",
+        ])
+        spans = self.tracer.spans
+        for op, req in zip(spans[::2], spans[1::2]):
+            assert_true(req.parent is op)
+            assert_true(op.ended and req.ended)
+
+    @patch("twilio.rest.resources.base.make_twilio_request")
+    def test_error(self, request):
+        error = TwilioRestException(400, "url", headers={})
+        request.side_effect = error
+
+        try:
+            self.client.messages.create(to="+1", from_="+2", body="Hi")
+        except TwilioRestException:
+            pass
+
+        op, req = self.tracer.spans
+        assert_equal(op.exceptions, [error])
+        assert_equal(req.exceptions, [error])
+        assert_equal(req.attributes["http.status_code"], 400)
+        assert_equal(req.attributes["twilio.attempts"], 1)
@@ -0,0 +1,365 @@
+import unittest
+
+from mock import patch, Mock, ANY
+from nose.tools import assert_equal, assert_true, raises
+
+from twilio.exceptions import TwilioException
+from twilio.rest import (
+    TwilioLookupsClient,
+    TwilioRestClient,
+    TwilioTaskRouterClient,
+)
+from twilio.rest import resources
+from twilio.rest.resources import Connection, make_request
+from twilio.rest.resources import Response
+from twilio.rest.resources.connection import PROXY_TYPE_HTTP
+from twilio.rest.resources.transport import (
+    STREAM_CHUNK_SIZE,
+    Httplib2Transport,
+    Transport,
+    Urllib3Transport,
+    get_default_transport,
+)
+
+
+def mock_http():
+    http = Mock()
+    http.request.return_value = (Mock(status=200), b'{}')
+    http.connections = {}
+    return http
+
+
+class Httplib2TransportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = Httplib2Transport(pool_size=1)
+        self.proxy_patcher = patch.object(Connection, '_proxy_info', None)
+        self.proxy_patcher.start()
+
+    def tearDown(self):
+        self.proxy_patcher.stop()
+
+    @patch('httplib2.Http')
+    def test_reuses_http(self, http_mock):
+        http_mock.side_effect = lambda **kw: mock_http()
+        self.transport.request("GET", "https://api.twilio.com/a")
+        self.transport.request("GET", "https://api.twilio.com/b")
+        assert_equal(http_mock.call_count, 1)
+
+    @patch('httplib2.Http')
+    def test_http_kwargs(self, http_mock):
+        http_mock.return_value = mock_http()
+        self.transport.request("GET", "https://api.twilio.com", timeout=5)
+        http_mock.assert_called_with(timeout=5, ca_certs=ANY, proxy_info=None)
+
+    @patch('httplib2.Http')
+    def test_pool_per_timeout(self, http_mock):
+        http_mock.side_effect = lambda **kw: mock_http()
+        self.transport.request("GET", "https://api.twilio.com", timeout=5)
+        self.transport.request("GET", "https://api.twilio.com", timeout=10)
+        assert_equal(http_mock.call_count, 2)
+
+    @patch('httplib2.Http')
+    def test_credentials_reset(self, http_mock):
+        http = mock_http()
+        http_mock.return_value = http
+        self.transport.request("GET", "https://api.twilio.com",
+                               auth=("AC123", "token"))
+        http.clear_credentials.assert_called_with()
+        http.add_credentials.assert_called_with("AC123", "token")
+
+    @patch('httplib2.Http')
+    def test_overflow_closed(self, http_mock):
+        first, second = mock_http(), mock_http()
+        conn = Mock()
+        second.connections = {"https:api.twilio.com": conn}
+        http_mock.side_effect = [first, second]
+
+        self.transport.request("GET", "https://api.twilio.com")
+        pool = self.transport._get_pool((None, None))
+        held = pool.get_nowait()
+
+        # Another thread hands its object back while this request runs, so
+        # there is no room left in the pool for the overflow object
+        def request(*args, **kwargs):
+            pool.put_nowait(held)
+            return Mock(status=200), b'{}'
+
+        second.request.side_effect = request
+        self.transport.request("GET", "https://api.twilio.com")
+
+        assert_equal(http_mock.call_count, 2)
+        conn.close.assert_called_with()
+        assert_true(pool.get_nowait() is held)
+
+    @raises(ValueError)
+    @patch('httplib2.Http')
+    def test_error_discards_http(self, http_mock):
+        http = mock_http()
+        http.request.side_effect = ValueError
+        http_mock.return_value = http
+        try:
+            self.transport.request("GET", "https://api.twilio.com")
+        finally:
+            pool = self.transport._get_pool((None, None))
+            assert_true(pool.empty())
+
+    @patch('httplib2.Http')
+    def test_close(self, http_mock):
+        http = mock_http()
+        conn = Mock()
+        http.connections = {"https:api.twilio.com": conn}
+        http_mock.return_value = http
+        self.transport.request("GET", "https://api.twilio.com")
+        self.transport.close()
+        conn.close.assert_called_with()
+
+    @patch('httplib2.Http')
+    def test_pool_stats(self, http_mock):
+        http = mock_http()
+        http_mock.return_value = http
+        stats = []
+        http.request.side_effect = lambda *args, **kwargs: (
+            stats.append(self.transport.pool_stats()) or
+            (Mock(status=200), b'{}'))
+
+        self.transport.request("GET", "https://api.twilio.com")
+
+        assert_equal(stats, [{"in_use": 1, "idle": 0, "created": 1}])
+        assert_equal(self.transport.pool_stats(),
+                     {"in_use": 0, "idle": 1, "created": 1})
+
+    @patch('httplib2.Http')
+    def test_warm_up(self, http_mock):
+        https = [mock_http(), mock_http(), mock_http()]
+        http_mock.side_effect = https
+        self.transport.pool_size = 2
+
+        opened = self.transport.warm_up("https://api.twilio.com", 3,
+                                        timeout=5)
+
+        assert_equal(opened, 2)
+        for http in https[:2]:
+            http.request.assert_called_with("https://api.twilio.com", "HEAD",
+                                            headers=None, body=None)
+        # Requests with the same timeout use the warmed up objects
+        self.transport.request("GET", "https://api.twilio.com", timeout=5)
+        assert_equal(http_mock.call_count, 2)
+
+    @patch('httplib2.Http')
+    def test_warm_up_failure(self, http_mock):
+        http = mock_http()
+        http.request.side_effect = IOError
+        http_mock.return_value = http
+
+        assert_equal(self.transport.warm_up("https://api.twilio.com"), 0)
+        assert_equal(self.transport.pool_stats(),
+                     {"in_use": 0, "idle": 0, "created": 1})
+
+
+def test_default_transport_shared():
+    assert_true(get_default_transport() is get_default_transport())
+
+
+def test_make_request_default_transport():
+    transport = Mock()
+    transport.request.return_value = (200, {}, b'{}')
+    with patch('twilio.rest.resources.base.get_default_transport') as mock:
+        mock.return_value = transport
+        make_request("GET", "https://api.twilio.com")
+    transport.request.assert_called_with(
+        "GET", "https://api.twilio.com", body=None, headers=None,
+        timeout=None, auth=None, allow_redirects=False,
+    )
+
+
+def test_client_shares_default_transport():
+    client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+    task_router = TwilioTaskRouterClient("ACCOUNT_SID", "AUTH_TOKEN")
+    assert_true(client.transport is get_default_transport())
+    assert_true(task_router.transport is client.transport)
+
+
+def test_client_pool_size():
+    client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN", pool_size=25)
+    assert_true(client.transport is not get_default_transport())
+    assert_equal(client.transport.pool_size, 25)
+    assert_true(client.messages.client is client)
+    assert_true(client.sip.domains.client is client)
+    assert_true(client.usage.records.daily.client is client)
+
+
+def test_client_transport():
+    transport = Mock()
+    client = TwilioLookupsClient("ACCOUNT_SID", "AUTH_TOKEN",
+                                 transport=transport)
+    assert_true(client.transport is transport)
+    assert_true(client.phone_numbers.client is client)
+
+
+def test_list_resource_transport():
+    transport = Mock()
+    transport.request.return_value = (200, {}, b'{"calls": []}')
+    client = TwilioRestClient("ACCOUNT_SID", "AUTH_TOKEN")
+    calls = resources.Calls(client.account_uri, client.auth,
+                            client=client, transport=transport)
+    calls.list()
+    assert_equal(transport.request.call_count, 1)
+
+
+def test_response_headers():
+    resp = Response(200, {"content-type": "application/json"}, b'{}',
+                    "https://api.twilio.com")
+    assert_equal(resp.headers["content-type"], "application/json")
+    assert_equal(resp.raw, b'{}')
+    assert_equal(resp.content, '{}')
+    assert_true(resp.ok)
+
+
+@raises(NotImplementedError)
+def test_transport_interface():
+    Transport().request("GET", "https://api.twilio.com")
+
+
+def test_transport_warm_up():
+    transport = Transport()
+    transport.request = Mock(side_effect=[(200, {}, b''), IOError])
+    assert_equal(transport.warm_up("https://api.twilio.com", 2), 1)
+    transport.request.assert_called_with("HEAD", "https://api.twilio.com",
+                                         timeout=None)
+
+
+def test_client_warm_up():
+    transport = Mock()
+    transport.warm_up.return_value = 2
+    client = TwilioLookupsClient("ACCOUNT_SID", "AUTH_TOKEN", timeout=3,
+                                 transport=transport)
+    assert_equal(client.warm_up(connections=2), 2)
+    transport.warm_up.assert_called_with("https://lookups.twilio.com", 2, 3)
+
+
+def test_transport_stream_fallback():
+    transport = Transport()
+    transport.request = Mock(return_value=(200, {}, b'{"calls": []}'))
+    status, headers, chunks = transport.stream("GET", "https://api.twilio.com")
+    assert_equal(status, 200)
+    assert_equal(list(chunks), [b'{"calls": []}'])
+
+
+class Urllib3TransportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.urllib3_patcher = patch(
+            'twilio.rest.resources.transport.urllib3')
+        self.urllib3 = self.urllib3_patcher.start()
+        self.proxy_patcher = patch.object(Connection, '_proxy_info', None)
+        self.proxy_patcher.start()
+
+        self.manager = self.urllib3.PoolManager.return_value
+        self.manager.urlopen.return_value = Mock(
+            status=201,
+            headers={"content-type": "application/json"},
+            data=b'{"sid": "SM123"}',
+        )
+        self.transport = Urllib3Transport(pool_size=4)
+
+    def tearDown(self):
+        self.urllib3_patcher.stop()
+        self.proxy_patcher.stop()
+
+    def test_request(self):
+        status, headers, content = self.transport.request(
+            "POST", "https://api.twilio.com", body="To=123",
+            headers={"Accept": "application/json"}, auth=("user", "pass"),
+        )
+
+        assert_equal(status, 201)
+        assert_equal(headers["content-type"], "application/json")
+        assert_equal(content, b'{"sid": "SM123"}')
+        self.urllib3.PoolManager.assert_called_with(
+            maxsize=4, block=False, cert_reqs="CERT_REQUIRED", ca_certs=ANY,
+        )
+        self.manager.urlopen.assert_called_with(
+            "POST", "https://api.twilio.com", body="To=123",
+            headers={
+                "Accept": "application/json",
+                "Authorization": "Basic dXNlcjpwYXNz",
+            },
+            timeout=self.urllib3.Timeout.DEFAULT_TIMEOUT,
+            retries=False, redirect=False, preload_content=True,
+        )
+
+    def test_pool_stats(self):
+        self.manager.pools.keys.return_value = ["key"]
+        self.manager.pools.get.return_value = Mock(num_connections=2)
+        self.transport.request("GET", "https://api.twilio.com")
+        assert_equal(self.transport.pool_stats(),
+                     {"in_use": 0, "created": 2})
+
+    def test_manager_reused(self):
+        self.transport.request("GET", "https://api.twilio.com")
+        self.transport.request("GET", "https://api.twilio.com")
+        assert_equal(self.urllib3.PoolManager.call_count, 1)
+
+    def test_redirects(self):
+        self.transport.request("GET", "https://api.twilio.com", timeout=3,
+                               allow_redirects=True)
+        self.manager.urlopen.assert_called_with(
+            "GET", "https://api.twilio.com", body=None, headers={},
+            timeout=3, retries=self.urllib3.Retry.return_value,
+            redirect=True, preload_content=True,
+        )
+
+    def test_http_proxy(self):
+        Connection.set_proxy_info("example.com", 8080,
+                                  proxy_type=PROXY_TYPE_HTTP)
+        self.transport.request("GET", "https://api.twilio.com")
+        self.urllib3.ProxyManager.assert_called_with(
+            "http://example.com:8080", maxsize=4, block=False,
+            cert_reqs="CERT_REQUIRED", ca_certs=ANY,
+        )
+
+    def test_close(self):
+        self.transport.request("GET", "https://api.twilio.com")
+        self.transport.close()
+        self.manager.clear.assert_called_with()
+
+    def test_stream(self):
+        resp = self.manager.urlopen.return_value
+        resp.stream.return_value = iter([b'{"calls"', b': []}'])
+        status, headers, chunks = self.transport.stream(
+            "GET", "https://api.twilio.com",
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+
+        assert_equal(status, 201)
+        assert_equal(b''.join(chunks), b'{"calls": []}')
+        resp.stream.assert_called_with(STREAM_CHUNK_SIZE, decode_content=True)
+        resp.release_conn.assert_called_with()
+        self.manager.urlopen.assert_called_with(
+            "GET", "https://api.twilio.com", body=None,
+            headers={"Accept-Encoding": "gzip, deflate"},
+            timeout=self.urllib3.Timeout.DEFAULT_TIMEOUT,
+            retries=False, redirect=False, preload_content=False,
+        )
+
+    def test_warm_up(self):
+        responses = [Mock(), Mock()]
+        self.manager.urlopen.side_effect = responses + [IOError()]
+        self.transport.pool_size = 3
+
+        assert_equal(self.transport.warm_up("https://api.twilio.com", 5), 2)
+        assert_equal(self.manager.urlopen.call_count, 3)
+        self.manager.urlopen.assert_called_with(
+            "HEAD", "https://api.twilio.com", body=None, headers={},
+            timeout=self.urllib3.Timeout.DEFAULT_TIMEOUT,
+            retries=False, redirect=False, preload_content=False,
+        )
+        for resp in responses:
+            resp.release_conn.assert_called_with()
+
+
+@raises(TwilioException)
+@patch('twilio.rest.resources.transport.urllib3', None)
+def test_urllib3_missing():
+    Urllib3Transport()
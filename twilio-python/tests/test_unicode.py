@@ -2,6 +2,7 @@
 from mock import patch, Mock
 from six import u
 from twilio.rest import resources
+from twilio.rest.resources.transport import Httplib2Transport
 
 
 @patch("httplib2.Http")
@@ -14,7 +15,8 @@ def test_ascii_encode(resp_mock, mock):
         "body": "HeyHey".encode('utf-8')
     }
 
-    resources.make_request("GET", "http://www.example.com", data=data)
+    resources.make_request("GET", "http://www.example.com", data=data,
+                           transport=Httplib2Transport())
 
     http.request.assert_called_with("http://www.example.com", "GET",
                                     headers=None, body="body=HeyHey")
@@ -30,7 +32,8 @@ def test_ascii(resp_mock, mock):
         "body": "HeyHey"
     }
 
-    resources.make_request("GET", "http://www.example.com", data=data)
+    resources.make_request("GET", "http://www.example.com", data=data,
+                           transport=Httplib2Transport())
 
     http.request.assert_called_with("http://www.example.com", "GET",
                                     headers=None, body="body=HeyHey")
@@ -48,7 +51,8 @@ def test_double_encoding(resp_mock, mock):
         "body": body.encode('utf-8'),
     }
 
-    resources.make_request("GET", "http://www.example.com", data=data)
+    resources.make_request("GET", "http://www.example.com", data=data,
+                           transport=Httplib2Transport())
 
     http.request.assert_called_with("http://www.example.com", "GET",
                                     headers=None, body="body=Chlo%C3%A9%C3%B1")
@@ -64,7 +68,8 @@ def test_paging(resp_mock, mock):
         "body": u('Chlo\xe9\xf1'),
     }
 
-    resources.make_request("GET", "http://www.example.com", data=data)
+    resources.make_request("GET", "http://www.example.com", data=data,
+                           transport=Httplib2Transport())
 
     http.request.assert_called_with("http://www.example.com", "GET",
                                     headers=None, body="body=Chlo%C3%A9%C3%B1")
@@ -80,7 +85,8 @@ def test_unicode_sequence_form_value(resp_mock, mock):
         "body": [u('\xe5'), u('\xe7')],
     }
 
-    resources.make_request("POST", "http://www.example.com", data=data)
+    resources.make_request("POST", "http://www.example.com", data=data,
+                           transport=Httplib2Transport())
 
     http.request.assert_called_with(
         "http://www.example.com",
@@ -6,4 +6,5 @@ def create_mock_json(path):
     with open(path) as f:
         resp = Mock()
         resp.content = f.read()
+        resp.raw = resp.content.encode('utf-8')
         return resp
@@ -0,0 +1,77 @@
+""" Pluggable JSON encoding and decoding
+
+Every JSON document the library reads or writes goes through a codec: an
+object with ``loads`` and ``dumps`` methods. The default codec uses the
+standard library; set a faster one for the whole library with
+:func:`set_json_codec`, or for a single REST client with its ``json_codec``
+argument.
+"""
+from six import binary_type
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+
+class JsonCodec(object):
+    """
+    The default codec, built on the standard library :mod:`json` module.
+
+    Subclass it to plug in a faster library:
+
+    .. code-block:: python
+
+        import orjson
+
+        class OrjsonCodec(JsonCodec):
+
+            def loads(self, data):
+                return orjson.loads(data)
+
+            def dumps(self, obj, **kwargs):
+                if kwargs:
+                    # Formatting options only the standard library knows
+                    return super(OrjsonCodec, self).dumps(obj, **kwargs)
+                return orjson.dumps(obj).decode('utf-8')
+    """
+
+    def loads(self, data):
+        """
+        Decode a JSON document
+
+        :param data: The document, as UTF-8 encoded bytes or as text
+        """
+        if isinstance(data, binary_type):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def dumps(self, obj, **kwargs):
+        """
+        Encode ``obj`` as a JSON document
+
+        :param kwargs: Options understood by :func:`json.dumps`, such as
+            ``sort_keys`` or ``default``
+        :return: the document, as text
+        """
+        return json.dumps(obj, **kwargs)
+
+
+_json_codec = JsonCodec()
+
+
+def get_json_codec():
+    """ Return the codec used by default throughout the library """
+    return _json_codec
+
+
+def set_json_codec(codec):
+    """
+    Replace the codec used by default throughout the library, for parsing
+    API responses as well as for encoding JWTs and TaskRouter workflow
+    configurations
+
+    :param codec: A :class:`JsonCodec`, or None to restore the default
+    """
+    global _json_codec
+    _json_codec = codec if codec is not None else JsonCodec()
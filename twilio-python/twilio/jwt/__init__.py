@@ -8,16 +8,13 @@ import hashlib
 import hmac
 from six import text_type, b
 
+from twilio.json_codec import get_json_codec
+
 
 # default text to binary representation conversion
 def binary(txt):
     return txt.encode('utf-8')
 
-try:
-    import json
-except ImportError:
-    import simplejson as json
-
 
 __all__ = ['encode', 'decode', 'DecodeError']
 
@@ -42,12 +39,13 @@ def base64url_encode(input):
 
 
 def encode(payload, key, algorithm='HS256', headers=None):
+    codec = get_json_codec()
     segments = []
     header = {"typ": "JWT", "alg": algorithm}
     if headers:
         header.update(headers)
-    segments.append(base64url_encode(binary(json.dumps(header))))
-    segments.append(base64url_encode(binary(json.dumps(payload))))
+    segments.append(base64url_encode(binary(codec.dumps(header))))
+    segments.append(base64url_encode(binary(codec.dumps(payload))))
     sign_input = '.'.join(segments)
     try:
         signature = signing_methods[algorithm](binary(sign_input), binary(key))
@@ -66,8 +64,8 @@ def decode(jwt, key='', verify=True):
     try:
         header_raw = base64url_decode(binary(header_segment)).decode('utf-8')
         payload_raw = base64url_decode(binary(payload_segment)).decode('utf-8')
-        header = json.loads(header_raw)
-        payload = json.loads(payload_raw)
+        header = get_json_codec().loads(header_raw)
+        payload = get_json_codec().loads(payload_raw)
         signature = base64url_decode(binary(crypto_segment))
     except (ValueError, TypeError):
         raise DecodeError("Invalid segment encoding")
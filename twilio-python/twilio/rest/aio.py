@@ -0,0 +1,126 @@
+"""
+asyncio versions of the Twilio REST clients. Requires Python 3.5 or later
+and `aiohttp <https://aiohttp.readthedocs.io>`_.
+
+Every resource of these clients works like its synchronous counterpart,
+except that the methods which talk to the API are coroutines and ``iter``
+returns an asynchronous iterator:
+
+.. code-block:: python
+
+    client = AsyncTwilioRestClient(ACCOUNT_SID, AUTH_TOKEN)
+    message = await client.messages.create(to=TO, from_=FROM, body="Hi")
+    async for call in client.calls.iter(status="completed"):
+        print(call.sid)
+"""
+from twilio.exceptions import TwilioException
+from twilio.rest.client import TwilioRestClient
+from twilio.rest.ip_messaging import TwilioIpMessagingClient
+from twilio.rest.lookups import TwilioLookupsClient
+from twilio.rest.monitor import TwilioMonitorClient
+from twilio.rest.pricing import TwilioPricingClient
+from twilio.rest.resources.aio import (
+    AiohttpTransport,
+    AsyncTransport,
+    async_resource_class,
+    get_default_async_transport,
+)
+from twilio.rest.task_router import TwilioTaskRouterClient
+from twilio.rest.trunking import TwilioTrunkingClient
+
+
+class AsyncTwilioClientMixin(object):
+    """
+    Makes a client build coroutine based resources, sending their requests
+    over an :class:`~twilio.rest.resources.aio.AsyncTransport`.
+
+    Accepts the same arguments as the client it is mixed into. ``pool_size``
+    and ``transport`` must be passed by keyword.
+    """
+
+    asynchronous = True
+
+    def __init__(self, *args, **kwargs):
+        self.owns_transport = False
+        if kwargs.get('transport') is None:
+            pool_size = kwargs.get('pool_size')
+            if pool_size is None:
+                kwargs['transport'] = get_default_async_transport()
+            else:
+                kwargs['transport'] = AiohttpTransport(pool_size=pool_size)
+                self.owns_transport = True
+        super(AsyncTwilioClientMixin, self).__init__(*args, **kwargs)
+
+    def resource_class(self, cls):
+        return async_resource_class(cls)
+
+    def request(self, path, method=None, vars=None):
+        raise TwilioException("request is not supported by asyncio clients")
+
+    async def close(self):
+        """
+        Close the connections held by this client, if it created its own
+        transport. Shared and user supplied transports are left open.
+        """
+        if self.owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+class AsyncTwilioRestClient(AsyncTwilioClientMixin, TwilioRestClient):
+    """
+    A client for accessing the Twilio REST API from asyncio code. See
+    :class:`~twilio.rest.TwilioRestClient` for its arguments.
+    """
+
+
+class AsyncTwilioIpMessagingClient(AsyncTwilioClientMixin,
+                                   TwilioIpMessagingClient):
+    """
+    A client for accessing the Twilio IP Messaging API from asyncio code.
+    See :class:`~twilio.rest.TwilioIpMessagingClient` for its arguments.
+    """
+
+
+class AsyncTwilioLookupsClient(AsyncTwilioClientMixin, TwilioLookupsClient):
+    """
+    A client for accessing the Twilio Lookups API from asyncio code. See
+    :class:`~twilio.rest.TwilioLookupsClient` for its arguments.
+    """
+
+
+class AsyncTwilioMonitorClient(AsyncTwilioClientMixin, TwilioMonitorClient):
+    """
+    A client for accessing the Twilio Monitor API from asyncio code. See
+    :class:`~twilio.rest.monitor.TwilioMonitorClient` for its arguments.
+    """
+
+
+class AsyncTwilioPricingClient(AsyncTwilioClientMixin, TwilioPricingClient):
+    """
+    A client for accessing the Twilio Pricing API from asyncio code. See
+    :class:`~twilio.rest.TwilioPricingClient` for its arguments.
+    """
+
+
+class AsyncTwilioTaskRouterClient(AsyncTwilioClientMixin,
+                                  TwilioTaskRouterClient):
+    """
+    A client for accessing the Twilio TaskRouter API from asyncio code. See
+    :class:`~twilio.rest.TwilioTaskRouterClient` for its arguments.
+    """
+
+
+class AsyncTwilioTrunkingClient(AsyncTwilioClientMixin, TwilioTrunkingClient):
+    """
+    A client for accessing the Twilio Trunking API from asyncio code. See
+    :class:`~twilio.rest.TwilioTrunkingClient` for its arguments.
+    """
+
+
+_hush_pyflakes = [AsyncTransport]
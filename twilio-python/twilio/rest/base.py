@@ -5,7 +5,17 @@ import os
 from twilio.exceptions import TwilioException
 from twilio.rest.resources import Connection
 from twilio.rest.resources import UNSET_TIMEOUT
-from twilio.rest.resources import make_request
+from twilio.rest.resources import basic_auth_header, make_request
+from twilio.rest.resources.base import response_size
+from twilio.rest.resources.conditional import ConditionalCache
+from twilio.rest.resources.hooks import Hooks, RequestInfo
+from twilio.rest.resources.request_log import DEFAULT_REQUEST_LOGGER
+from twilio.rest.resources.retry import RetryPolicy
+from twilio.rest.resources.single_flight import SingleFlight
+from twilio.rest.resources.transport import (
+    Httplib2Transport,
+    get_default_transport,
+)
 from twilio.version import __version__ as LIBRARY_VERSION
 
 
@@ -29,11 +39,61 @@ def set_twilio_proxy(proxy_url, proxy_port):
 
 
 class TwilioClient(object):
+
+    # Whether resources of this client return coroutines
+    asynchronous = False
+
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
                  version="2010-04-01", timeout=UNSET_TIMEOUT,
-                 request_account=None):
+                 request_account=None, pool_size=None, preemptive_auth=False,
+                 transport=None, retry_policy=None, rate_limiter=None,
+                 json_codec=None, metrics=None, tracer=None,
+                 request_logger=None, conditional_cache=None,
+                 response_cache=None, single_flight=None):
         """
         Create a Twilio API client.
+
+        :param int pool_size: The number of idle connections to keep open to
+            each Twilio host. By default every client shares one pool.
+        :param bool preemptive_auth: Send the Authorization header with every
+            request instead of waiting for the API to answer with a 401
+            challenge. This saves a round trip (and re-sending the body) on
+            every call.
+        :param transport: The
+            :class:`~twilio.rest.resources.transport.Transport` to send
+            requests over. Takes precedence over ``pool_size``.
+        :param retry_policy: The
+            :class:`~twilio.rest.resources.retry.RetryPolicy` deciding which
+            failed requests are sent again. By default GET and DELETE
+            requests are retried up to twice on 429 and 5xx responses.
+        :param rate_limiter: A
+            :class:`~twilio.rest.resources.rate_limit.RateLimiter` to pace
+            requests with. Can be shared between clients.
+        :param json_codec: The :class:`~twilio.json_codec.JsonCodec` to
+            decode responses with. Defaults to the library-wide codec, see
+            :func:`~twilio.json_codec.set_json_codec`.
+        :param metrics: A
+            :class:`~twilio.rest.resources.metrics.MetricsRegistry` to record
+            every request this client sends in
+        :param tracer: A :class:`~twilio.rest.resources.tracing.Tracer` to
+            open spans with around API calls and paging loops
+        :param request_logger: The
+            :class:`~twilio.rest.resources.request_log.RequestLogger` to log
+            requests with. By default each request is logged to the
+            ``twilio`` logger at DEBUG level.
+        :param conditional_cache: The
+            :class:`~twilio.rest.resources.conditional.ConditionalCache` that
+            remembers responses to fetches of instances and pages, to send
+            the next fetch of the same one as a conditional request. The
+            default one keeps up to 4 MB of response bodies.
+        :param response_cache: A
+            :class:`~twilio.rest.resources.response_cache.ResponseCache` to
+            answer GET requests for rarely changing resources from. Off by
+            default.
+        :param single_flight: The
+            :class:`~twilio.rest.resources.single_flight.SingleFlight` that
+            lets concurrent identical GET requests share one response.
+            Defaults to one for this client alone.
         """
 
         # Get account credentials
@@ -58,10 +118,60 @@ values from your Twilio Account at https://www.twilio.com/user/account.
         self.base = base
         self.auth = (account, token)
         self.timeout = timeout
+        if preemptive_auth:
+            self.auth_header = basic_auth_header(account, token)
+        else:
+            self.auth_header = None
+        if transport is not None:
+            self.transport = transport
+        elif pool_size is None:
+            self.transport = get_default_transport()
+        else:
+            self.transport = Httplib2Transport(pool_size=pool_size)
+        if retry_policy is None:
+            self.retry_policy = RetryPolicy()
+        else:
+            self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        if conditional_cache is None:
+            self.conditional_cache = ConditionalCache()
+        else:
+            self.conditional_cache = conditional_cache
+        self.response_cache = response_cache
+        if single_flight is None:
+            self.single_flight = SingleFlight()
+        else:
+            self.single_flight = single_flight
+        self.json_codec = json_codec
+        self.hooks = Hooks()
+        self.tracer = tracer
+        if metrics is not None:
+            metrics.instrument(self)
+        if request_logger is None:
+            request_logger = DEFAULT_REQUEST_LOGGER
+        request_logger.instrument(self)
         req_account = request_account if request_account else account
         self.account_uri = "{0}/{1}/Accounts/{2}".format(base,
                                                          version, req_account)
 
+    def warm_up(self, connections=1):
+        """
+        Open connections to this client's API host ahead of the first
+        request, so that it doesn't pay for the DNS lookup and the TCP and
+        TLS handshakes. Call this at startup. Connections that can't be
+        opened are logged and left to be opened by the first requests.
+
+        :param int connections: The number of connections to open, up to
+            the transport's pool size
+        :return: the number of connections opened. Asyncio clients return a
+            coroutine.
+        """
+        if self.timeout is UNSET_TIMEOUT:
+            timeout = None
+        else:
+            timeout = self.timeout
+        return self.transport.warm_up(self.base, connections, timeout)
+
     def request(self, path, method=None, vars=None):
         """sends a request and gets a response from the Twilio REST API
 
@@ -111,7 +221,26 @@ values from your Twilio Account at https://www.twilio.com/user/account.
             "Accept-Charset": "utf-8",
         }
 
-        resp = make_request(method, uri, auth=self.auth, data=data,
-                            params=params, headers=headers)
+        auth = self.auth
+        if self.auth_header is not None:
+            headers["Authorization"] = self.auth_header
+            auth = None
+
+        info = RequestInfo(method, uri, data=data)
+        info.begin_attempt()
+        self.hooks.fire('before_request', info)
+
+        try:
+            resp = make_request(method, uri, auth=auth, data=data,
+                                params=params, headers=headers,
+                                transport=self.transport)
+        except Exception as e:
+            info.failed(e)
+            self.hooks.fire('on_error', info)
+            raise
+
+        info.received(resp.status_code, response_size(resp), resp)
+        info.finish()
+        self.hooks.fire('after_response', info)
 
         return resp.content
@@ -39,46 +39,61 @@ class TwilioRestClient(TwilioClient):
     :param str token: Your Auth Token from `your dashboard
         <https://twilio.com/user/account>`_
     :param float timeout: The socket and read timeout for requests to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None, base="https://api.twilio.com",
                  version="2010-04-01", timeout=UNSET_TIMEOUT,
-                 request_account=None):
+                 request_account=None, **kwargs):
         """
         Create a Twilio REST API client.
         """
         super(TwilioRestClient, self).__init__(account, token, base, version,
-                                               timeout, request_account)
+                                               timeout, request_account,
+                                               **kwargs)
 
         version_uri = "%s/%s" % (base, version)
 
-        self.accounts = Accounts(version_uri, self.auth, timeout)
-        self.applications = Applications(self.account_uri, self.auth, timeout)
+        self.accounts = Accounts(version_uri, self.auth, timeout, client=self)
+        self.applications = Applications(self.account_uri, self.auth, timeout,
+                                         client=self)
         self.authorized_connect_apps = AuthorizedConnectApps(
             self.account_uri,
             self.auth,
-            timeout
+            timeout,
+            client=self,
         )
-        self.addresses = Addresses(self.account_uri, self.auth, timeout)
-        self.calls = Calls(self.account_uri, self.auth, timeout)
-        self.caller_ids = CallerIds(self.account_uri, self.auth, timeout)
-        self.connect_apps = ConnectApps(self.account_uri, self.auth, timeout)
+        self.addresses = Addresses(self.account_uri, self.auth, timeout,
+                                   client=self)
+        self.calls = Calls(self.account_uri, self.auth, timeout, client=self)
+        self.caller_ids = CallerIds(self.account_uri, self.auth, timeout,
+                                    client=self)
+        self.connect_apps = ConnectApps(self.account_uri, self.auth, timeout,
+                                        client=self)
         self.notifications = Notifications(self.account_uri, self.auth,
-                                           timeout)
-        self.recordings = Recordings(self.account_uri, self.auth, timeout)
+                                           timeout, client=self)
+        self.recordings = Recordings(self.account_uri, self.auth, timeout,
+                                     client=self)
         self.transcriptions = Transcriptions(self.account_uri, self.auth,
-                                             timeout)
-        self.sms = Sms(self.account_uri, self.auth, timeout)
-        self.phone_numbers = PhoneNumbers(self.account_uri, self.auth, timeout)
-        self.conferences = Conferences(self.account_uri, self.auth, timeout)
-        self.queues = Queues(self.account_uri, self.auth, timeout)
-        self.sandboxes = Sandboxes(self.account_uri, self.auth, timeout)
-        self.usage = Usage(self.account_uri, self.auth, timeout)
-        self.messages = Messages(self.account_uri, self.auth, timeout)
-        self.media = MediaList(self.account_uri, self.auth, timeout)
-        self.sip = Sip(self.account_uri, self.auth, timeout)
-        self.tokens = Tokens(self.account_uri, self.auth, timeout)
-        self.keys = Keys(self.account_uri, self.auth, timeout)
+                                             timeout, client=self)
+        self.sms = Sms(self.account_uri, self.auth, timeout, client=self)
+        self.phone_numbers = PhoneNumbers(self.account_uri, self.auth, timeout,
+                                          client=self)
+        self.conferences = Conferences(self.account_uri, self.auth, timeout,
+                                       client=self)
+        self.queues = Queues(self.account_uri, self.auth, timeout, client=self)
+        self.sandboxes = Sandboxes(self.account_uri, self.auth, timeout,
+                                   client=self)
+        self.usage = Usage(self.account_uri, self.auth, timeout, client=self)
+        self.messages = Messages(self.account_uri, self.auth, timeout,
+                                 client=self)
+        self.media = MediaList(self.account_uri, self.auth, timeout,
+                               client=self)
+        self.sip = Sip(self.account_uri, self.auth, timeout, client=self)
+        self.tokens = Tokens(self.account_uri, self.auth, timeout, client=self)
+        self.keys = Keys(self.account_uri, self.auth, timeout, client=self)
 
     def participants(self, conference_sid):
         """
@@ -86,7 +101,7 @@ class TwilioRestClient(TwilioClient):
         :class:`~twilio.rest.resources.Conference` with given conference_sid
         """
         base_uri = "%s/Conferences/%s" % (self.account_uri, conference_sid)
-        return Participants(base_uri, self.auth, self.timeout)
+        return Participants(base_uri, self.auth, self.timeout, client=self)
 
     def members(self, queue_sid):
         """
@@ -95,7 +110,7 @@ class TwilioRestClient(TwilioClient):
         given queue_sid
         """
         base_uri = "%s/Queues/%s" % (self.account_uri, queue_sid)
-        return Members(base_uri, self.auth, self.timeout)
+        return Members(base_uri, self.auth, self.timeout, client=self)
 
     def feedback(self, call_sid):
         """
@@ -107,7 +122,8 @@ class TwilioRestClient(TwilioClient):
         call_feedback_list = CallFeedbackFactory(
             base_uri,
             self.auth,
-            self.timeout
+            self.timeout,
+            client=self,
         )
         return CallFeedback(call_feedback_list)
 
@@ -119,4 +135,5 @@ class TwilioRestClient(TwilioClient):
         address_sid
         """
         base_uri = "%s/Addresses/%s" % (self.account_uri, address_sid)
-        return DependentPhoneNumbers(base_uri, self.auth, self.timeout)
+        return DependentPhoneNumbers(base_uri, self.auth, self.timeout,
+                                     client=self)
@@ -18,14 +18,17 @@ class TwilioRestException(TwilioException):
     :param str method: The HTTP method used to make the request
     :param int|None code: A Twilio-specific error code for the error. This is
          not available for all errors.
+    :param headers: The headers of the error response, if there was one
     """
 
-    def __init__(self, status, uri, msg="", code=None, method='GET'):
+    def __init__(self, status, uri, msg="", code=None, method='GET',
+                 headers=None):
         self.uri = uri
         self.status = status
         self.msg = msg
         self.code = code
         self.method = method
+        self.headers = headers
 
     def __str__(self):
         """ Try to pretty-print the exception, if this is going on screen. """
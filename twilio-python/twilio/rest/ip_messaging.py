@@ -17,16 +17,22 @@ class TwilioIpMessagingClient(TwilioClient):
     :param str token: Your Auth Token from `your dashboard
         <https://www.twilio.com/user/account>`_
     :param float timeout: The socket and read timeout for requests to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None,
                  base="https://ip-messaging.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None, **kwargs):
 
         super(TwilioIpMessagingClient, self).__init__(account, token, base,
                                                       version, timeout,
-                                                      request_account)
+                                                      request_account,
+                                                      **kwargs)
 
         self.version_uri = "%s/%s" % (base, version)
-        self.services = Services(self.version_uri, self.auth, timeout)
-        self.credentials = Credentials(self.version_uri, self.auth, timeout)
+        self.services = Services(self.version_uri, self.auth, timeout,
+                                 client=self)
+        self.credentials = Credentials(self.version_uri, self.auth, timeout,
+                                       client=self)
@@ -16,15 +16,19 @@ class TwilioLookupsClient(TwilioClient):
     :param str token: Your Auth Token from `your dashboard
         <https://www.twilio.com/user/account>`_
     :param float timeout: The socket and read timeout for requests to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None,
                  base="https://lookups.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None, **kwargs):
 
         super(TwilioLookupsClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account, **kwargs)
 
         self.version_uri = "%s/%s" % (base, version)
-        self.phone_numbers = PhoneNumbers(self.version_uri, self.auth, timeout)
+        self.phone_numbers = PhoneNumbers(self.version_uri, self.auth, timeout,
+                                          client=self)
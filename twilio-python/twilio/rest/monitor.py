@@ -17,16 +17,19 @@ class TwilioMonitorClient(TwilioClient):
     :param str token: Your Auth Token from `your dashboard
         <https://www.twilio.com/user/account>`_
     :param float timeout: The socket and read timeout for requests to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None,
                  base="https://monitor.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None, **kwargs):
 
         super(TwilioMonitorClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account, **kwargs)
 
         self.version_uri = "%s/%s" % (base, version)
-        self.events = Events(self.version_uri, self.auth, timeout)
-        self.alerts = Alerts(self.version_uri, self.auth, timeout)
+        self.events = Events(self.version_uri, self.auth, timeout, client=self)
+        self.alerts = Alerts(self.version_uri, self.auth, timeout, client=self)
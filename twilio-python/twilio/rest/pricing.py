@@ -17,20 +17,23 @@ class TwilioPricingClient(TwilioClient):
         <https://twilio.com/user_account>`_
     :param float timeout: The socket connect and read timeout for requests
     to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None,
                  base="https://pricing.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None, **kwargs):
         super(TwilioPricingClient, self).__init__(account, token, base,
                                                   version, timeout,
-                                                  request_account)
+                                                  request_account, **kwargs)
 
         self.uri_base = "{}/{}".format(base, version)
 
-        self.voice = Voice(self.uri_base, self.auth, self.timeout)
+        self.voice = Voice(self.uri_base, self.auth, self.timeout, client=self)
         self.phone_numbers = PhoneNumbers(self.uri_base, self.auth,
-                                          self.timeout)
+                                          self.timeout, client=self)
 
     def messaging_countries(self):
         """
@@ -40,4 +43,4 @@ class TwilioPricingClient(TwilioClient):
         messaging_countries_uri = "{0}/Messaging".format(
             self.uri_base)
         return MessagingCountries(messaging_countries_uri, self.auth,
-                                  self.timeout)
+                                  self.timeout, client=self)
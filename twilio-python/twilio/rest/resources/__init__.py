@@ -1,6 +1,6 @@
 from .util import (
     transform_params, format_name, parse_date, convert_boolean, convert_case,
-    convert_keys, normalize_dates, UNSET_TIMEOUT
+    convert_keys, normalize_dates, basic_auth_header, UNSET_TIMEOUT
 )
 from .base import (
     Response, Resource, InstanceResource, ListResource,
@@ -24,6 +24,21 @@ from .call_feedback import (
     CallFeedbackSummaryInstance
 )
 from .connection import Connection
+from .transport import Transport, Httplib2Transport, Urllib3Transport
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .bulk import BulkReport, BulkResult
+from .conditional import ConditionalCache
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
+from .sync import (
+    CheckpointStore, FileCheckpointStore, MemoryCheckpointStore
+)
+from .hooks import Hooks, RequestInfo
+from .metrics import MetricsRegistry
+from .request_log import RequestLogger
+from .mirror import Mirror
+from .rows import Row
 from .sandboxes import Sandbox, Sandboxes
 from .sms_messages import (
     Sms, SmsMessage, SmsMessages, ShortCode, ShortCodes)
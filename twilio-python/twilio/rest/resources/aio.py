@@ -0,0 +1,528 @@
+"""
+Coroutine based versions of the REST resources, used by the clients in
+:mod:`twilio.rest.aio`. Requires Python 3.5 or later.
+"""
+import asyncio
+import ssl
+import threading
+
+from ...exceptions import TwilioException
+from ..exceptions import TwilioRestException
+from .base import (
+    InstanceResource,
+    ListResource,
+    Response,
+    add_query_params,
+    check_twilio_response,
+    encode_data,
+    prepare_twilio_request,
+    response_size,
+)
+from .conditional import copy_body
+from .connection import Connection
+from .hooks import RequestInfo
+from .imports import aiohttp, PROXY_TYPE_HTTP
+from .rate_limit import _clock
+from .transport import (
+    DEFAULT_MAX_REDIRECTS,
+    DEFAULT_POOL_SIZE,
+    _warm_up_failed,
+    get_cert_file,
+)
+from .util import transform_params
+
+
+class AsyncTransport(object):
+    """
+    The asyncio counterpart of
+    :class:`~twilio.rest.resources.transport.Transport`.
+
+    :meth:`request` and :meth:`close` are coroutines, otherwise the interface
+    is the same.
+    """
+
+    async def request(self, method, url, body=None, headers=None,
+                      timeout=None, auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request
+
+        :param str method: The HTTP method to use
+        :param str url: The full URL, including the query string
+        :param str body: The encoded request body, or None
+        :param dict headers: HTTP headers to send with the request
+        :param float timeout: Socket/Read timeout for the request
+        :param tuple auth: A (username, password) pair for Basic auth
+        :param bool allow_redirects: Whether to follow redirects
+
+        :return: a tuple of the integer status code, a mapping of lower-cased
+            response header names to values and the response body as bytes
+        """
+        raise NotImplementedError
+
+    async def warm_up(self, url, connections=1, timeout=None):
+        """
+        Open connections to the host of ``url`` ahead of the first request.
+        See :meth:`~twilio.rest.resources.transport.Transport.warm_up`.
+
+        The HEAD requests are sent concurrently, so each one opens a
+        connection of its own.
+        """
+        results = await asyncio.gather(
+            *[self.request("HEAD", url, timeout=timeout)
+              for _ in range(connections)],
+            return_exceptions=True
+        )
+
+        opened = 0
+        for result in results:
+            if isinstance(result, Exception):
+                _warm_up_failed(url, result)
+            else:
+                opened += 1
+        return opened
+
+    async def close(self):
+        """ Release any connections held by this transport """
+        pass
+
+    def pool_stats(self):
+        """
+        Count this transport's connections. See
+        :meth:`~twilio.rest.resources.transport.Transport.pool_stats`.
+        """
+        return {}
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Sends requests through an :class:`aiohttp.ClientSession`.
+
+    The session keeps up to ``pool_size`` connections open to every host and
+    is shared by every coroutine using the transport. It is created on first
+    use and bound to the event loop running at the time; using the transport
+    from another loop opens a new session. Credentials are always sent with
+    the first request.
+
+    aiohttp is not installed with this library; install it separately to use
+    this transport. SOCKS proxies are not supported.
+
+    :param int pool_size: The number of connections to keep open per host
+    :param str ca_certs: Path to a CA bundle. Defaults to the bundle shipped
+        with this library.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, ca_certs=None):
+        if aiohttp is None:
+            raise TwilioException("AiohttpTransport requires aiohttp. "
+                                  "Install it with 'pip install aiohttp'.")
+
+        self.pool_size = pool_size
+        self.ca_certs = ca_certs or get_cert_file()
+        self._session = None
+        self._loop = None
+
+    async def request(self, method, url, body=None, headers=None,
+                      timeout=None, auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request. See :meth:`AsyncTransport.request`.
+        """
+        kwargs = {}
+        if auth is not None:
+            kwargs["auth"] = aiohttp.BasicAuth(auth[0], auth[1])
+
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        if allow_redirects:
+            kwargs["max_redirects"] = DEFAULT_MAX_REDIRECTS
+
+        proxy_info = Connection.proxy_info()
+        if proxy_info is not None:
+            kwargs["proxy"] = self._proxy_url(proxy_info)
+
+        session = self._get_session()
+        async with session.request(method, url, data=body, headers=headers,
+                                   allow_redirects=allow_redirects,
+                                   **kwargs) as resp:
+            content = await resp.read()
+            resp_headers = dict((k.lower(), v)
+                                for k, v in resp.headers.items())
+            return resp.status, resp_headers, content
+
+    async def close(self):
+        """ Close every connection held by this transport """
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    def _get_session(self):
+        loop = asyncio.get_event_loop()
+        if (self._session is None or self._session.closed or
+                self._loop is not loop):
+            context = ssl.create_default_context(cafile=self.ca_certs)
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size,
+                                             ssl=context)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    def _proxy_url(self, proxy_info):
+        if proxy_info.proxy_type != PROXY_TYPE_HTTP:
+            raise TwilioException("AiohttpTransport only supports HTTP "
+                                  "proxies")
+
+        if proxy_info.proxy_user:
+            userinfo = "%s:%s@" % (proxy_info.proxy_user,
+                                   proxy_info.proxy_pass)
+        else:
+            userinfo = ""
+
+        return "http://%s%s:%s" % (userinfo, proxy_info.proxy_host,
+                                   proxy_info.proxy_port)
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_async_transport():
+    """
+    Return the transport shared by every asyncio client that doesn't have its
+    own transport
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = AiohttpTransport()
+        return _default_transport
+
+
+async def make_async_request(method, url, params=None, data=None,
+                             headers=None, auth=None, timeout=None,
+                             allow_redirects=False, transport=None):
+    """
+    Send an HTTP request without blocking the event loop. Takes the same
+    arguments as :func:`~twilio.rest.resources.base.make_request`, except
+    that ``transport`` is an :class:`AsyncTransport`.
+
+    :rtype: :class:`~twilio.rest.resources.base.Response`
+    """
+    if transport is None:
+        transport = get_default_async_transport()
+
+    if data is not None:
+        data = encode_data(data)
+
+    if params is not None:
+        url = add_query_params(url, params)
+
+    status, resp_headers, content = await transport.request(
+        method, url, body=data, headers=headers, timeout=timeout, auth=auth,
+        allow_redirects=allow_redirects,
+    )
+
+    return Response(status, resp_headers, content, url)
+
+
+async def make_async_twilio_request(method, uri, **kwargs):
+    """
+    Make a request to Twilio without blocking the event loop
+
+    :rtype: :class:`~twilio.rest.resources.base.Response`
+    :raises TwilioRestException: if the response is a 400
+        or 500-level response.
+    """
+    uri = prepare_twilio_request(method, uri, kwargs)
+    resp = await make_async_request(method, uri, **kwargs)
+    check_twilio_response(method, resp)
+    return resp
+
+
+class _AsyncCall(object):
+
+    def __init__(self):
+        self.future = asyncio.get_event_loop().create_future()
+        self.followers = 0
+
+
+async def share_flight(flight, key, coro_fn):
+    """
+    The asyncio counterpart of
+    :meth:`~twilio.rest.resources.single_flight.SingleFlight.do`: await
+    ``coro_fn()``, unless an identical call is already in flight on this
+    event loop, in which case wait for that one
+    """
+    key = (asyncio.get_event_loop(), key)
+    call, leader = flight._join(key, _AsyncCall)
+    if not leader:
+        # A cancelled caller mustn't cancel the request the others wait for
+        result = await asyncio.shield(call.future)
+        return result, True
+
+    try:
+        result = await coro_fn()
+    except BaseException as e:
+        flight._leave(key)
+        if call.followers:
+            if isinstance(e, Exception):
+                call.future.set_exception(e)
+            else:
+                call.future.cancel()
+        raise
+
+    flight._leave(key)
+    if call.followers:
+        call.future.set_result(result)
+    return result, call.followers > 0
+
+
+class AsyncResourceMixin(object):
+    """ Sends a resource's requests without blocking the event loop """
+
+    async def request(self, method, uri, parent=None, **kwargs):
+        """
+        Send an HTTP request to the resource.
+
+        :param parent: The span to open the request's span under
+        :raises: a :exc:`~twilio.TwilioRestException`
+        """
+        cache = self._response_cache
+        if method != "GET":
+            if cache is None:
+                return await self._send(method, uri, kwargs, parent=parent)
+            try:
+                return await self._send(method, uri, kwargs, parent=parent)
+            finally:
+                cache.invalidate(uri, self.uri)
+
+        if cache is not None:
+            cached = cache.get(self, uri, kwargs)
+            if cached is not None:
+                return cached
+
+        flight = self._single_flight
+        if flight is None:
+            resp, body = await self._send(method, uri, kwargs, parent=parent)
+        else:
+            (resp, body), shared = await share_flight(
+                flight, flight.key(self, uri, kwargs),
+                lambda: self._send(method, uri, kwargs, parent=parent),
+            )
+            if shared:
+                body = copy_body(body)
+
+        if cache is not None:
+            cache.put(self, uri, kwargs, resp, body)
+        return resp, body
+
+    async def _request_then(self, fn, method, uri, **kwargs):
+        return fn(*(await self.request(method, uri, **kwargs)))
+
+    async def _send(self, method, uri, kwargs, parse=True, parent=None):
+        hooks = self._hooks
+        info = RequestInfo(method, uri, self.__class__, kwargs.get('data'))
+        span = self._start_request_span(info, parent)
+        auth = self._prepare_request(kwargs)
+
+        while True:
+            delay = self._reserve_rate_limit(kwargs)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            info.begin_attempt(delay)
+            hooks.fire('before_request', info)
+
+            try:
+                resp = await make_async_twilio_request(method, uri,
+                                                       auth=auth, **kwargs)
+            except Exception as e:
+                info.failed(e)
+                delay = self._get_retry_delay(method, e, info.attempt)
+                if delay is None:
+                    hooks.fire('on_error', info)
+                    self._end_request_span(span, info)
+                    raise
+                info.retrying(delay)
+                hooks.fire('on_retry', info)
+                await asyncio.sleep(delay)
+                continue
+
+            info.received(resp.status_code, response_size(resp), resp)
+            body = None
+            if parse:
+                started = _clock()
+                try:
+                    body = self._parse_response(method, resp)
+                except Exception as e:
+                    info.error = e
+                    hooks.fire('on_error', info)
+                    self._end_request_span(span, info)
+                    raise
+                info.timings['parse'] = _clock() - started
+
+            info.finish()
+            hooks.fire('after_response', info)
+            self._end_request_span(span, info)
+            return resp, body
+
+
+class AsyncListResourceMixin(AsyncResourceMixin):
+    """
+    Turns the operations of a list resource into coroutines, and its
+    :meth:`iter` into an asynchronous iterator
+    """
+
+    async def get_instance(self, sid, **kwargs):
+        uri = "%s/%s" % (self.uri, sid)
+        key, cached = self._make_conditional(uri, kwargs)
+        resp, item = await self.request("GET", uri, **kwargs)
+        item = self._conditional_body(key, cached, resp, item)
+        return self.load_instance(item)
+
+    async def get_instances(self, params):
+        params = dict(params)
+        load = self._loader(rows=params.pop('rows', False),
+                            fields=params.pop('fields', None))
+        kwargs = {'params': transform_params(params)}
+        key, cached = self._make_conditional(self.uri, kwargs)
+        resp, page = await self.request("GET", self.uri, **kwargs)
+        page = self._conditional_body(key, cached, resp, page)
+        return self._load_page(page, load)
+
+    async def get_raw(self, sid):
+        uri = "%s/%s" % (self.uri, sid)
+        resp, _ = await self._send("GET", uri, {}, False)
+        return resp
+
+    async def list_raw(self, **kwargs):
+        kwargs = {'params': transform_params(kwargs)}
+        resp, _ = await self._send("GET", self.uri, kwargs, False)
+        return resp
+
+    # Other coroutines run while these wait for the API, so the operation
+    # spans are handed to the requests rather than made current
+
+    async def create_instance(self, body):
+        with self._trace('create', active=False) as span:
+            resp, instance = await self._send(
+                "POST", self.uri, {'data': transform_params(body)},
+                parent=span)
+
+            if resp.status_code not in (200, 201):
+                raise TwilioRestException(resp.status_code,
+                                          self.uri, "Resource not created")
+
+            return self.load_instance(instance)
+
+    async def delete_instance(self, sid):
+        uri = "%s/%s" % (self.uri, sid)
+        with self._trace('delete', active=False) as span:
+            resp, instance = await self._send("DELETE", uri, {},
+                                              parent=span)
+        return resp.status_code == 204
+
+    async def update_instance(self, sid, body):
+        uri = "%s/%s" % (self.uri, sid)
+        with self._trace('update', active=False) as span:
+            resp, entry = await self._send(
+                "POST", uri, {'data': transform_params(body)}, parent=span)
+            return self.load_instance(entry)
+
+    def _iter_pages(self, uri, kwargs, stream=False, prefetch=0, raw=False,
+                    rows=False, fields=None):
+        # Pages are always read whole; aiohttp already reads them without
+        # blocking the loop
+        if prefetch:
+            raise TwilioException(
+                "prefetch is not supported by asyncio clients")
+        return AsyncPageIterator(self, uri, kwargs,
+                                 self._loader(raw, rows, fields))
+
+
+class AsyncInstanceResourceMixin(AsyncResourceMixin):
+    """ Turns the operations of an instance resource into coroutines """
+
+    async def _refresh(self, instance):
+        instance = await instance
+        self.load(instance.__dict__)
+
+
+class AsyncPageIterator(object):
+    """
+    Iterates over every instance of a list resource with ``async for``,
+    fetching the next page whenever the current one runs out
+    """
+
+    def __init__(self, resource, uri, kwargs, load=None):
+        self.resource = resource
+        self.uri = uri
+        self.kwargs = kwargs
+        self.load = load or resource.load_instance
+        self.items = iter(())
+        self.span = None
+        self._traced = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._traced is None:
+            # The span covers the whole loop, from the first page on
+            self._traced = self.resource._trace('iter', active=False)
+            self.span = self._traced.__enter__()
+
+        try:
+            return await self._next()
+        except StopAsyncIteration:
+            self._traced.__exit__(None, None, None)
+            raise
+        except Exception as e:
+            self._traced.__exit__(type(e), e, e.__traceback__)
+            raise
+
+    async def _next(self):
+        while True:
+            for item in self.items:
+                return self.load(item)
+
+            if not self.uri:
+                raise StopAsyncIteration
+
+            resp, page = await self.resource.request(
+                "GET", self.uri, parent=self.span, **self.kwargs)
+
+            items = self.resource._page_items(page)
+            if items is None:
+                self.uri = None
+                raise StopAsyncIteration
+
+            self.items = iter(items)
+            self.uri, self.kwargs = self.resource._next_page(
+                page, self.uri, self.kwargs)
+
+
+_async_classes = {}
+
+
+def async_resource_class(cls):
+    """
+    Return the asyncio version of the resource class ``cls``, creating it on
+    first use
+    """
+    if issubclass(cls, AsyncResourceMixin):
+        return cls
+
+    try:
+        return _async_classes[cls]
+    except KeyError:
+        pass
+
+    if issubclass(cls, ListResource):
+        mixin = AsyncListResourceMixin
+    elif issubclass(cls, InstanceResource):
+        mixin = AsyncInstanceResourceMixin
+    else:
+        mixin = AsyncResourceMixin
+
+    async_cls = type(cls.__name__, (mixin, cls), {})
+    return _async_classes.setdefault(cls, async_cls)
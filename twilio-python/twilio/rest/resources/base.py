@@ -1,12 +1,9 @@
-import logging
-import os
 import platform
+import time
 
 from six import (
-    integer_types,
     string_types,
     binary_type,
-    iteritems
 )
 from ...compat import urlencode
 from ...compat import urlparse
@@ -14,51 +11,119 @@ from ...compat import urlunparse
 
 from ... import __version__
 from ...exceptions import TwilioException
+from ...json_codec import get_json_codec
 from ..exceptions import TwilioRestException
-from .connection import Connection
-from .imports import parse_qs, httplib2, json
+from .bulk import (
+    BULK_DELETE_RETRY_POLICY,
+    DEFAULT_CONCURRENCY,
+    call_with_retries,
+    check_blocking,
+    map_ordered,
+)
+from .conditional import ConditionalCache, copy_body
+from .export import ExportWriter, export
+from .hooks import NO_HOOKS, RequestInfo
+from .imports import parse_qs, json
+from .prefetch import read_ahead
+from .rate_limit import _clock
+from .retry import retries_suppressed
+from .rows import projector, row_loader
+from .scan import DEFAULT_WINDOW_DAYS, parallel_scan
+from .streaming import PageParser
+from .sync import delta_sync
+from .tracing import activate, current_span, traced
+from .transport import get_cert_file, get_default_transport
 from .util import (
+    basic_auth_header,
+    encode_data,
     parse_iso_date,
     parse_rfc2822_date,
     transform_params,
     UNSET_TIMEOUT,
 )
 
-logger = logging.getLogger('twilio')
-
 
 class Response(object):
     """
-    Take a httplib2 response and turn it into a requests response
+    Take the response returned by a transport and turn it into a requests
+    response
+
+    :param int status: The HTTP status code
+    :param headers: A mapping of lower-cased response header names to values
+    :param bytes raw: The undecoded response body
+    :param str url: The URL that was requested
     """
-    def __init__(self, httplib_resp, content, url):
-        self.content = content
+    def __init__(self, status, headers, raw, url):
+        self.raw = raw
+        self.headers = headers
         self.cached = False
-        self.status_code = int(httplib_resp.status)
+        self.status_code = int(status)
         self.ok = self.status_code < 400
         self.url = url
 
+    @property
+    def content(self):
+        """
+        The body decoded as text. Resources parse :attr:`raw` directly, so
+        this is only worked out when asked for.
+        """
+        return self.raw.decode('utf-8')
 
-def get_cert_file():
-    """ Get the cert file location or bail """
-    # XXX - this currently fails test coverage because we don't actually go
-    # over the network anywhere. Might be good to have a test that stands up a
-    # local server and authenticates against it.
-    try:
-        # Apparently __file__ is not available in all places so wrapping this
-        # in a try/catch
-        current_path = os.path.realpath(__file__)
-        ca_cert_path = os.path.join(current_path, "..", "..", "..",
-                                    "conf", "cacert.pem")
-        return os.path.abspath(ca_cert_path)
-    except Exception:
-        # None means use the default system file
-        return None
+
+class StreamedResponse(Response):
+    """
+    A response whose body is read from the network as it is consumed
+
+    :param int status: The HTTP status code
+    :param headers: A mapping of lower-cased response header names to values
+    :param chunks: An iterator over the body, as bytes
+    :param str url: The URL that was requested
+    """
+    def __init__(self, status, headers, chunks, url):
+        self.chunks = chunks
+        self.headers = headers
+        self.cached = False
+        self.status_code = int(status)
+        self.ok = self.status_code < 400
+        self.url = url
+        self._raw = None
+
+    @property
+    def raw(self):
+        """ The rest of the body, read all at once """
+        if self._raw is None:
+            self._raw = b''.join(self.chunks)
+        return self._raw
+
+
+def response_size(resp):
+    """
+    Return the size of a response's body without reading any more of it, or
+    None if that isn't known yet
+    """
+    if isinstance(resp, StreamedResponse):
+        length = resp.headers.get('content-length')
+        return int(length) if length else None
+    if isinstance(resp.raw, binary_type):
+        return len(resp.raw)
+    return None
+
+
+def add_query_params(url, params):
+    """
+    Append query parameters to a URL, which may already have a query string
+    """
+    enc_params = urlencode(params, doseq=True)
+    if urlparse(url).query:
+        return '%s&%s' % (url, enc_params)
+    else:
+        return '%s?%s' % (url, enc_params)
 
 
 def make_request(method, url, params=None, data=None, headers=None,
                  cookies=None, files=None, auth=None, timeout=None,
-                 allow_redirects=False, proxies=None):
+                 allow_redirects=False, proxies=None, transport=None,
+                 stream=False):
     """Sends an HTTP request
 
     :param str method: The HTTP method to use
@@ -67,6 +132,11 @@ def make_request(method, url, params=None, data=None, headers=None,
     :param dict data: Parameters to go in the body of the HTTP request
     :param dict headers: HTTP Headers to send with the request
     :param float timeout: Socket/Read timeout for the request
+    :param transport: The :class:`~twilio.rest.resources.transport.Transport`
+        to send the request over. Defaults to the transport shared by the
+        whole library.
+    :param bool stream: Return a :class:`StreamedResponse`, whose body is
+        read as it is consumed
 
     :return: An http response
     :rtype: A :class:`Response <models.Response>` object
@@ -75,49 +145,29 @@ def make_request(method, url, params=None, data=None, headers=None,
 
     Currently proxies, files, and cookies are all ignored
     """
-    http = httplib2.Http(
-        timeout=timeout,
-        ca_certs=get_cert_file(),
-        proxy_info=Connection.proxy_info(),
-    )
-    http.follow_redirects = allow_redirects
-
-    if auth is not None:
-        http.add_credentials(auth[0], auth[1])
-
-    def encode_atom(atom):
-            if isinstance(atom, (integer_types, binary_type)):
-                return atom
-            elif isinstance(atom, string_types):
-                return atom.encode('utf-8')
-            else:
-                raise ValueError('list elements should be an integer, '
-                                 'binary, or string')
+    if transport is None:
+        transport = get_default_transport()
 
     if data is not None:
-        udata = {}
-        for k, v in iteritems(data):
-            key = k.encode('utf-8')
-            if isinstance(v, (list, tuple, set)):
-                udata[key] = [encode_atom(x) for x in v]
-            elif isinstance(v, (integer_types, binary_type, string_types)):
-                udata[key] = encode_atom(v)
-            else:
-                raise ValueError('data should be an integer, '
-                                 'binary, or string, or sequence ')
-        data = urlencode(udata, doseq=True)
+        data = encode_data(data)
 
     if params is not None:
-        enc_params = urlencode(params, doseq=True)
-        if urlparse(url).query:
-            url = '%s&%s' % (url, enc_params)
-        else:
-            url = '%s?%s' % (url, enc_params)
+        url = add_query_params(url, params)
 
-    resp, content = http.request(url, method, headers=headers, body=data)
+    if stream:
+        status, resp_headers, chunks = transport.stream(
+            method, url, body=data, headers=headers, timeout=timeout,
+            auth=auth, allow_redirects=allow_redirects,
+        )
+        return StreamedResponse(status, resp_headers, chunks, url)
+
+    status, resp_headers, content = transport.request(
+        method, url, body=data, headers=headers, timeout=timeout, auth=auth,
+        allow_redirects=allow_redirects,
+    )
 
-    # Format httplib2 request as requests object
-    return Response(resp, content.decode('utf-8'), url)
+    # Format transport response as requests object
+    return Response(status, resp_headers, content, url)
 
 
 def make_twilio_request(method, uri, **kwargs):
@@ -129,6 +179,17 @@ def make_twilio_request(method, uri, **kwargs):
     :raises TwilioRestException: if the response is a 400
         or 500-level response.
     """
+    uri = prepare_twilio_request(method, uri, kwargs)
+    resp = make_request(method, uri, **kwargs)
+    check_twilio_response(method, resp)
+    return resp
+
+
+def prepare_twilio_request(method, uri, kwargs):
+    """
+    Add the headers every Twilio request needs to the keyword arguments of a
+    request, and return the URI to send it to
+    """
     headers = kwargs.get("headers", {})
 
     user_agent = "twilio-python/%s (Python %s)" % (
@@ -146,11 +207,20 @@ def make_twilio_request(method, uri, **kwargs):
     if "Accept" not in headers:
         headers["Accept"] = "application/json"
 
+    if "Accept-Encoding" not in headers:
+        headers["Accept-Encoding"] = "gzip, deflate"
+
     if kwargs.pop('use_json_extension', False):
         uri += ".json"
 
-    resp = make_request(method, uri, **kwargs)
+    return uri
+
 
+def check_twilio_response(method, resp):
+    """
+    :raises TwilioRestException: if the response is a 400
+        or 500-level response.
+    """
     if not resp.ok:
         try:
             error = json.loads(resp.content)
@@ -161,21 +231,47 @@ def make_twilio_request(method, uri, **kwargs):
             message = resp.content
 
         raise TwilioRestException(status=resp.status_code, method=method,
-                                  uri=resp.url, msg=message, code=code)
+                                  uri=resp.url, msg=message, code=code,
+                                  headers=resp.headers)
 
-    return resp
+
+def resource_class(cls, client):
+    """
+    Return the class to build a resource of type ``cls`` with. Clients can
+    swap in their own variant of every resource they create, the way the
+    asyncio clients in :mod:`twilio.rest.aio` do.
+    """
+    if getattr(client, 'asynchronous', False) is True:
+        return client.resource_class(cls)
+    return cls
 
 
 class Resource(object):
-    """A REST Resource"""
+    """A REST Resource
+
+    :param str base_uri: The URI this resource lives under
+    :param tuple auth: The (account sid, auth token) pair to authenticate with
+    :param float timeout: The socket and read timeout for requests
+    :param client: The :class:`~twilio.rest.base.TwilioClient` this resource
+        belongs to, if any
+    :param transport: The :class:`~twilio.rest.resources.transport.Transport`
+        to send requests over. Defaults to the client's transport.
+    """
 
     name = "Resource"
     use_json_extension = False
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
+    def __new__(cls, *args, **kwargs):
+        return super(Resource, cls).__new__(
+            resource_class(cls, kwargs.get('client')))
+
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT, client=None,
+                 transport=None):
         self.base_uri = base_uri
         self.auth = auth
         self.timeout = timeout
+        self.client = client
+        self.transport = transport
 
     def __eq__(self, other):
         return (isinstance(other, self.__class__) and
@@ -193,18 +289,221 @@ class Resource(object):
 
         :raises: a :exc:`~twilio.TwilioRestException`
         """
+        cache = self._response_cache
+        if method != "GET":
+            if cache is None:
+                return self._send(method, uri, kwargs)
+            try:
+                return self._send(method, uri, kwargs)
+            finally:
+                cache.invalidate(uri, self.uri)
+
+        if cache is not None:
+            cached = cache.get(self, uri, kwargs)
+            if cached is not None:
+                return cached
+
+        flight = self._single_flight
+        if flight is None:
+            resp, body = self._send(method, uri, kwargs)
+        else:
+            (resp, body), shared = flight.do(
+                flight.key(self, uri, kwargs),
+                lambda: self._send(method, uri, kwargs),
+            )
+            if shared:
+                body = copy_body(body)
+
+        if cache is not None:
+            cache.put(self, uri, kwargs, resp, body)
+        return resp, body
+
+    def _request_then(self, fn, method, uri, **kwargs):
+        """
+        Send a request with :meth:`request` and return ``fn(resp, body)``.
+        Asyncio resources return a coroutine instead, so methods built on
+        this work for both.
+        """
+        return fn(*self.request(method, uri, **kwargs))
+
+    def _send(self, method, uri, kwargs, parse=True, parent=None):
+        """
+        Send a request, applying the client's rate limits, retries, hooks
+        and tracing, and return the response along with its decoded body, or
+        None if ``parse`` is False
+        """
+        hooks = self._hooks
+        info = RequestInfo(method, uri, self.__class__, kwargs.get('data'))
+        span = self._start_request_span(info, parent)
+        auth = self._prepare_request(kwargs)
+
+        while True:
+            delay = self._reserve_rate_limit(kwargs)
+            if delay > 0:
+                time.sleep(delay)
+
+            info.begin_attempt(delay)
+            hooks.fire('before_request', info)
+
+            try:
+                resp = make_twilio_request(method, uri, auth=auth, **kwargs)
+            except Exception as e:
+                info.failed(e)
+                delay = self._get_retry_delay(method, e, info.attempt)
+                if delay is None:
+                    hooks.fire('on_error', info)
+                    self._end_request_span(span, info)
+                    raise
+                info.retrying(delay)
+                hooks.fire('on_retry', info)
+                time.sleep(delay)
+                continue
+
+            info.received(resp.status_code, response_size(resp), resp)
+            body = None
+            if parse:
+                started = _clock()
+                try:
+                    body = self._parse_response(method, resp)
+                except Exception as e:
+                    info.error = e
+                    hooks.fire('on_error', info)
+                    self._end_request_span(span, info)
+                    raise
+                info.timings['parse'] = _clock() - started
+
+            info.finish()
+            hooks.fire('after_response', info)
+            self._end_request_span(span, info)
+            return resp, body
+
+    @property
+    def _hooks(self):
+        if self.client is None:
+            return NO_HOOKS
+        return self.client.hooks
+
+    @property
+    def _response_cache(self):
+        if self.client is None:
+            return None
+        return self.client.response_cache
+
+    @property
+    def _single_flight(self):
+        if self.client is None:
+            return None
+        return self.client.single_flight
+
+    @property
+    def _tracer(self):
+        if self.client is None:
+            return None
+        return self.client.tracer
+
+    def _trace(self, operation, **kwargs):
+        """
+        Run a block in a span named after this resource and ``operation``.
+        See :func:`~twilio.rest.resources.tracing.traced`.
+        """
+        name = "%s.%s" % (self.__class__.__name__, operation)
+        attributes = {'twilio.resource': self.__class__.__name__}
+        return traced(self._tracer, name, attributes, **kwargs)
+
+    def _start_request_span(self, info, parent):
+        tracer = self._tracer
+        if tracer is None:
+            return None
+
+        if parent is None:
+            parent = current_span()
+
+        return tracer.start_span(
+            "%s %s" % (info.method, urlparse(info.uri_template).path),
+            parent=parent,
+            attributes={
+                'http.method': info.method,
+                'http.url': info.uri_template,
+                'twilio.resource': self.__class__.__name__,
+            },
+        )
+
+    def _end_request_span(self, span, info):
+        if span is None:
+            return
+
+        if info.status is not None:
+            span.set_attribute('http.status_code', info.status)
+        span.set_attribute('twilio.attempts', info.attempt)
+        if info.error is not None:
+            span.record_exception(info.error)
+        span.end()
+
+    def _prepare_request(self, kwargs):
+        """
+        Fill in the request options that come from this resource and its
+        client, and return the credentials to send the request with
+        """
         if 'timeout' not in kwargs and self.timeout is not UNSET_TIMEOUT:
             kwargs['timeout'] = self.timeout
 
+        auth = self.auth
+        if self.transport is not None:
+            kwargs.setdefault('transport', self.transport)
+
+        if self.client is not None:
+            kwargs.setdefault('transport', self.client.transport)
+
+            if self.client.auth_header is not None:
+                headers = kwargs.get('headers', {})
+                headers['Authorization'] = self.client.auth_header
+                kwargs['headers'] = headers
+                auth = None
+
         kwargs['use_json_extension'] = self.use_json_extension
-        resp = make_twilio_request(method, uri, auth=self.auth, **kwargs)
+        return auth
 
-        logger.debug(resp.content)
+    def _reserve_rate_limit(self, kwargs):
+        """
+        Return how long to wait before sending a request to stay under the
+        client's rate limits
+        """
+        if self.client is None or self.client.rate_limiter is None:
+            return 0
+
+        return self.client.rate_limiter.reserve(self.auth[0], self.name,
+                                                kwargs.get('data'))
 
-        if method == "DELETE":
-            return resp, {}
+    def _get_retry_delay(self, method, error, attempt):
+        """
+        Return how long to wait before retrying a failed request, or None to
+        give up
+        """
+        if self.client is None or self.client.retry_policy is None:
+            return None
+
+        if retries_suppressed():
+            return None
+
+        if not isinstance(error, TwilioRestException):
+            return None
+
+        return self.client.retry_policy.get_retry_delay(method, error,
+                                                        attempt)
+
+    def _parse_response(self, method, resp):
+        """ Decode the body of a response to this resource """
+        if method == "DELETE" or resp.status_code == 304:
+            return {}
         else:
-            return resp, json.loads(resp.content)
+            return self.json_codec.loads(resp.raw)
+
+    @property
+    def json_codec(self):
+        """ The codec to decode responses with """
+        if self.client is not None and self.client.json_codec is not None:
+            return self.client.json_codec
+        return get_json_codec()
 
     @property
     def uri(self):
@@ -226,13 +525,19 @@ class InstanceResource(Resource):
     id_key = "sid"
     use_json_extension = True
 
+    def __new__(cls, parent=None, *args, **kwargs):
+        return object.__new__(
+            resource_class(cls, getattr(parent, 'client', None)))
+
     def __init__(self, parent, sid):
         self.parent = parent
         self.name = sid
         super(InstanceResource, self).__init__(
             parent.uri,
             parent.auth,
-            parent.timeout
+            parent.timeout,
+            client=parent.client,
+            transport=parent.transport,
         )
 
     def load(self, entries):
@@ -258,7 +563,9 @@ class InstanceResource(Resource):
             list_resource = resource(
                 self.uri,
                 self.parent.auth,
-                self.parent.timeout
+                self.parent.timeout,
+                client=self.parent.client,
+                transport=self.parent.transport,
             )
             self.__dict__[list_resource.key] = list_resource
 
@@ -268,8 +575,7 @@ class InstanceResource(Resource):
         :return: None, this is purely side effecting
         :raises: a :class:`~twilio.rest.RestException` on failure
         """
-        a = self.parent.update(self.name, **kwargs)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.update(self.name, **kwargs))
 
     def delete_instance(self):
         """ Make a DELETE request to the API to delete the object
@@ -279,6 +585,13 @@ class InstanceResource(Resource):
         """
         return self.parent.delete(self.name)
 
+    def _refresh(self, instance):
+        """
+        Load the attributes of ``instance``, a copy of this resource returned
+        by the parent list after changing it
+        """
+        self.load(instance.__dict__)
+
     def _parse_date(self, s):
         return parse_rfc2822_date(s)
 
@@ -302,6 +615,11 @@ class ListResource(Resource):
     name = "Resources"
     instance = InstanceResource
     use_json_extension = True
+    # The query parameters bounding the list's dates, earliest first, and
+    # the field of an instance they filter on, for lists that can be
+    # scanned and synced
+    date_filter = None
+    date_field = None
 
     def __init__(self, *args, **kwargs):
         super(ListResource, self).__init__(*args, **kwargs)
@@ -327,10 +645,12 @@ class ListResource(Resource):
         """
         return self.get_instance(sid)
 
-    def get_instance(self, sid):
+    def get_instance(self, sid, **kwargs):
         """Request the specified instance resource"""
         uri = "%s/%s" % (self.uri, sid)
-        resp, item = self.request("GET", uri)
+        key, cached = self._make_conditional(uri, kwargs)
+        resp, item = self.request("GET", uri, **kwargs)
+        item = self._conditional_body(key, cached, resp, item)
         return self.load_instance(item)
 
     def get_instances(self, params):
@@ -344,16 +664,71 @@ class ListResource(Resource):
         :param int page: The page of results to retrieve (most recent at 0)
         :param int page_size: The number of results to be returned.
 
+        :param bool rows: Return rows instead of instance resources
+        :param list fields: The fields to keep
+
         :returns: -- the list of resources
         """
-        params = transform_params(params)
+        params = dict(params)
+        load = self._loader(rows=params.pop('rows', False),
+                            fields=params.pop('fields', None))
+        kwargs = {'params': transform_params(params)}
+        key, cached = self._make_conditional(self.uri, kwargs)
+        resp, page = self.request("GET", self.uri, **kwargs)
+        page = self._conditional_body(key, cached, resp, page)
+        return self._load_page(page, load)
+
+    def _make_conditional(self, uri, kwargs):
+        """
+        Make a GET of ``uri`` conditional on the response remembered for it,
+        if any. Returns the key to remember the new response under and the
+        remembered response.
+        """
+        cache = self._conditional_cache
+        if cache is None:
+            return None, None
+
+        key = cache.key(uri, kwargs.get('params'))
+        cached = cache.get(key)
+        if cached is not None:
+            headers = cached.headers()
+            headers.update(kwargs.get('headers') or {})
+            kwargs['headers'] = headers
+        return key, cached
+
+    def _conditional_body(self, key, cached, resp, body):
+        """
+        Return the body to load from the response to a request made
+        conditional by :meth:`_make_conditional`
+        """
+        if key is None:
+            return body
+        return self._conditional_cache.update(key, cached, resp, body)
 
-        resp, page = self.request("GET", self.uri, params=params)
+    @property
+    def _conditional_cache(self):
+        if self.client is None:
+            return None
+        return self.client.conditional_cache
 
-        if self.key not in page:
-            raise TwilioException("Key %s not present in response" % self.key)
+    def get_raw(self, sid):
+        """
+        Fetch an instance resource without decoding it, for relaying the
+        API's JSON on as it is
 
-        return [self.load_instance(ir) for ir in page[self.key]]
+        :returns: the :class:`Response`, with the undecoded body in ``raw``
+        """
+        return self._send("GET", "%s/%s" % (self.uri, sid), {}, False)[0]
+
+    def list_raw(self, **kwargs):
+        """
+        Fetch a page of the list resource without decoding it. Takes the
+        same arguments as :meth:`list`.
+
+        :returns: the :class:`Response`, with the undecoded body in ``raw``
+        """
+        kwargs = {'params': transform_params(kwargs)}
+        return self._send("GET", self.uri, kwargs, False)[0]
 
     def create_instance(self, body):
         """
@@ -361,14 +736,15 @@ class ListResource(Resource):
 
         :param dict body: Dictionary of POST data
         """
-        resp, instance = self.request("POST", self.uri,
-                                      data=transform_params(body))
+        with self._trace('create'):
+            resp, instance = self.request("POST", self.uri,
+                                          data=transform_params(body))
 
-        if resp.status_code not in (200, 201):
-            raise TwilioRestException(resp.status_code,
-                                      self.uri, "Resource not created")
+            if resp.status_code not in (200, 201):
+                raise TwilioRestException(resp.status_code,
+                                          self.uri, "Resource not created")
 
-        return self.load_instance(instance)
+            return self.load_instance(instance)
 
     def delete_instance(self, sid):
         """
@@ -377,9 +753,57 @@ class ListResource(Resource):
         body: string -- HTTP Body for the quest
         """
         uri = "%s/%s" % (self.uri, sid)
-        resp, instance = self.request("DELETE", uri)
+        with self._trace('delete'):
+            resp, instance = self.request("DELETE", uri)
         return resp.status_code == 204
 
+    def delete_many(self, items, concurrency=DEFAULT_CONCURRENCY,
+                    retry_policy=BULK_DELETE_RETRY_POLICY):
+        """
+        Delete many instance resources, ``concurrency`` at a time.
+
+        Returns a generator of
+        :class:`~twilio.rest.resources.bulk.BulkResult` objects in the order
+        of ``items``, each holding the sid and either True or the exception
+        deleting it raised. A failed deletion doesn't stop the others.
+        ``items`` is read only as results are consumed, so it can be the
+        iterator returned by :meth:`iter`.
+
+        Requests wait for the client's rate limiter like any other.
+        Deletions turned away with 429 Too Many Requests or failing with a
+        5xx error are sent again, after a backoff, following
+        ``retry_policy``.
+
+        Usage:
+
+        .. code-block:: python
+
+            recordings = client.recordings.iter(before=date(2015, 1, 1))
+            report = BulkReport(client.recordings.delete_many(recordings))
+            print report.failed
+
+        :param items: An iterable of sids or instance resources
+        :param int concurrency: The most deletions to send at once
+        :param retry_policy: The
+            :class:`~twilio.rest.resources.retry.RetryPolicy` deciding which
+            failed deletions are sent again
+        """
+        check_blocking(self, "delete_many")
+        return self._map_sids(self.delete_instance, "DELETE", items,
+                              concurrency, retry_policy)
+
+    def _map_sids(self, fn, method, items, concurrency, retry_policy):
+        """
+        Call ``fn`` with the sid of each of ``items``, sids or instance
+        resources, on worker threads, retrying its ``method`` requests
+        """
+        def call(sid):
+            return call_with_retries(retry_policy, method, lambda: fn(sid))
+
+        sids = (item.name if isinstance(item, InstanceResource) else item
+                for item in items)
+        return map_ordered(call, sids, concurrency)
+
     def update_instance(self, sid, body):
         """
         Update an InstanceResource via a POST
@@ -388,10 +812,13 @@ class ListResource(Resource):
         body: dictionary -- Dict of items to POST
         """
         uri = "%s/%s" % (self.uri, sid)
-        resp, entry = self.request("POST", uri, data=transform_params(body))
-        return self.load_instance(entry)
+        with self._trace('update'):
+            resp, entry = self.request("POST", uri,
+                                       data=transform_params(body))
+            return self.load_instance(entry)
 
-    def iter(self, **kwargs):
+    def iter(self, stream=False, prefetch=0, raw=False, rows=False,
+             fields=None, **kwargs):
         """ Return all instance resources using an iterator
 
         This will fetch a page of resources from the API and yield them in
@@ -401,29 +828,259 @@ class ListResource(Resource):
         retrieving the 51st as the library must make another request to the API
         for resources.
 
+        Pass ``stream=True`` to parse each page while it is being downloaded.
+        The first instances of a page are then yielded before the rest of it
+        has arrived, and the page is never held in memory all at once.
+
+        Pass ``prefetch`` to fetch the next pages in the background while
+        the instances of the current one are being worked through, so the
+        delay is only seen when the work is faster than the API. At most
+        ``prefetch`` pages are held waiting on top of the current one. This
+        can't be combined with ``stream``.
+
+        Pass ``raw=True`` to get the instances as the dicts the API returned,
+        without building instance resources, when they are only passed on.
+        Pass ``rows=True`` to get them as compact, read-only
+        :class:`~twilio.rest.resources.rows.Row` tuples, which take far less
+        memory when millions are kept. Either way ``fields`` names the only
+        fields to keep; the others are dropped as each instance is parsed.
+
         Example usage:
 
         .. code-block:: python
 
             for message in client.messages:
                 print message.sid
+
+        :param bool stream: Parse pages as they are downloaded
+        :param int prefetch: The number of pages to fetch ahead
+        :param bool raw: Yield dicts instead of instance resources
+        :param bool rows: Yield rows instead of instance resources
+        :param list fields: The fields to keep
+        """
+        uri, kwargs = self._first_page(transform_params(kwargs))
+        return self._iter_pages(uri, kwargs, stream, prefetch, raw, rows,
+                                fields)
+
+    def _first_page(self, params):
+        """ Return the URI and request arguments for the first page """
+        return self.uri, {'params': params}
+
+    def _iter_pages(self, uri, kwargs, stream=False, prefetch=0, raw=False,
+                    rows=False, fields=None):
+        if prefetch < 0:
+            raise ValueError("prefetch can't be negative")
+        if stream and prefetch:
+            raise ValueError("stream and prefetch can't be used together")
+        load = self._loader(raw, rows, fields)
+        return self._iter_instances(uri, kwargs, stream, prefetch, load)
+
+    def _loader(self, raw=False, rows=False, fields=None):
+        """
+        Return the function turning an instance from a page into what the
+        caller asked for
+        """
+        if rows:
+            return row_loader(fields)
+
+        if fields is None:
+            return (lambda ir: ir) if raw else self.load_instance
+
+        fields = list(fields)
+        if not raw and self.instance.id_key not in fields:
+            fields.append(self.instance.id_key)
+        project = projector(fields)
+        if raw:
+            return project
+        return lambda ir: self.load_instance(project(ir))
+
+    def _iter_instances(self, uri, kwargs, stream, prefetch, load):
+        # The span stays open while the caller works through the instances,
+        # but is only made the parent of the page requests
+        with self._trace('iter', active=False) as span:
+            if stream:
+                pages = self._stream_pages(uri, kwargs, span)
+            else:
+                pages = self._fetch_pages(uri, kwargs, span)
+                if prefetch:
+                    pages = read_ahead(pages, prefetch)
+
+            try:
+                for items in pages:
+                    for ir in items:
+                        yield load(ir)
+            finally:
+                pages.close()
+
+    def _fetch_pages(self, uri, kwargs, span):
+        """ Yield the raw instances of each page in turn """
+        while uri:
+            with activate(span):
+                resp, page = self.request("GET", uri, **kwargs)
+
+            items = self._page_items(page)
+            if items is None:
+                return
+
+            yield items
+            uri, kwargs = self._next_page(page, uri, kwargs)
+
+    def _stream_pages(self, uri, kwargs, span):
+        """ Yield a parser for each page, yielding its raw instances """
+        while uri:
+            with activate(span):
+                parser = self._stream_page(uri, kwargs)
+            yield parser
+
+            page = parser.page
+            if self._page_items(page) is None:
+                return
+
+            uri, kwargs = self._next_page(page, uri, kwargs)
+
+    def _stream_page(self, uri, kwargs):
+        resp, _ = self._send("GET", uri, dict(kwargs, stream=True), False)
+        return PageParser(resp.chunks, self._stream_keys())
+
+    def _stream_keys(self):
+        """ The names of the lists holding the instances in a page """
+        return [self.key]
+
+    def _page_items(self, page):
+        """ Return the raw instances in a page, or None if there are none """
+        return page.get(self.key)
+
+    def _next_page(self, page, uri, kwargs):
+        """
+        Return the URI and request arguments for the page after ``page``, or
+        (None, None) on the last page
+        """
+        if not page.get('next_page_uri', ''):
+            return None, None
+
+        o = urlparse(page['next_page_uri'])
+        kwargs['params'].update(parse_qs(o.query))
+        return uri, kwargs
+
+    def export(self, path, format="jsonl", fields=None, compress=None,
+               max_bytes=None, **kwargs):
+        """ Write every instance resource to a JSON Lines or CSV file
+
+        The instances are written as the API returns them, without the
+        attributes instance resources add, and pages are parsed as they
+        are downloaded, so memory use stays the same however long the list.
+        Any other arguments filter the list, as for :meth:`iter`.
+
+        Example usage:
+
+        .. code-block:: python
+
+            client.calls.export("calls.csv.gz", format="csv",
+                                max_bytes=100 * 1024 * 1024,
+                                started_after=date(2015, 5, 1))
+
+        :param str path: The file to write
+        :param str format: ``"jsonl"`` or ``"csv"``
+        :param list fields: The fields to write, in order. By default every
+            field is written.
+        :param bool compress: Compress with gzip. By default files whose
+            names end with ``.gz`` are compressed.
+        :param int max_bytes: Start a new, numbered file whenever the current
+            one reaches this size
+        :return: the paths of the files written
         """
+        check_blocking(self, "export")
+        writer = ExportWriter(path, format, fields, compress, max_bytes)
+        records = self.iter(stream=True, raw=True, **kwargs)
+        return export(records, writer)
+
+    def sync(self, store, key=None, since=None, overlap=0, raw=False,
+             **kwargs):
+        """ Return the instance resources added since the last sync
+
+        The day of the latest instance listed is kept in ``store``, a
+        :class:`~twilio.rest.resources.sync.CheckpointStore`, under ``key``,
+        once every instance has been yielded. The next sync only lists from
+        that day on, and skips the instances it already yielded. A sync that
+        is stopped early saves nothing, so the next one starts over from
+        the same point.
+
+        Instances listed again because they were updated since are yielded
+        again. Only the saved day is listed again, so pass ``overlap`` to
+        also catch updates to instances from that many days before.
+
+        Example usage:
+
+        .. code-block:: python
+
+            store = FileCheckpointStore("checkpoints.json")
+            messages = client.messages.sync(store, since=date(2015, 5, 1))
+            for message in messages:
+                print message.sid
+
+        :param store: Where to keep the checkpoint
+        :param str key: The name of the checkpoint. Defaults to the list's
+            URI and other arguments, so that each filter is synced apart.
+        :param date since: Where to start when there is no checkpoint. By
+            default the whole list is read.
+        :param int overlap: The number of days before the checkpoint to
+            list again
+        :param bool raw: Yield dicts instead of instance resources
+        :raises: a :exc:`~twilio.TwilioException` if the list can't be
+            filtered by date, or belongs to an asyncio client
+        """
+        if self.date_filter is None or self.date_field is None:
+            raise TwilioException("%s can't be synced" % self.name)
+        check_blocking(self, "sync")
+
         params = transform_params(kwargs)
+        if key is None:
+            key = ConditionalCache.key(self.uri, params)
+        return delta_sync(self, store, key, params, since, overlap, raw)
 
-        while True:
-            resp, page = self.request("GET", self.uri, params=params)
+    def scan(self, after, before, days=DEFAULT_WINDOW_DAYS,
+             concurrency=DEFAULT_CONCURRENCY, **kwargs):
+        """ Return the instance resources from a range of days, listed in
+        parallel
 
-            if self.key not in page:
-                raise StopIteration()
+        Paging through a long list has to be done one page after the other.
+        This splits the days from ``after`` to ``before`` into windows of
+        ``days`` days instead, and lists the windows side by side on
+        ``concurrency`` threads. Instances are yielded in the same order as
+        :meth:`iter`, the latest first, with any other filters applied.
 
-            for ir in page[self.key]:
-                yield self.load_instance(ir)
+        A window with more than one page of instances is split in half,
+        down to a single day, and the halves are listed instead, so busy
+        periods are spread over more threads. Each window is read whole
+        before its instances are yielded.
 
-            if not page.get('next_page_uri', ''):
-                raise StopIteration()
+        Example usage:
 
-            o = urlparse(page['next_page_uri'])
-            params.update(parse_qs(o.query))
+        .. code-block:: python
+
+            calls = client.calls.scan(date(2015, 5, 1), date(2015, 5, 31),
+                                      status="completed")
+            for call in calls:
+                print call.sid
+
+        :param date after: The first day to list
+        :param date before: The last day to list
+        :param int days: The number of days in a window to start with
+        :param int concurrency: The number of windows listed at once
+        :raises: a :exc:`~twilio.TwilioException` if the list can't be
+            filtered by date, or belongs to an asyncio client
+        """
+        if self.date_filter is None:
+            raise TwilioException("%s can't be scanned by date" % self.name)
+        check_blocking(self, "scan")
+        return parallel_scan(self, transform_params(kwargs), after, before,
+                             days, concurrency)
+
+    def _load_page(self, page, load=None):
+        if self.key not in page:
+            raise TwilioException("Key %s not present in response" % self.key)
+
+        return [(load or self.load_instance)(ir) for ir in page[self.key]]
 
     def load_instance(self, data):
         instance = self.instance(self, data[self.instance.id_key])
@@ -439,6 +1096,9 @@ class ListResource(Resource):
 
         :param int page: The page of results to retrieve (most recent at 0)
         :param int page_size: The number of results to be returned.
+        :param bool rows: Return compact, read-only rows instead of instance
+            resources, as for :meth:`iter`
+        :param list fields: The fields to keep
         """
         return self.get_instances(kw)
 
@@ -452,7 +1112,8 @@ class NextGenListResource(ListResource):
     def __init__(self, *args, **kwargs):
         super(NextGenListResource, self).__init__(*args, **kwargs)
 
-    def iter(self, **kwargs):
+    def iter(self, stream=False, prefetch=0, raw=False, rows=False,
+             fields=None, **kwargs):
         """ Return all instance resources using an iterator
 
         This will fetch a page of resources from the API and yield them in
@@ -462,31 +1123,54 @@ class NextGenListResource(ListResource):
         retrieving the 51st as the library must make another request to the API
         for resources.
 
+        Pass ``stream=True`` to parse each page while it is being downloaded,
+        or ``prefetch`` to fetch that many pages ahead in the background.
+        With ``raw=True`` the instances are yielded as the API's dicts, and
+        with ``rows=True`` as :class:`~twilio.rest.resources.rows.Row`
+        tuples, keeping only ``fields`` if given.
+
         Example usage:
 
         .. code-block:: python
 
             for message in client.messages:
                 print message.sid
+
+        :param bool stream: Parse pages as they are downloaded
+        :param int prefetch: The number of pages to fetch ahead
+        :param bool raw: Yield dicts instead of instance resources
+        :param bool rows: Yield rows instead of instance resources
+        :param list fields: The fields to keep
         """
-        params = urlencode(transform_params(kwargs))
+        uri, kwargs = self._first_page(transform_params(kwargs))
+        return self._iter_pages(uri, kwargs, stream, prefetch, raw, rows,
+                                fields)
+
+    def _first_page(self, params):
         parsed = urlparse(self.uri)
-        url = urlunparse(parsed[:4] + (params, ) + (parsed[5], ))
+        query = urlencode(params)
+        url = urlunparse(parsed[:4] + (query, ) + (parsed[5], ))
+        return url, {}
 
-        while True:
-            resp, page = self.request("GET", url)
+    def _stream_keys(self):
+        # The key is named in the page's meta, which may come after the
+        # instances, so take every list in the page
+        return None
 
-            key = page.get('meta', {}).get('key')
+    def _page_items(self, page):
+        key = page.get('meta', {}).get('key')
 
-            if key is None or key not in page:
-                raise StopIteration()
+        if key is None or key not in page:
+            return None
 
-            for ir in page[key]:
-                yield self.load_instance(ir)
+        return page[key]
 
-            url = page.get('meta', {}).get('next_page_url')
-            if not url:
-                raise StopIteration()
+    def _next_page(self, page, uri, kwargs):
+        url = page.get('meta', {}).get('next_page_url')
+        if not url:
+            return None, None
+
+        return url, {}
 
     def get_instances(self, params):
         """
@@ -501,9 +1185,15 @@ class NextGenListResource(ListResource):
 
         :returns: -- the list of resources
         """
+        params = dict(params)
+        load = self._loader(rows=params.pop('rows', False),
+                            fields=params.pop('fields', None))
         params = transform_params(params)
 
         resp, page = self.request("GET", self.uri, params=params)
+        return self._load_page(page, load)
+
+    def _load_page(self, page, load=None):
         key = page.get('meta', {}).get('key')
 
         if key is None:
@@ -514,4 +1204,4 @@ class NextGenListResource(ListResource):
         if key not in page:
             raise TwilioException("Key %s not present in response" % key)
 
-        return [self.load_instance(ir) for ir in page[key]]
+        return [(load or self.load_instance)(ir) for ir in page[key]]
@@ -0,0 +1,214 @@
+"""
+Helpers for operations that act on many resources at once, such as
+:meth:`~twilio.rest.resources.Messages.create_many`.
+"""
+import sys
+import threading
+import time
+from collections import deque
+
+from six import reraise
+from six.moves import queue
+
+from ...exceptions import TwilioException
+from ..exceptions import TwilioRestException
+from .retry import DEFAULT_RETRY_STATUSES, RetryPolicy, suppress_retries
+
+DEFAULT_CONCURRENCY = 8
+
+# A 429 means the API turned the request away without acting on it, so
+# even a POST can safely be sent again. A POST that failed with a 5xx may
+# have taken effect, so only a DELETE is sent again after one.
+BULK_RETRY_POLICY = RetryPolicy(max_attempts=5, statuses=[429],
+                                methods=['POST'])
+BULK_DELETE_RETRY_POLICY = RetryPolicy(max_attempts=5,
+                                       statuses=DEFAULT_RETRY_STATUSES,
+                                       methods=['DELETE'])
+
+
+class BulkResult(object):
+    """
+    The outcome of one item of a bulk operation
+
+    .. attribute:: index
+
+        The position of the item in the input, counting from 0
+
+    .. attribute:: item
+
+        The item itself
+
+    .. attribute:: result
+
+        What the operation returned for the item, or None if it failed
+
+    .. attribute:: error
+
+        The exception the operation raised for the item, or None if it
+        succeeded
+    """
+
+    __slots__ = ('index', 'item', 'result', 'error')
+
+    def __init__(self, index, item, result=None, error=None):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return "<BulkResult %d: %r>" % (self.index, self.result)
+        return "<BulkResult %d failed: %r>" % (self.index, self.error)
+
+
+class BulkReport(object):
+    """
+    Sorts the results of a bulk operation into the items that succeeded
+    and those that failed
+
+    .. attribute:: succeeded
+
+        The items the operation succeeded for, in the order of the input
+
+    .. attribute:: failed
+
+        The :class:`BulkResult` of each item the operation failed for
+
+    :param results: An iterable of :class:`BulkResult`, consumed at once
+    """
+
+    def __init__(self, results):
+        self.succeeded = []
+        self.failed = []
+        for result in results:
+            if result.ok:
+                self.succeeded.append(result.item)
+            else:
+                self.failed.append(result)
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def __repr__(self):
+        return "<BulkReport: %d succeeded, %d failed>" % (
+            len(self.succeeded), len(self.failed))
+
+
+def check_blocking(resource, operation):
+    """
+    Raise if ``resource`` belongs to an asyncio client, whose requests
+    can't be sent from worker threads
+    """
+    if getattr(resource.client, 'asynchronous', False) is True:
+        raise TwilioException("%s is not supported by asyncio clients" %
+                              operation)
+
+
+def call_with_retries(policy, method, fn):
+    """
+    Call ``fn``, calling it again after the delay ``policy`` gives for as
+    long as it fails with a :exc:`~twilio.TwilioRestException` worth
+    retrying. The client doesn't retry the requests ``fn`` sends itself, so
+    ``policy`` alone decides how many times they are sent.
+    """
+    attempt = 1
+    while True:
+        try:
+            with suppress_retries():
+                return fn()
+        except TwilioRestException as e:
+            delay = policy.get_retry_delay(method, e, attempt)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+def map_ordered(fn, items, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Call ``fn`` on every item from ``items`` on ``concurrency`` worker
+    threads, and yield a :class:`BulkResult` for each, in the order of the
+    input. An item that fails yields a result carrying the exception rather
+    than stopping the others.
+
+    Items are read from ``items`` only as results are consumed: at most
+    ``2 * concurrency`` items are in flight or waiting to be yielded, so
+    long inputs are never held in memory. Closing the generator early lets
+    the items in flight finish and drops the rest. Exceptions that don't
+    derive from :exc:`Exception`, such as :exc:`KeyboardInterrupt`, are
+    raised from the generator when their item's result is reached.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    window = 2 * concurrency
+    tasks = queue.Queue()
+    pending = deque()
+    workers = []
+    stopped = threading.Event()
+
+    def work():
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            try:
+                if not stopped.is_set():
+                    task.run(fn)
+            finally:
+                task.done.set()
+
+    items = iter(items)
+    index = 0
+    try:
+        while True:
+            while len(pending) < window:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                task = _Task(index, item)
+                index += 1
+                pending.append(task)
+                tasks.put(task)
+                if len(workers) < min(concurrency, len(pending)):
+                    worker = threading.Thread(target=work,
+                                              name="twilio-bulk")
+                    worker.daemon = True
+                    worker.start()
+                    workers.append(worker)
+
+            if not pending:
+                return
+
+            task = pending.popleft()
+            task.done.wait()
+            if task.exc_info is not None:
+                reraise(*task.exc_info)
+            yield task.result
+    finally:
+        stopped.set()
+        for _ in workers:
+            tasks.put(None)
+
+
+class _Task(object):
+
+    def __init__(self, index, item):
+        self.result = BulkResult(index, item)
+        self.done = threading.Event()
+        self.exc_info = None
+
+    def run(self, fn):
+        try:
+            self.result.result = fn(self.result.item)
+        except Exception as e:
+            self.result.error = e
+        except BaseException:
+            self.exc_info = sys.exc_info()
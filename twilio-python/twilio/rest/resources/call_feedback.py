@@ -52,8 +52,8 @@ class CallFeedbackFactory(ListResource):
         :raises: a :exc:`~twilio.TwilioRestException` if the request fails
         """
         params = transform_params(kwargs)
-        _, data = self.request("GET", self.uri, params=params)
-        return self.load_instance(data)
+        return self._request_then(lambda _, data: self.load_instance(data),
+                                  "GET", self.uri, params=params)
 
     def load_instance(self, data):
         # Overridden because CallFeedback instances
@@ -97,8 +97,8 @@ class CallFeedbackSummary(ListResource):
         :raises: a :exc:`~twilio.TwilioRestException` if the request fails
         """
         params = transform_params(kwargs)
-        _, data = self.request('GET', self.uri, params=params)
-        return self.load_instance(data)
+        return self._request_then(lambda _, data: self.load_instance(data),
+                                  'GET', self.uri, params=params)
 
     def load_instance(self, data):
         # Overridden because CallFeedback summaries
@@ -68,5 +68,5 @@ class CallerIds(ListResource):
         """
         kwargs["phone_number"] = phone_number
         params = transform_params(kwargs)
-        resp, validation = self.request("POST", self.uri, data=params)
-        return validation
+        return self._request_then(lambda resp, validation: validation,
+                                  "POST", self.uri, data=params)
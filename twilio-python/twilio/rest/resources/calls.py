@@ -31,15 +31,13 @@ class Call(InstanceResource):
         If this call is scheduled to be made, remove the call
         from the queue
         """
-        a = self.parent.hangup(self.name)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.hangup(self.name))
 
     def cancel(self):
         """ If the called is queued or rining, cancel the calls.
         Will not affect in progress calls
         """
-        a = self.parent.cancel(self.name)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.cancel(self.name))
 
     def route(self, **kwargs):
         """Route the specified :class:`Call` to another url.
@@ -47,8 +45,7 @@ class Call(InstanceResource):
         :param url: A valid URL that returns TwiML.
         :param method: HTTP method Twilio uses when requesting the above URL.
         """
-        a = self.parent.route(self.name, **kwargs)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.route(self.name, **kwargs))
 
     def delete(self):
         """Delete the specified :class:`Call` record from Twilio."""
@@ -60,6 +57,8 @@ class Calls(ListResource):
 
     name = "Calls"
     instance = Call
+    date_filter = ("StartTime>", "StartTime<")
+    date_field = "start_time"
 
     def __init__(self, *args, **kwargs):
         super(Calls, self).__init__(*args, **kwargs)
@@ -194,7 +193,8 @@ class Calls(ListResource):
         """
         uri = "%s/%s" % (self.uri, sid)
         call_feedback_factory = CallFeedbackFactory(
-            uri, self.auth, self.timeout
+            uri, self.auth, self.timeout, client=self.client,
+            transport=self.transport,
         )
         return call_feedback_factory.create(
             quality_score=quality_score, issue=issue
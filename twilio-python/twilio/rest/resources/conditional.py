@@ -0,0 +1,161 @@
+import threading
+from collections import OrderedDict
+
+from six import binary_type, iteritems
+
+from ...compat import urlencode
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+
+class ConditionalCache(object):
+    """
+    Remembers the validators (``ETag`` and ``Last-Modified`` headers) and
+    decoded bodies of GET responses, so that fetching the same instance or
+    page again can be sent as a conditional request. When the API answers
+    ``304 Not Modified`` the remembered body is used instead of downloading
+    and decoding it again.
+
+    Every answer still comes from the API, so nothing is ever served stale.
+    Only responses that carry a validator are remembered, and at most
+    ``max_entries`` of them, whose bodies add up to at most ``max_bytes`` as
+    downloaded, dropping the least recently used first. Safe to use from
+    several threads.
+
+    The bodies are kept decoded, which takes several times as much memory as
+    their downloaded size, for as long as the client is used. Pages of
+    ``page_size=1000`` run to hundreds of kilobytes each, so raise
+    ``max_bytes`` with care when the same large pages are fetched again and
+    again.
+
+    :param int max_entries: The most responses to remember. 0 turns
+        conditional requests off.
+    :param int max_bytes: The most bytes of response bodies to remember.
+        Larger responses are never remembered.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(uri, params=None):
+        """ The key responses to a GET of ``uri`` are remembered under """
+        if not params:
+            return uri
+        return "%s?%s" % (uri, urlencode(sorted(params.items()), doseq=True))
+
+    def get(self, key):
+        """
+        Return the :class:`CachedResponse` remembered for ``key``, or None
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def update(self, key, entry, resp, body):
+        """
+        Remember ``resp`` or, if it says the resource hasn't changed, return
+        the body remembered before
+
+        :param entry: The :class:`CachedResponse` the request was made
+            conditional on, or None
+        :param resp: The :class:`~twilio.rest.resources.base.Response` to a
+            GET of ``key``
+        :param dict body: The decoded body of ``resp``
+        :return: the body to load the instances from
+        """
+        if resp.status_code == 304 and entry is not None:
+            with self._lock:
+                self.hits += 1
+            return copy_body(entry.body)
+
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        size = len(resp.raw) if isinstance(resp.raw, binary_type) else 0
+        with self._lock:
+            self.misses += 1
+            self._drop(key)
+            if etag is None and last_modified is None:
+                return body
+            if size > self.max_bytes or self.max_entries < 1:
+                return body
+
+            self._entries[key] = CachedResponse(etag, last_modified,
+                                                copy_body(body), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or \
+                    self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return body
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self):
+        """ Forget every response """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        :return: a dict with the number of requests answered with 304 Not
+            Modified (``hits``), the number answered in full (``misses``),
+            the number of responses remembered (``entries``) and the size
+            of their bodies as downloaded (``bytes``)
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+class CachedResponse(object):
+    """ The validators and decoded body of a response """
+
+    __slots__ = ('etag', 'last_modified', 'body', 'size')
+
+    def __init__(self, etag, last_modified, body, size=0):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.size = size
+
+    def headers(self):
+        """ The headers that make a request conditional on this response """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def copy_body(body):
+    """
+    Copy a decoded body deeply enough that loading instances from the copy,
+    which renames and replaces their fields, leaves the original alone
+    """
+    copy = dict(body)
+    for key, value in iteritems(body):
+        if isinstance(value, dict):
+            copy[key] = dict(value)
+        elif isinstance(value, list):
+            copy[key] = [dict(v) if isinstance(v, dict) else v
+                         for v in value]
+    return copy
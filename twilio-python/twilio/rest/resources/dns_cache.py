@@ -0,0 +1,129 @@
+"""
+A process-wide cache of the addresses of Twilio's hosts.
+
+Connections are kept open between requests, but every new one, such as
+those opened when traffic picks up, starts with a DNS lookup. Call
+:func:`enable_dns_cache` once at startup to answer lookups for Twilio's
+hosts from memory for ``ttl`` seconds. The cache works at the level of
+:func:`socket.getaddrinfo`, so it covers every transport; lookups of any
+other host go straight to the system resolver.
+"""
+import socket
+import threading
+
+from six import string_types
+
+from .rate_limit import _clock
+
+DEFAULT_DNS_TTL = 300
+DEFAULT_DOMAINS = ("twilio.com",)
+
+
+class DnsCache(object):
+    """
+    Remembers the results of :func:`socket.getaddrinfo` for hosts in
+    ``domains`` for ``ttl`` seconds. Safe to use from several threads.
+
+    :param float ttl: How many seconds to keep an answer for
+    :param domains: The domains whose hosts, subdomains included, are cached
+    :param resolver: The function to look hosts up with. Defaults to
+        :func:`socket.getaddrinfo`.
+    """
+
+    def __init__(self, ttl=DEFAULT_DNS_TTL, domains=DEFAULT_DOMAINS,
+                 resolver=None):
+        self.ttl = ttl
+        self.domains = tuple(d.lower().strip(".") for d in domains)
+        self.resolver = resolver or socket.getaddrinfo
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def covers(self, host):
+        """ Whether lookups of ``host`` are cached """
+        if not isinstance(host, string_types):
+            return False
+        host = host.lower().rstrip(".")
+        return any(host == d or host.endswith("." + d) for d in self.domains)
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        """ :func:`socket.getaddrinfo`, answered from the cache if possible """
+        key = (host.lower(), port, family, type, proto, flags)
+        now = _clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return list(entry[1])
+
+        # Resolve outside the lock; concurrent misses for the same host just
+        # look it up more than once
+        addresses = self.resolver(host, port, family, type, proto, flags)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, addresses)
+            self.misses += 1
+        return list(addresses)
+
+    def clear(self):
+        """ Forget every cached answer """
+        with self._lock:
+            self._entries = {}
+
+    def stats(self):
+        """
+        :return: a dict with the number of lookups answered from the cache
+            (``hits``), the number passed on to the resolver (``misses``) and
+            the number of answers held (``entries``)
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+
+_cache = None
+_resolver = None
+_lock = threading.Lock()
+
+
+def _getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    cache = _cache
+    if cache is not None and cache.covers(host):
+        return cache.getaddrinfo(host, port, family, type, proto, flags)
+    return _resolver(host, port, family, type, proto, flags)
+
+
+def enable_dns_cache(ttl=DEFAULT_DNS_TTL, domains=DEFAULT_DOMAINS):
+    """
+    Start caching lookups of Twilio's hosts, replacing any cache enabled
+    before
+
+    :param float ttl: How many seconds to keep an answer for
+    :param domains: The domains whose hosts are cached. Add to these if the
+        client's ``base`` points at another domain.
+    :return: the :class:`DnsCache` now in use
+    """
+    global _cache, _resolver
+    with _lock:
+        if socket.getaddrinfo is not _getaddrinfo:
+            _resolver = socket.getaddrinfo
+            socket.getaddrinfo = _getaddrinfo
+        _cache = DnsCache(ttl, domains, resolver=_resolver)
+        return _cache
+
+
+def disable_dns_cache():
+    """ Stop caching lookups and restore :func:`socket.getaddrinfo` """
+    global _cache
+    with _lock:
+        _cache = None
+        if socket.getaddrinfo is _getaddrinfo:
+            socket.getaddrinfo = _resolver
+
+
+def get_dns_cache():
+    """ Return the :class:`DnsCache` in use, or None if it is disabled """
+    return _cache
@@ -0,0 +1,160 @@
+"""
+Writing the instances of a list resource to JSON Lines or CSV files, for
+:meth:`~twilio.rest.resources.ListResource.export`.
+"""
+import csv
+import gzip
+import os
+
+from six import StringIO, binary_type, text_type, PY2
+
+from ...json_codec import get_json_codec
+
+FORMATS = ("jsonl", "csv")
+
+
+class ExportWriter(object):
+    """
+    Writes records, the dicts the API returns, to a JSON Lines or CSV file,
+    one at a time.
+
+    With ``max_bytes``, a new file is started whenever the next record
+    would take the current one past that size, counted before compression.
+    The files are numbered from 1 before their extensions, so
+    ``calls.csv.gz`` is written as ``calls-0001.csv.gz``,
+    ``calls-0002.csv.gz`` and so on. Every CSV file starts with a header.
+
+    Use it as a context manager, or call :meth:`close` when done.
+
+    :param str path: The file to write
+    :param str format: ``"jsonl"`` or ``"csv"``
+    :param list fields: The fields to write, in order. By default JSON
+        Lines records are written whole, and the columns of a CSV file are
+        the fields of the first record, sorted.
+    :param bool compress: Compress the files with gzip. By default they are
+        compressed if ``path`` ends with ``.gz``.
+    :param int max_bytes: The most bytes to write to a file
+    """
+
+    def __init__(self, path, format="jsonl", fields=None, compress=None,
+                 max_bytes=None):
+        if format not in FORMATS:
+            raise ValueError("Unknown export format: %s" % format)
+
+        self.path = path
+        self.format = format
+        self.fields = list(fields) if fields is not None else None
+        if compress is None:
+            compress = path.endswith(".gz")
+        self.compress = compress
+        self.max_bytes = max_bytes
+        self.paths = []
+        self.records = 0
+        self._file = None
+        self._size = 0
+        self._codec = get_json_codec()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, record):
+        """ Write ``record``, starting a new file if this one is full """
+        if self.format == "csv" and self.fields is None:
+            self.fields = sorted(record)
+
+        line = self._line(record)
+        if self._file is not None and self.max_bytes is not None and \
+                self._size + len(line) > self.max_bytes:
+            self._file.close()
+            self._file = None
+
+        if self._file is None:
+            self._open()
+
+        self._file.write(line)
+        self._size += len(line)
+        self.records += 1
+
+    def close(self):
+        if not self.paths:
+            # Even an empty export leaves a file behind
+            self._open()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        if self.max_bytes is None:
+            path = self.path
+        else:
+            path = numbered_path(self.path, len(self.paths) + 1)
+
+        if self.compress:
+            self._file = gzip.open(path, "wb")
+        else:
+            self._file = open(path, "wb")
+        self.paths.append(path)
+        self._size = 0
+
+        if self.format == "csv" and self.fields is not None:
+            header = csv_line(self.fields)
+            self._file.write(header)
+            self._size += len(header)
+
+    def _line(self, record):
+        if self.fields is not None:
+            if self.format == "csv":
+                return csv_line([self._cell(record.get(f))
+                                 for f in self.fields])
+            record = dict((f, record.get(f)) for f in self.fields)
+
+        line = self._codec.dumps(record) + "\n"
+        if not isinstance(line, binary_type):
+            line = line.encode("utf-8")
+        return line
+
+    def _cell(self, value):
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (dict, list)):
+            return self._codec.dumps(value)
+        return value
+
+
+def numbered_path(path, n):
+    """ Return ``path`` with ``n`` before its extensions """
+    directory, name = os.path.split(path)
+    stem, dot, extensions = name.partition(".")
+    return os.path.join(directory, "%s-%04d%s%s" % (stem, n, dot,
+                                                    extensions))
+
+
+def csv_line(values):
+    """ Return ``values`` as a line of CSV, encoded as UTF-8 """
+    buf = StringIO()
+    if PY2:
+        values = [v.encode("utf-8") if isinstance(v, text_type) else v
+                  for v in values]
+    csv.writer(buf, lineterminator="\n").writerow(values)
+    line = buf.getvalue()
+    if not isinstance(line, binary_type):
+        line = line.encode("utf-8")
+    return line
+
+
+def export(records, writer):
+    """
+    Write ``records`` with ``writer``, an :class:`ExportWriter`, then close
+    it
+
+    :return: the paths of the files written
+    """
+    with writer:
+        for record in records:
+            writer.write(record)
+    return writer.paths
@@ -0,0 +1,180 @@
+import logging
+import re
+
+from .rate_limit import _clock
+from .util import encode_data
+
+logger = logging.getLogger('twilio')
+
+EVENTS = ('before_request', 'after_response', 'on_error', 'on_retry')
+
+SID_RE = re.compile(r'/[A-Z]{2}[0-9a-fA-F]{32}(?=[/.]|$)')
+PHONE_NUMBER_RE = re.compile(r'/(?:\+|%2B)\d+(?=[/.]|$)')
+
+
+def uri_template(uri):
+    """
+    Return the path of ``uri`` with sids and phone numbers replaced by
+    placeholders, so requests to the same endpoint can be grouped together
+
+    >>> uri_template("https://api.twilio.com/2010-04-01/Accounts/"
+    ...              "AC7d1ed2fc9b2e1cf71e2c3ee5b9ab1d08/Calls?Page=2")
+    'https://api.twilio.com/2010-04-01/Accounts/{sid}/Calls'
+    """
+    path = uri.split('?', 1)[0]
+    path = SID_RE.sub('/{sid}', path)
+    return PHONE_NUMBER_RE.sub('/{phone_number}', path)
+
+
+class RequestInfo(object):
+    """
+    What is known about a request, passed to every hook. One object follows
+    a request through all its attempts.
+
+    :ivar str method: The HTTP method
+    :ivar str uri: The URI requested, without the query string
+    :ivar str uri_template: :attr:`uri` with sids and phone numbers replaced
+        by placeholders, see :func:`uri_template`
+    :ivar resource: The class of the resource sending the request, or None
+        for requests sent with :meth:`TwilioClient.request`
+    :ivar int attempt: How many times the request has been sent
+    :ivar int status: The HTTP status of the last response, if any
+    :ivar int bytes_out: The size of the request body
+    :ivar int bytes_in: The size of the response body, if known
+    :ivar response: The last :class:`~twilio.rest.resources.Response`, if
+        any
+    :ivar error: The exception the last attempt failed with, if any
+    :ivar float retry_delay: How long the client waits before the next
+        attempt; only set for ``on_retry`` hooks
+    :ivar dict timings: Seconds spent in each phase of the request:
+
+        * ``rate_limit``: waiting for the client's rate limiter
+        * ``retry``: backing off between attempts
+        * ``request``: the last attempt, from sending the request until the
+          body has been read, or until the headers have been read for
+          streamed responses. This covers DNS, connecting, TLS, the API's
+          own processing and the download.
+        * ``parse``: decoding the body
+        * ``total``: everything above, end to end
+    """
+
+    def __init__(self, method, uri, resource=None, data=None):
+        self.method = method
+        self.uri = uri
+        self.resource = resource
+        self.data = data
+        self.attempt = 0
+        self.status = None
+        self.bytes_in = None
+        self.response = None
+        self.error = None
+        self.retry_delay = None
+        self.timings = {'rate_limit': 0.0, 'retry': 0.0}
+        self._started = _clock()
+        self._sent = None
+
+    @property
+    def uri_template(self):
+        return uri_template(self.uri)
+
+    @property
+    def bytes_out(self):
+        return len(encode_data(self.data)) if self.data else 0
+
+    def begin_attempt(self, waited=0):
+        """
+        Note the start of another attempt
+
+        :param float waited: How long the rate limiter held the attempt back
+        """
+        self.attempt += 1
+        self.timings['rate_limit'] += waited
+        self.status = None
+        self.error = None
+        self.retry_delay = None
+        self.response = None
+        self._sent = _clock()
+
+    def received(self, status, bytes_in=None, response=None):
+        """ Note that a response arrived """
+        self.status = status
+        self.bytes_in = bytes_in
+        self.response = response
+        self.timings['request'] = _clock() - self._sent
+
+    def failed(self, error):
+        """ Note that the current attempt raised ``error`` """
+        self.error = error
+        self.status = getattr(error, 'status', None)
+        self.timings['request'] = _clock() - self._sent
+        self.timings['total'] = _clock() - self._started
+
+    def retrying(self, delay):
+        """ Note that the request will be sent again after ``delay`` """
+        self.retry_delay = delay
+        self.timings['retry'] += delay
+
+    def finish(self):
+        self.timings['total'] = _clock() - self._started
+
+
+class Hooks(object):
+    """
+    Callbacks run at each stage of every request a client sends. Every
+    callback receives a :class:`RequestInfo`.
+
+    * ``before_request``: before each attempt is sent
+    * ``after_response``: once a request has succeeded
+    * ``on_error``: once a request has failed for good
+    * ``on_retry``: after a failed attempt, before backing off
+
+    .. code-block:: python
+
+        @client.hooks.register('after_response')
+        def record(info):
+            statsd.timing(info.uri_template, info.timings['total'])
+
+    Exceptions raised by callbacks are logged and otherwise ignored, so a
+    broken hook never fails a request.
+    """
+
+    def __init__(self):
+        self._callbacks = dict((event, []) for event in EVENTS)
+
+    def register(self, event, callback=None):
+        """
+        Run ``callback`` on ``event``. Without a callback, returns a
+        decorator that registers the function it decorates.
+        """
+        if event not in self._callbacks:
+            raise ValueError("Unknown hook %r, expected one of %s" % (
+                event, ", ".join(EVENTS)))
+
+        if callback is None:
+            def decorator(func):
+                self.register(event, func)
+                return func
+            return decorator
+
+        self._callbacks[event].append(callback)
+        return callback
+
+    def unregister(self, event, callback):
+        """ Stop running ``callback`` on ``event`` """
+        self._callbacks[event].remove(callback)
+
+    def fire(self, event, info):
+        """ Run the callbacks registered for ``event`` """
+        for callback in self._callbacks[event]:
+            try:
+                callback(info)
+            except Exception:
+                logger.exception("Error in %s hook %r", event, callback)
+
+    def __bool__(self):
+        return any(self._callbacks.values())
+
+    __nonzero__ = __bool__
+
+
+NO_HOOKS = Hooks()
@@ -16,6 +16,24 @@ except ImportError:
 # httplib2
 import httplib2
 
+# urllib3, only needed by Urllib3Transport
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# aiohttp, only needed by the asyncio clients
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# sqlite3, only needed by Mirror; Python can be built without it
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
 # socks
 try:
     from httplib2 import socks
@@ -62,8 +62,4 @@ class PhoneNumbers(NextGenListResource):
         if include_carrier_info:
             params['type'] = 'carrier'
 
-        params = transform_params(params)
-        uri = "%s/%s" % (self.uri, number)
-        _, item = self.request("GET", uri, params=params)
-
-        return self.load_instance(item)
+        return self.get_instance(number, params=transform_params(params))
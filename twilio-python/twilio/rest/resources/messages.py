@@ -1,4 +1,11 @@
 from . import InstanceResource, ListResource
+from .bulk import (
+    BULK_RETRY_POLICY,
+    DEFAULT_CONCURRENCY,
+    call_with_retries,
+    check_blocking,
+    map_ordered,
+)
 from .media import MediaList
 from .util import normalize_dates, parse_date
 
@@ -100,6 +107,8 @@ class Message(InstanceResource):
 class Messages(ListResource):
     name = "Messages"
     key = "messages"
+    date_filter = ("DateSent>", "DateSent<")
+    date_field = "date_sent"
     instance = Message
 
     def create(self, from_=None, **kwargs):
@@ -121,6 +130,47 @@ class Messages(ListResource):
         kwargs["from"] = from_
         return self.create_instance(kwargs)
 
+    def create_many(self, messages, concurrency=DEFAULT_CONCURRENCY,
+                    retry_policy=BULK_RETRY_POLICY):
+        """
+        Create and send many messages, ``concurrency`` at a time.
+
+        Returns a generator of
+        :class:`~twilio.rest.resources.bulk.BulkResult` objects in the order
+        of ``messages``, each holding the created :class:`Message` or the
+        exception that sending it raised. A failed message doesn't stop the
+        others. Messages are read from ``messages`` only as results are
+        consumed, so it can be a generator over any number of recipients.
+
+        Requests wait for the client's rate limiter like any other.
+        Messages turned away with 429 Too Many Requests are sent again,
+        after a backoff, following ``retry_policy``.
+
+        Usage:
+
+        .. code-block:: python
+
+            messages = ({"to": number, "from_": "+15017250604",
+                         "body": "Hi!"} for number in numbers)
+            for result in client.messages.create_many(messages):
+                if not result.ok:
+                    print result.item["to"], result.error
+
+        :param messages: An iterable of dicts of the arguments to
+            :meth:`create`
+        :param int concurrency: The most messages to send at once
+        :param retry_policy: The
+            :class:`~twilio.rest.resources.retry.RetryPolicy` deciding which
+            failed messages are sent again
+        """
+        check_blocking(self, "create_many")
+
+        def create(kwargs):
+            return call_with_retries(retry_policy, "POST",
+                                     lambda: self.create(**kwargs))
+
+        return map_ordered(create, messages, concurrency)
+
     @normalize_dates
     def list(self, from_=None, before=None, after=None, date_sent=None, **kw):
         """
@@ -155,3 +205,22 @@ class Messages(ListResource):
     def redact(self, sid):
         """Redact the specified Message record's Body field."""
         return self.update_instance(sid, {'Body': ''})
+
+    def redact_many(self, items, concurrency=DEFAULT_CONCURRENCY,
+                    retry_policy=BULK_RETRY_POLICY):
+        """
+        Redact the bodies of many messages, ``concurrency`` at a time.
+
+        Works like :meth:`~twilio.rest.resources.ListResource.delete_many`,
+        each :class:`~twilio.rest.resources.bulk.BulkResult` holding the sid
+        and the redacted :class:`Message`.
+
+        :param items: An iterable of sids or :class:`Message` resources
+        :param int concurrency: The most messages to redact at once
+        :param retry_policy: The
+            :class:`~twilio.rest.resources.retry.RetryPolicy` deciding which
+            failed redactions are sent again
+        """
+        check_blocking(self, "redact_many")
+        return self._map_sids(self.redact, "POST", items, concurrency,
+                              retry_policy)
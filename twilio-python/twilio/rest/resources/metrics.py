@@ -0,0 +1,266 @@
+import bisect
+import threading
+
+from six import iteritems
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+
+
+class Histogram(object):
+    """
+    Counts observations into buckets, the way Prometheus histograms do.
+
+    :param buckets: The upper bounds of the buckets, in ascending order. A
+        last, unbounded bucket is always added.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self):
+        """
+        :return: a dict with the ``count`` and ``sum`` of the observations,
+            and ``buckets``: a list of (upper bound, cumulative count)
+            pairs, ending with ``float('inf')``
+        """
+        cumulative = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            cumulative.append((bound, total))
+
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class EndpointMetrics(object):
+    """ What a :class:`MetricsRegistry` knows about one resource and method
+    """
+
+    def __init__(self, buckets):
+        self.requests = 0
+        self.errors = {}
+        self.retries = 0
+        self.statuses = {}
+        self.rate_limit_wait = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = Histogram(buckets)
+
+    def record(self, info):
+        self.requests += 1
+        if info.status is not None:
+            self.statuses[info.status] = self.statuses.get(info.status, 0) + 1
+        self.rate_limit_wait += info.timings.get('rate_limit', 0)
+        self.bytes_in += info.bytes_in or 0
+        self.bytes_out += info.bytes_out or 0
+        self.latency.observe(info.timings.get('total', 0))
+
+    def snapshot(self):
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+            "rate_limit_wait": self.rate_limit_wait,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class MetricsRegistry(object):
+    """
+    Collects metrics about every request sent by the clients it is given
+    to, keyed by resource class (``Messages``, ``Workers``, ...) and HTTP
+    method.
+
+    .. code-block:: python
+
+        metrics = MetricsRegistry()
+        client = TwilioRestClient(ACCOUNT_SID, AUTH_TOKEN, metrics=metrics)
+
+        client.messages.create(to="+15558675309", from_="+15017250604",
+                               body="Hello!")
+
+        print metrics.snapshot()["endpoints"]["Messages"]["POST"]
+        print prometheus_text(metrics)
+
+    A registry can be shared by several clients, and is thread-safe.
+    Requests sent with the deprecated :meth:`TwilioClient.request` are
+    recorded under ``TwilioClient``.
+
+    :param buckets: The upper bounds, in seconds, of the latency histogram
+        buckets
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._endpoints = {}
+        self._transports = []
+        self._lock = threading.Lock()
+
+    def instrument(self, client):
+        """ Start recording the requests ``client`` sends """
+        client.hooks.register('after_response', self._after_response)
+        client.hooks.register('on_error', self._on_error)
+        client.hooks.register('on_retry', self._on_retry)
+
+        with self._lock:
+            if not any(t is client.transport for t in self._transports):
+                self._transports.append(client.transport)
+
+    def snapshot(self):
+        """
+        :return: a dict of plain values: ``endpoints`` maps resource names
+            to HTTP methods to their metrics, and ``pool`` sums up the
+            :meth:`~twilio.rest.resources.transport.Transport.pool_stats` of
+            every instrumented client's transport
+        """
+        with self._lock:
+            endpoints = {}
+            for (resource, method), metrics in iteritems(self._endpoints):
+                endpoints.setdefault(resource, {})[method] = \
+                    metrics.snapshot()
+            transports = list(self._transports)
+
+        pool = {}
+        for transport in transports:
+            stats = getattr(transport, 'pool_stats', dict)()
+            for key, value in iteritems(stats):
+                pool[key] = pool.get(key, 0) + value
+
+        return {"endpoints": endpoints, "pool": pool}
+
+    def reset(self):
+        """ Forget every request recorded so far """
+        with self._lock:
+            self._endpoints = {}
+
+    def _endpoint(self, info):
+        if info.resource is None:
+            resource = "TwilioClient"
+        else:
+            resource = info.resource.__name__
+
+        key = (resource, info.method)
+        if key not in self._endpoints:
+            self._endpoints[key] = EndpointMetrics(self.buckets)
+        return self._endpoints[key]
+
+    def _after_response(self, info):
+        with self._lock:
+            self._endpoint(info).record(info)
+
+    def _on_error(self, info):
+        if info.status is not None:
+            kind = str(info.status)
+        else:
+            kind = info.error.__class__.__name__
+
+        with self._lock:
+            metrics = self._endpoint(info)
+            metrics.record(info)
+            metrics.errors[kind] = metrics.errors.get(kind, 0) + 1
+
+    def _on_retry(self, info):
+        with self._lock:
+            self._endpoint(info).retries += 1
+
+
+def prometheus_text(registry, prefix="twilio"):
+    """
+    Render the metrics in a :class:`MetricsRegistry` in the Prometheus text
+    exposition format
+
+    :param str prefix: What every metric name starts with
+    :rtype: str
+    """
+    snapshot = registry.snapshot()
+    lines = []
+
+    def family(name, kind, help, samples):
+        lines.append("# HELP %s_%s %s" % (prefix, name, help))
+        lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+        for suffix, labels, value in samples:
+            lines.append("%s_%s%s%s %s" % (prefix, name, suffix,
+                                           format_labels(labels),
+                                           format_value(value)))
+
+    endpoints = sorted(
+        ((resource, method), metrics)
+        for resource, methods in iteritems(snapshot["endpoints"])
+        for method, metrics in iteritems(methods)
+    )
+
+    def per_endpoint(field):
+        return [("", {"resource": r, "method": m}, metrics[field])
+                for (r, m), metrics in endpoints]
+
+    def per_key(field, label):
+        return [("", {"resource": r, "method": m, label: key}, count)
+                for (r, m), metrics in endpoints
+                for key, count in sorted(iteritems(metrics[field]))]
+
+    family("requests_total", "counter",
+           "Requests sent to the Twilio API, after retries",
+           per_endpoint("requests"))
+    family("responses_total", "counter",
+           "Final responses, by HTTP status", per_key("statuses", "status"))
+    family("errors_total", "counter",
+           "Requests that failed, by HTTP status or exception",
+           per_key("errors", "error"))
+    family("retries_total", "counter", "Requests that were sent again",
+           per_endpoint("retries"))
+    family("rate_limit_wait_seconds_total", "counter",
+           "Time spent waiting for the client's rate limiter",
+           per_endpoint("rate_limit_wait"))
+    family("received_bytes_total", "counter", "Response bytes received",
+           per_endpoint("bytes_in"))
+    family("sent_bytes_total", "counter", "Request bytes sent",
+           per_endpoint("bytes_out"))
+
+    samples = []
+    for (resource, method), metrics in endpoints:
+        labels = {"resource": resource, "method": method}
+        latency = metrics["latency"]
+        for bound, count in latency["buckets"]:
+            samples.append(("_bucket", dict(labels, le=bound), count))
+        samples.append(("_sum", labels, latency["sum"]))
+        samples.append(("_count", labels, latency["count"]))
+    family("request_duration_seconds", "histogram",
+           "Time taken by requests, including retries", samples)
+
+    family("pool_connections", "gauge", "Connections held by transports",
+           [("", {"state": state}, count)
+            for state, count in sorted(iteritems(snapshot["pool"]))])
+
+    return "\n".join(lines) + "\n"
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+
+    pairs = []
+    for name in sorted(labels):
+        value = labels[name]
+        if isinstance(value, float):
+            value = format_value(value)
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        pairs.append('%s="%s"' % (name, value.replace("\n", "\\n")))
+    return "{%s}" % ",".join(pairs)
+
+
+def format_value(value):
+    if value == float('inf'):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
@@ -0,0 +1,256 @@
+"""
+A local SQLite copy of list resources, kept up to date by paging through
+them, for answering lookups without going to the API.
+"""
+import datetime
+import re
+import threading
+
+from ...exceptions import TwilioException
+from ...json_codec import get_json_codec
+from .imports import sqlite3
+from .bulk import check_blocking
+from .sync import CheckpointStore, delta_sync, record_time
+
+# The fields, besides the sid and the date, that each list's table has a
+# column and an index for
+DEFAULT_FIELDS = {
+    "messages": ("to", "from"),
+    "calls": ("to", "from"),
+    "recordings": ("call_sid",),
+    "incoming_phone_numbers": ("phone_number", "friendly_name"),
+    "workers": ("friendly_name", "activity_name"),
+    "tasks": ("assignment_status", "task_queue_sid"),
+}
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Mirror(object):
+    """
+    Keeps a copy of list resources in an SQLite database, and looks up
+    instances in it.
+
+    Each kind of list gets a table, holding the instances of every list of
+    that kind mirrored into it, such as the workers of several workspaces.
+    Besides the sid and date, each table has an indexed column for each of
+    the fields named for it in ``fields``, by default those in
+    :data:`DEFAULT_FIELDS`. Every other field is kept too, and is there on
+    the instances returned, but can't be searched on.
+
+    Safe to use from several threads.
+
+    :param str path: The database file. By default the copy is only kept
+        in memory.
+    :param dict fields: The fields to index for each kind of list, by its
+        key, such as ``{"messages": ("to", "from", "status")}``
+    """
+
+    def __init__(self, path=":memory:", fields=None):
+        if sqlite3 is None:
+            raise TwilioException("Mirror requires the sqlite3 module, "
+                                  "which this Python was built without.")
+
+        self.fields = dict(DEFAULT_FIELDS)
+        self.fields.update(fields or {})
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._refreshing = threading.Lock()
+        self._tables = {}
+        self._codec = get_json_codec()
+        self.checkpoints = _MirrorCheckpoints(self)
+
+        with self._lock, self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS checkpoints "
+                            "(key TEXT PRIMARY KEY, checkpoint TEXT)")
+
+    def close(self):
+        with self._lock:
+            self.db.close()
+
+    def refresh(self, resource, overlap=0):
+        """
+        Bring the copy of ``resource`` up to date.
+
+        Lists that can be synced, such as messages and calls, are listed
+        from where the last refresh stopped, and ``overlap`` is passed on
+        to :meth:`~twilio.rest.resources.ListResource.sync`. Instances
+        deleted from them stay in the copy. Other lists, such as phone
+        numbers and workers, are listed whole, and instances no longer in
+        them are dropped.
+
+        Lookups go on while a refresh runs. A refresh that fails leaves the
+        copy as it was.
+
+        :return: the number of instances stored
+        """
+        check_blocking(resource, "Mirror")
+        table = self._table(resource)
+        stored = 0
+
+        with self._refreshing:
+            try:
+                if resource.date_filter is not None and \
+                        resource.date_field is not None:
+                    key = "mirror:%s" % resource.uri
+                    records = delta_sync(resource, self.checkpoints, key, {},
+                                         overlap=overlap, raw=True)
+                    listed = None
+                else:
+                    records = resource.iter(raw=True)
+                    listed = set()
+
+                for record in records:
+                    with self._lock:
+                        sid = self._store(resource, table, record)
+                    if listed is not None:
+                        listed.add(sid)
+                    stored += 1
+
+                with self._lock:
+                    if listed is not None:
+                        self._drop_unlisted(resource, table, listed)
+                    self.db.commit()
+            except BaseException:
+                with self._lock:
+                    self.db.rollback()
+                raise
+        return stored
+
+    def get(self, resource, sid):
+        """ Return the copy of the instance of ``resource`` with ``sid`` """
+        found = self.find(resource, sid=sid, limit=1)
+        return found[0] if found else None
+
+    def find(self, resource, after=None, before=None, limit=None,
+             **fields):
+        """
+        Return the copies of the instances of ``resource`` matching every
+        one of ``fields``, the latest first.
+
+        Usage:
+
+        .. code-block:: python
+
+            messages = mirror.find(client.messages, to="+15558675309",
+                                   after=date(2015, 5, 1))
+
+        :param after: Only return instances from this date or datetime on
+        :param before: Only return instances from before this datetime, or
+            from this date or earlier
+        :param int limit: The most instances to return
+        :param fields: Indexed fields and the values to match. Write
+            ``from`` as ``from_``.
+        :raises: a :exc:`~twilio.TwilioException` if a field isn't indexed
+        """
+        table = self._table(resource)
+        columns = ["sid"] + list(self.fields.get(resource.key, ()))
+        where, args = ["list_uri = ?"], [resource.uri]
+
+        for name, value in fields.items():
+            name = name.rstrip("_")
+            if name not in columns:
+                raise TwilioException("%s isn't indexed for %s" %
+                                      (name, resource.key))
+            where.append('"%s" = ?' % name)
+            args.append(value)
+
+        if after is not None:
+            where.append("date >= ?")
+            args.append(_bound(after, False))
+        if before is not None:
+            where.append("date < ?")
+            args.append(_bound(before, True))
+
+        sql = 'SELECT data FROM "%s" WHERE %s ORDER BY date DESC' % (
+            table, " AND ".join(where))
+        if limit is not None:
+            sql += " LIMIT %d" % limit
+
+        with self._lock:
+            rows = self.db.execute(sql, args).fetchall()
+        return [resource.load_instance(self._codec.loads(data))
+                for data, in rows]
+
+    def _table(self, resource):
+        """ Create the table for ``resource`` if needed, and name it """
+        name = re.sub(r"\W", "_", resource.key)
+        if name in self._tables:
+            return name
+
+        fields = self.fields.get(resource.key, ())
+        # Creating a table commits, so it waits for any refresh to finish
+        with self._refreshing, self._lock, self.db:
+            self.db.execute(
+                'CREATE TABLE IF NOT EXISTS "%s" (list_uri TEXT NOT NULL, '
+                'sid TEXT NOT NULL, date TEXT, data TEXT NOT NULL, '
+                'PRIMARY KEY (list_uri, sid))' % name)
+            existing = set(row[1] for row in self.db.execute(
+                'PRAGMA table_info("%s")' % name))
+            for field in fields:
+                if field not in existing:
+                    self.db.execute('ALTER TABLE "%s" ADD COLUMN "%s" TEXT' %
+                                    (name, field))
+            for column in ("date",) + tuple(fields):
+                self.db.execute(
+                    'CREATE INDEX IF NOT EXISTS "%s_%s" ON "%s" '
+                    '(list_uri, "%s")' % (name, column, name, column))
+
+        self._tables[name] = fields
+        return name
+
+    def _store(self, resource, table, record):
+        fields = self._tables[table]
+        date = record.get(resource.date_field or "date_created")
+        columns = ["list_uri", "sid", "date", "data"] + list(fields)
+        time = record_time(date)
+        if time is not None:
+            time = time.strftime(_TIME_FORMAT)
+        values = [resource.uri, record[resource.instance.id_key], time,
+                  self._codec.dumps(record)]
+        values.extend(record.get(field) for field in fields)
+
+        self.db.execute(
+            'INSERT OR REPLACE INTO "%s" (%s) VALUES (%s)' % (
+                table, ", ".join('"%s"' % c for c in columns),
+                ", ".join("?" for _ in columns)),
+            values)
+        return values[1]
+
+    def _drop_unlisted(self, resource, table, listed):
+        rows = self.db.execute('SELECT sid FROM "%s" WHERE list_uri = ?' %
+                               table, (resource.uri,))
+        gone = [(resource.uri, sid) for sid, in rows if sid not in listed]
+        self.db.executemany('DELETE FROM "%s" WHERE list_uri = ? AND '
+                            'sid = ?' % table, gone)
+
+
+class _MirrorCheckpoints(CheckpointStore):
+    """ Keeps the checkpoints of a :class:`Mirror` in its own database """
+
+    def __init__(self, mirror):
+        self.mirror = mirror
+
+    def load(self, key):
+        with self.mirror._lock:
+            row = self.mirror.db.execute(
+                "SELECT checkpoint FROM checkpoints WHERE key = ?",
+                (key,)).fetchone()
+        return self.mirror._codec.loads(row[0]) if row else None
+
+    def save(self, key, checkpoint):
+        # Written in the refresh's transaction, so the checkpoint is only
+        # committed along with the instances it covers
+        with self.mirror._lock:
+            self.mirror.db.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                (key, self.mirror._codec.dumps(checkpoint)))
+
+
+def _bound(value, before):
+    if isinstance(value, datetime.datetime):
+        return value.strftime(_TIME_FORMAT)
+    if before:
+        # A day is included whole
+        value += datetime.timedelta(days=1)
+    return value.strftime(_TIME_FORMAT)
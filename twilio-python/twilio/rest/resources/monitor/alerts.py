@@ -14,6 +14,8 @@ class Alerts(NextGenListResource):
 
     name = "Alerts"
     instance = Alert
+    date_filter = ("StartDate", "EndDate")
+    date_field = "date_generated"
 
     def list(self, before=None, after=None, **kwargs):
         """
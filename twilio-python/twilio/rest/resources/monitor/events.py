@@ -65,6 +65,8 @@ class Event(NextGenInstanceResource):
 class Events(NextGenListResource):
     name = "Events"
     instance = Event
+    date_filter = ("StartDate", "EndDate")
+    date_field = "event_date"
 
     def list(self, **kwargs):
         """
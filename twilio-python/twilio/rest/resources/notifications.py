@@ -15,6 +15,8 @@ class Notifications(ListResource):
 
     name = "Notifications"
     instance = Notification
+    date_filter = ("MessageDate>", "MessageDate<")
+    date_field = "message_date"
 
     @normalize_dates
     def list(self, before=None, after=None, **kwargs):
@@ -76,8 +76,9 @@ class AvailablePhoneNumbers(ListResource):
     key = "available_phone_numbers"
     instance = AvailablePhoneNumber
 
-    def __init__(self, base_uri, auth, timeout, phone_numbers):
-        super(AvailablePhoneNumbers, self).__init__(base_uri, auth, timeout)
+    def __init__(self, base_uri, auth, timeout, phone_numbers, **kwargs):
+        super(AvailablePhoneNumbers, self).__init__(base_uri, auth, timeout,
+                                                    **kwargs)
         self.phone_numbers = phone_numbers
 
     def get(self, sid):
@@ -95,9 +96,11 @@ class AvailablePhoneNumbers(ListResource):
         params = transform_params(kwargs)
 
         uri = "%s/%s/%s" % (self.uri, country, TYPES[type])
-        resp, page = self.request("GET", uri, params=params)
 
-        return [self.load_instance(i) for i in page[self.key]]
+        def load(resp, page):
+            return [self.load_instance(i) for i in page[self.key]]
+
+        return self._request_then(load, "GET", uri, params=params)
 
     def load_instance(self, data):
         instance = self.instance(self.phone_numbers)
@@ -215,7 +218,9 @@ class PhoneNumber(InstanceResource):
             self.parent = PhoneNumbers(
                 uri,
                 self.parent.auth,
-                self.parent.timeout
+                self.parent.timeout,
+                client=self.parent.client,
+                transport=self.parent.transport,
             )
             self.base_uri = self.parent.uri
 
@@ -226,8 +231,7 @@ class PhoneNumber(InstanceResource):
         Transfer the phone number with sid from the current account to another
         identified by account_sid
         """
-        a = self.parent.transfer(self.name, account_sid)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.transfer(self.name, account_sid))
 
     def update(self, **kwargs):
         """
@@ -237,8 +241,7 @@ class PhoneNumber(InstanceResource):
         change_dict_key(kwargs_copy, from_key="status_callback_url",
                         to_key="status_callback")
 
-        a = self.parent.update(self.name, **kwargs_copy)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.update(self.name, **kwargs_copy))
 
     def delete(self):
         """
@@ -257,10 +260,10 @@ class PhoneNumbers(ListResource):
     key = "incoming_phone_numbers"
     instance = PhoneNumber
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
-        super(PhoneNumbers, self).__init__(base_uri, auth, timeout)
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT, **kwargs):
+        super(PhoneNumbers, self).__init__(base_uri, auth, timeout, **kwargs)
         self.available_phone_numbers = \
-            AvailablePhoneNumbers(base_uri, auth, timeout, self)
+            AvailablePhoneNumbers(base_uri, auth, timeout, self, **kwargs)
 
     def delete(self, sid):
         """
@@ -288,9 +291,11 @@ class PhoneNumbers(ListResource):
             uri = "%s/%s" % (self.uri, TYPES[type])
 
         params = transform_params(kwargs)
-        resp, page = self.request("GET", uri, params=params)
 
-        return [self.load_instance(i) for i in page[self.key]]
+        def load(resp, page):
+            return [self.load_instance(i) for i in page[self.key]]
+
+        return self._request_then(load, "GET", uri, params=params)
 
     def purchase(self, status_callback_url=None, **kwargs):
         """
@@ -314,9 +319,9 @@ class PhoneNumbers(ListResource):
             uri = "%s/%s" % (self.uri, TYPES[number_type])
 
         params = transform_params(kwargs)
-        resp, instance = self.request('POST', uri, data=params)
-
-        return self.load_instance(instance)
+        return self._request_then(
+            lambda resp, instance: self.load_instance(instance),
+            'POST', uri, data=params)
 
     def search(self, **kwargs):
         """
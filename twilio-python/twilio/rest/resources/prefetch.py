@@ -0,0 +1,68 @@
+"""
+Fetching the pages of a list in the background while the caller works
+through the ones already fetched, for
+:meth:`~twilio.rest.resources.ListResource.iter`.
+"""
+import threading
+
+from six.moves import queue
+
+_DONE = object()
+
+
+def read_ahead(pages, depth):
+    """
+    Run the ``pages`` iterator on a worker thread, yielding what it yields
+    in the same order, so the next pages are fetched while the caller is
+    busy with the current one.
+
+    The worker stays at most ``depth`` pages ahead of the caller: once
+    that many are waiting, it stops until the caller takes one. An
+    exception raised by ``pages`` is raised to the caller when it reaches
+    that point. Closing the generator early stops the worker once the page
+    it is fetching, if any, has arrived.
+    """
+    if depth < 1:
+        raise ValueError("prefetch depth must be at least 1")
+
+    ready = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def fetch():
+        try:
+            while True:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    ready.put((_DONE, None))
+                    return
+                except BaseException as e:
+                    ready.put((_DONE, e))
+                    return
+                ready.put((page, None))
+        finally:
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
+
+    worker = threading.Thread(target=fetch, name="twilio-prefetch")
+    worker.daemon = True
+    worker.start()
+
+    try:
+        while True:
+            page, error = ready.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            slots.release()
+            yield page
+    finally:
+        stopped.set()
+        # Wake the worker if it is waiting for a free slot
+        slots.release()
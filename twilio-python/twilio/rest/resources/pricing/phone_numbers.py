@@ -7,9 +7,10 @@ class PhoneNumbers(object):
     name = "Number"
     key = "Number"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, **kwargs):
         self.uri = "%s/PhoneNumbers" % base_uri
-        self.countries = PhoneNumberCountries(self.uri, auth, timeout)
+        self.countries = PhoneNumberCountries(self.uri, auth, timeout,
+                                              **kwargs)
 
 
 class PhoneNumberCountry(NextGenInstanceResource):
@@ -68,6 +69,7 @@ class PhoneNumberCountries(NextGenListResource):
         """Retrieve the list of countries in which Twilio Numbers are
         available."""
 
-        resp, page = self.request("GET", self.uri)
+        def load(resp, page):
+            return [self.load_instance(i) for i in page[self.key]]
 
-        return [self.load_instance(i) for i in page[self.key]]
+        return self._request_then(load, "GET", self.uri)
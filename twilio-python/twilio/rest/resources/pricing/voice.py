@@ -7,10 +7,10 @@ class Voice(object):
     name = "Voice"
     key = "voice"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, **kwargs):
         self.uri = "%s/Voice" % base_uri
-        self.countries = VoiceCountries(self.uri, auth, timeout)
-        self.numbers = VoiceNumbers(self.uri, auth, timeout)
+        self.countries = VoiceCountries(self.uri, auth, timeout, **kwargs)
+        self.numbers = VoiceNumbers(self.uri, auth, timeout, **kwargs)
 
 
 class VoiceCountry(NextGenInstanceResource):
@@ -72,9 +72,11 @@ class VoiceCountries(NextGenListResource):
     def list(self):
         """Retrieve the list of countries in which Twilio Voice is
         available."""
-        resp, page = self.request("GET", self.uri)
 
-        return [self.load_instance(i) for i in page[self.key]]
+        def load(resp, page):
+            return [self.load_instance(i) for i in page[self.key]]
+
+        return self._request_then(load, "GET", self.uri)
 
 
 class VoiceNumber(NextGenInstanceResource):
@@ -0,0 +1,158 @@
+import threading
+import time
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket.
+
+    The bucket refills at ``rate`` tokens per second and holds at most
+    ``capacity`` of them. Callers take tokens with :meth:`reserve`, which
+    never blocks: it hands out the next free token, even if that token won't
+    exist for a while yet, and returns how long the caller has to wait for
+    it. Reservations are served in the order they are made.
+
+    :param float rate: Tokens added per second
+    :param float capacity: The most tokens the bucket can hold, i.e. the
+        largest burst it allows. Defaults to one second's worth of tokens.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = _clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take ``tokens`` from the bucket and return how many seconds to wait
+        before they may be used
+        """
+        with self._lock:
+            now = _clock()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter(object):
+    """
+    Keeps a client's requests under Twilio's throughput limits.
+
+    Every request takes a token from the bucket of its account and from the
+    bucket of the resource it talks to, and requests that send a ``From``
+    number also take one from that number's bucket. The request waits until
+    all of its tokens are available. Each account gets its own set of
+    buckets, so one limiter can be shared by the clients of several
+    accounts.
+
+    .. code-block:: python
+
+        limiter = RateLimiter(account_rate=100,
+                              resource_rates={'Calls': 1, 'Messages': 30},
+                              from_rate=1)
+        client = TwilioRestClient(ACCOUNT_SID, AUTH_TOKEN,
+                                  rate_limiter=limiter)
+
+    :param float account_rate: Requests per second allowed for each account,
+        or None for no limit
+    :param dict resource_rates: Requests per second allowed for each list
+        resource, keyed by the resource's name, e.g. ``Messages``, ``Calls``
+        or ``Tasks``
+    :param float from_rate: Requests per second allowed for each ``From``
+        number, or None for no limit
+    :param float burst: How many seconds' worth of requests may be sent at
+        once after a quiet period
+    """
+
+    def __init__(self, account_rate=None, resource_rates=None,
+                 from_rate=None, burst=1.0):
+        self.account_rate = account_rate
+        self.resource_rates = dict(resource_rates or {})
+        self.from_rate = from_rate
+        self.burst = burst
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, account, resource, data=None):
+        """
+        Take the tokens for one request and return how many seconds to wait
+        before sending it
+
+        :param str account: The account the request is made for
+        :param str resource: The name of the resource requested
+        :param dict data: The parameters sent in the request body
+        """
+        keys = []
+        if self.account_rate is not None:
+            keys.append(('account', account, self.account_rate))
+
+        if resource in self.resource_rates:
+            keys.append(('resource', account, resource,
+                         self.resource_rates[resource]))
+
+        from_ = (data or {}).get('From')
+        if self.from_rate is not None and from_:
+            keys.append(('from', account, from_, self.from_rate))
+
+        wait = 0.0
+        for key in keys:
+            wait = max(wait, self._get_bucket(key).reserve())
+
+        with self._lock:
+            self.requests += 1
+            if wait > 0:
+                self.delayed += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+
+        return wait
+
+    def acquire(self, account, resource, data=None):
+        """
+        Block until a request may be sent. Takes the same arguments as
+        :meth:`reserve`.
+
+        :return: the number of seconds spent waiting
+        """
+        wait = self.reserve(account, resource, data)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self):
+        """
+        Return a dictionary with the number of requests that went through the
+        limiter, how many of them had to wait, and the total and longest
+        waits in seconds
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'delayed': self.delayed,
+                'total_wait': self.total_wait,
+                'max_wait': self.max_wait,
+            }
+
+    def _get_bucket(self, key):
+        with self._lock:
+            if key not in self._buckets:
+                rate = key[-1]
+                self._buckets[key] = TokenBucket(rate,
+                                                 max(1.0, rate * self.burst))
+            return self._buckets[key]
@@ -26,6 +26,8 @@ class Recordings(ListResource):
 
     name = "Recordings"
     instance = Recording
+    date_filter = ("DateCreated>", "DateCreated<")
+    date_field = "date_created"
 
     @normalize_dates
     def list(self, before=None, after=None, **kwargs):
@@ -0,0 +1,130 @@
+import logging
+import random
+import re
+
+from six import binary_type
+
+REDACTED = "[REDACTED]"
+DEFAULT_REDACT_FIELDS = ('auth_token', 'secret', 'private_key', 'api_key',
+                         'password')
+
+
+class RequestLogger(object):
+    """
+    Logs one record per request to the ``twilio`` logger: its method, URL,
+    status and duration, plus a sample of response bodies.
+
+    Nothing is formatted unless the logger is enabled for ``level``. Every
+    record carries its fields as attributes, under the names ``method``,
+    ``url``, ``status``, ``duration``, ``attempt`` and ``resource`` and, if
+    the body was sampled, ``body``, for formatters that emit structured
+    logs. Bodies are cut down to ``max_body_size`` characters, and the
+    values of credential fields such as ``auth_token`` are replaced with
+    ``[REDACTED]``.
+
+    .. code-block:: python
+
+        request_logger = RequestLogger(level=logging.INFO,
+                                       body_sample_rate=0.01)
+        client = TwilioRestClient(ACCOUNT_SID, AUTH_TOKEN,
+                                  request_logger=request_logger)
+
+    :param logger: The logger to write to. Defaults to ``twilio``.
+    :param int level: The level to log requests at
+    :param float body_sample_rate: The share of requests, between 0 and 1,
+        whose response bodies are logged
+    :param int max_body_size: The most characters of a body to log
+    :param redact_fields: The names of the fields whose values are never
+        logged
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG, body_sample_rate=1.0,
+                 max_body_size=4096, redact_fields=DEFAULT_REDACT_FIELDS):
+        self.logger = logger or logging.getLogger('twilio')
+        self.level = level
+        self.body_sample_rate = body_sample_rate
+        self.max_body_size = max_body_size
+        self.redact_fields = tuple(redact_fields)
+
+        names = "|".join(re.escape(f) for f in self.redact_fields)
+        # A JSON string value, or as much of it as there is in a truncated
+        # body
+        self._redact_re = re.compile(
+            r'("(?:%s)"\s*:\s*)"(?:[^"\\]|\\.)*(?:"|$)' % names,
+            re.IGNORECASE)
+
+    def instrument(self, client):
+        """ Start logging the requests ``client`` sends """
+        client.hooks.register('after_response', self.log_response)
+        client.hooks.register('on_retry', self.log_response)
+        client.hooks.register('on_error', self.log_response)
+
+    def log_response(self, info):
+        """
+        Log the outcome of a request
+
+        :param info: The request's
+            :class:`~twilio.rest.resources.hooks.RequestInfo`
+        """
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        fields = {
+            "method": info.method,
+            "url": info.uri,
+            "status": info.status,
+            "duration": info.timings.get('total'),
+            "attempt": info.attempt,
+            "resource": getattr(info.resource, '__name__', None),
+        }
+
+        if info.retry_delay is not None:
+            msg = "%s %s %s, retrying in %.3fs"
+            args = (info.method, info.uri, self._outcome(info),
+                    info.retry_delay)
+        else:
+            msg = "%s %s %s in %.3fs"
+            args = (info.method, info.uri, self._outcome(info),
+                    fields["duration"] or 0)
+
+        body = self.sample_body(info.response)
+        if body is not None:
+            fields["body"] = body
+            msg += ": %s"
+            args += (body,)
+
+        self.logger.log(self.level, msg, *args, extra=fields)
+
+    def sample_body(self, response):
+        """
+        Return the body of ``response`` ready to log, or None if it isn't
+        sampled or can't be read without consuming a stream
+        """
+        if response is None or self.body_sample_rate <= 0:
+            return None
+
+        if random.random() >= self.body_sample_rate:
+            return None
+
+        # Reading a streamed body here would take it away from the caller
+        raw = response.__dict__.get('raw')
+        if not isinstance(raw, binary_type):
+            return None
+
+        truncated = len(raw) > self.max_body_size
+        text = raw[:self.max_body_size].decode('utf-8', 'replace')
+        return self.redact(text) + ("..." if truncated else "")
+
+    def redact(self, text):
+        """ Replace the values of the fields in ``redact_fields`` """
+        if not self.redact_fields:
+            return text
+        return self._redact_re.sub(r'\1"%s"' % REDACTED, text)
+
+    def _outcome(self, info):
+        if info.status is not None:
+            return info.status
+        return info.error.__class__.__name__
+
+
+DEFAULT_REQUEST_LOGGER = RequestLogger()
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+
+from .conditional import ConditionalCache, copy_body
+from .rate_limit import _clock
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class ResponseCache(object):
+    """
+    Keeps the responses to GET requests for resources that rarely change,
+    such as pricing, and answers repeated requests from memory until they
+    expire.
+
+    Only resources given a TTL are cached. ``ttls`` maps resource classes,
+    or their names, to the number of seconds to keep their responses for.
+    A resource also matches the entries for the classes it inherits from,
+    so ``{"NextGenListResource": 60}`` caches every NextGen list for a
+    minute. Responses are cached per account, URL and query parameters.
+
+    Creating, updating or deleting a resource through a client using the
+    cache drops the cached responses for that resource, for everything
+    under it and for the list it belongs to. Changes made any other way are
+    only seen once the TTL runs out.
+
+    At most ``max_entries`` responses are kept, dropping the least recently
+    used first. Safe to use from several threads and to share between
+    clients.
+
+    :param dict ttls: Resource classes or class names mapped to TTLs in
+        seconds
+    :param float default_ttl: The TTL for resources not in ``ttls``. By
+        default they aren't cached.
+    :param int max_entries: The most responses to keep
+    """
+
+    def __init__(self, ttls=None, default_ttl=None,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl(self, resource):
+        """ How long to keep responses for ``resource``, or None """
+        for cls in type(resource).__mro__:
+            if cls in self.ttls:
+                return self.ttls[cls]
+            if cls.__name__ in self.ttls:
+                return self.ttls[cls.__name__]
+        return self.default_ttl
+
+    def get(self, resource, uri, kwargs):
+        """
+        Return the cached response and decoded body for a GET of ``uri`` by
+        ``resource``, or None
+        """
+        if self.ttl(resource) is None:
+            return None
+
+        key = self._key(resource, uri, kwargs)
+        now = _clock()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= now:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self.hits += 1
+
+        expires, _, resp, body = entry
+        return resp, copy_body(body)
+
+    def put(self, resource, uri, kwargs, resp, body):
+        """ Cache the response to a GET of ``uri`` by ``resource`` """
+        ttl = self.ttl(resource)
+        if ttl is None or resp.status_code != 200:
+            return
+
+        key = self._key(resource, uri, kwargs)
+        entry = (_clock() + ttl, uri, resp, copy_body(body))
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, uri, list_uri=None):
+        """
+        Drop the responses for ``uri``, for everything under it and for
+        ``list_uri``, the list it belongs to, whatever their query strings
+        """
+        prefix = uri + "/"
+        with self._lock:
+            stale = []
+            for key, entry in self._entries.items():
+                path = entry[1].split("?", 1)[0]
+                if path in (uri, list_uri) or path.startswith(prefix):
+                    stale.append(key)
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """ Drop every response """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        :return: a dict with the number of requests answered from the cache
+            (``hits``), the number sent to the API (``misses``), the number
+            of responses dropped to make room (``evictions``) and the number
+            kept (``entries``)
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def _key(self, resource, uri, kwargs):
+        # Some answers, such as prices, depend on the account asking
+        account = resource.auth[0] if resource.auth else None
+        return account, ConditionalCache.key(uri, kwargs.get('params'))
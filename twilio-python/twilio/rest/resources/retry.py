@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from email.utils import parsedate_tz, mktime_tz
+
+DEFAULT_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+_local = threading.local()
+
+
+class RetryPolicy(object):
+    """
+    Decides whether, and after how long, a failed request is sent again.
+
+    Requests that fail with one of the ``statuses`` are retried with
+    exponential backoff and full jitter: before retry ``n`` the client waits
+    a random time between 0 and ``min(backoff_max, backoff_base * 2 ** n)``
+    seconds. When the response carries a ``Retry-After`` header, the client
+    waits that long instead.
+
+    Only idempotent methods are retried by default. Creating a resource
+    twice is usually worse than failing once, so POST requests are only
+    retried if ``methods`` includes them:
+
+    .. code-block:: python
+
+        policy = RetryPolicy(methods=IDEMPOTENT_METHODS | set(['POST']))
+        client = TwilioRestClient(ACCOUNT_SID, AUTH_TOKEN,
+                                  retry_policy=policy)
+
+    :param int max_attempts: The most times a request is sent, including the
+        first attempt. 1 disables retries.
+    :param statuses: The HTTP status codes that are worth retrying
+    :param methods: The HTTP methods that may be retried
+    :param float backoff_base: The upper bound of the first backoff, in
+        seconds
+    :param float backoff_max: The most the backoff ever grows to, in seconds
+    :param float max_retry_after: Give up instead of waiting when the API
+        asks to be left alone for longer than this many seconds
+    """
+
+    def __init__(self, max_attempts=3, statuses=DEFAULT_RETRY_STATUSES,
+                 methods=IDEMPOTENT_METHODS, backoff_base=0.5,
+                 backoff_max=20.0, max_retry_after=60.0):
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    def get_retry_delay(self, method, error, attempt):
+        """
+        Return how many seconds to wait before sending a request again, or
+        None if it should not be retried
+
+        :param str method: The HTTP method of the request
+        :param error: The :exc:`~twilio.TwilioRestException` the request
+            failed with
+        :param int attempt: How many times the request has been sent
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if method.upper() not in self.methods:
+            return None
+
+        if error.status not in self.statuses:
+            return None
+
+        retry_after = parse_retry_after(error.headers)
+        if retry_after is None:
+            return self.get_backoff(attempt)
+
+        if retry_after > self.max_retry_after:
+            return None
+
+        return retry_after
+
+    def get_backoff(self, attempt):
+        """ Return a random backoff for the retry following ``attempt`` """
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+def retries_suppressed():
+    """ Whether :func:`suppress_retries` is in effect in this thread """
+    return getattr(_local, 'suppressed', False)
+
+
+@contextmanager
+def suppress_retries():
+    """
+    Send each request made by this thread in the block once, whatever its
+    client's retry policy, for callers that retry them on their own
+    """
+    previous = retries_suppressed()
+    _local.suppressed = True
+    try:
+        yield
+    finally:
+        _local.suppressed = previous
+
+
+def parse_retry_after(headers):
+    """
+    Return the number of seconds a ``Retry-After`` header asks clients to
+    wait, or None if the headers don't have a valid one
+    """
+    if not headers:
+        return None
+
+    value = headers.get('retry-after')
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        date = parsedate_tz(value)
+    except TypeError:
+        return None
+
+    if date is None:
+        return None
+
+    return max(0.0, mktime_tz(date) - time.time())
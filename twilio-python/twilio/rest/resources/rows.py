@@ -0,0 +1,67 @@
+"""
+Compact, read-only records for listing many instances, for ``iter`` and
+``list`` with ``rows=True``.
+"""
+import keyword
+from operator import itemgetter
+
+_row_types = {}
+
+
+class Row(tuple):
+    """
+    An instance as a tuple of its fields, in the order of :attr:`_fields`,
+    also readable as attributes. ``from`` is read as ``from_``.
+
+    Values are kept as the API returns them: dates are strings, and nested
+    objects are dicts. Rows have no ``__dict__``, can't be changed and
+    don't refer back to their list, so they take a fraction of the memory
+    of instance resources.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    @classmethod
+    def _make(cls, record):
+        """ Return the row for ``record``, a dict from the API """
+        return tuple.__new__(cls, [record.get(f) for f in cls._fields])
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+    def __repr__(self):
+        return "Row(%s)" % ", ".join("%s=%r" % (f, v)
+                                     for f, v in zip(self._fields, self))
+
+
+def row_type(fields):
+    """ Return the :class:`Row` class with ``fields`` """
+    fields = tuple(fields)
+    cls = _row_types.get(fields)
+    if cls is None:
+        attrs = {'__slots__': (), '_fields': fields}
+        for i, field in enumerate(fields):
+            name = field + "_" if keyword.iskeyword(field) else field
+            attrs[name] = property(itemgetter(i))
+        cls = _row_types[fields] = type("Row", (Row,), attrs)
+    return cls
+
+
+def row_loader(fields=None):
+    """
+    Return a function turning a dict from the API into a :class:`Row` of
+    ``fields``, or of all its fields, sorted by name
+    """
+    if fields is not None:
+        return row_type(fields)._make
+    return lambda record: row_type(sorted(record))._make(record)
+
+
+def projector(fields):
+    """
+    Return a function copying only ``fields`` out of a dict from the API
+    """
+    fields = tuple(fields)
+    return lambda record: dict((f, record[f]) for f in fields
+                               if f in record)
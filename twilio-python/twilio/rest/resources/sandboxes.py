@@ -10,8 +10,7 @@ class Sandbox(InstanceResource):
         """
         Update your Twilio Sandbox
         """
-        a = self.parent.update(**kwargs)
-        self.load(a.__dict__)
+        return self._refresh(self.parent.update(**kwargs))
 
 
 class Sandboxes(ListResource):
@@ -27,6 +26,6 @@ class Sandboxes(ListResource):
         """
         Update your Twilio Sandbox
         """
-        resp, entry = self.request("POST", self.uri,
-                                   body=transform_params(kwargs))
-        return self.create_instance(entry)
+        return self._request_then(
+            lambda resp, entry: self.load_instance(entry),
+            "POST", self.uri, data=transform_params(kwargs))
@@ -0,0 +1,184 @@
+"""
+Listing a date range of a resource by splitting it into windows and
+listing them concurrently, for
+:meth:`~twilio.rest.resources.ListResource.scan`.
+"""
+import datetime
+import threading
+from collections import deque
+
+from six import string_types
+from six.moves import queue
+
+from .bulk import DEFAULT_CONCURRENCY
+from .tracing import activate
+
+DEFAULT_WINDOW_DAYS = 7
+
+
+def to_date(d):
+    """ Return ``d``, a date, datetime or YYYY-MM-DD string, as a date """
+    if isinstance(d, datetime.datetime):
+        return d.date()
+    if isinstance(d, datetime.date):
+        return d
+    if isinstance(d, string_types):
+        return datetime.datetime.strptime(d, "%Y-%m-%d").date()
+    raise TypeError("Expected a date, not %r" % (d,))
+
+
+def date_windows(after, before, days):
+    """
+    Split the days from ``after`` to ``before``, both included, into
+    windows of at most ``days`` days, the latest first
+    """
+    windows = []
+    end = before
+    while end >= after:
+        start = max(after, end - datetime.timedelta(days=days - 1))
+        windows.append(_Window(start, end))
+        end = start - datetime.timedelta(days=1)
+    return windows
+
+
+def parallel_scan(resource, params, after, before,
+                  days=DEFAULT_WINDOW_DAYS, concurrency=DEFAULT_CONCURRENCY):
+    """
+    List the instances of ``resource`` matching ``params`` from ``after``
+    to ``before`` on ``concurrency`` worker threads, one window of
+    ``days`` days at a time, and yield them in the order a single listing
+    would, the latest first.
+
+    A window that doesn't fit in one page is split in two, down to a
+    single day, and the halves are listed instead. Each window is read
+    whole before its instances are yielded, and at most ``2 *
+    concurrency`` windows are listed ahead of the caller.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if days < 1:
+        raise ValueError("days must be at least 1")
+
+    after, before = to_date(after), to_date(before)
+    if after > before:
+        raise ValueError("after must not be later than before")
+
+    return _scan(resource, params, date_windows(after, before, days),
+                 concurrency)
+
+
+def _scan(resource, params, windows, concurrency):
+    window_limit = 2 * concurrency
+    waiting = deque(windows)
+    pending = deque()
+    tasks = queue.Queue()
+    stopped = threading.Event()
+    workers = []
+
+    # The span stays open while the caller works through the instances,
+    # but is only made the parent of the page requests
+    with resource._trace('scan', active=False) as span:
+
+        def work():
+            while True:
+                window = tasks.get()
+                if window is None:
+                    return
+                if not stopped.is_set():
+                    window.run(resource, params, span, tasks.put)
+                window.done.set()
+
+        def hire():
+            while len(workers) < min(concurrency, len(pending)):
+                worker = threading.Thread(target=work, name="twilio-scan")
+                worker.daemon = True
+                worker.start()
+                workers.append(worker)
+
+        try:
+            while True:
+                while waiting and len(pending) < window_limit:
+                    window = waiting.popleft()
+                    pending.append(window)
+                    tasks.put(window)
+                hire()
+
+                if not pending:
+                    return
+
+                window = pending.popleft()
+                window.done.wait()
+                if window.error is not None:
+                    raise window.error
+
+                if window.halves:
+                    pending.extendleft(reversed(window.halves))
+                    hire()
+                    continue
+
+                for item in window.items:
+                    yield resource.load_instance(item)
+        finally:
+            stopped.set()
+            for _ in workers:
+                tasks.put(None)
+
+
+class _Window(object):
+    """ The days from ``start`` to ``end``, both included """
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+        self.items = []
+        self.halves = None
+        self.error = None
+        self.done = threading.Event()
+
+    def __repr__(self):
+        return "<Window %s to %s>" % (self.start, self.end)
+
+    def split(self):
+        """ Return the later and the earlier half of the window """
+        middle = self.start + (self.end - self.start) // 2
+        return [_Window(middle + datetime.timedelta(days=1), self.end),
+                _Window(self.start, middle)]
+
+    def run(self, resource, params, span, submit):
+        """
+        List the instances of ``resource`` in the window, or, if there is
+        more than one page of them, split the window and ``submit`` the
+        halves
+        """
+        try:
+            self._list(resource, params, span, submit)
+        except Exception as e:
+            self.error = e
+
+    def _list(self, resource, params, span, submit):
+        after, before = resource.date_filter
+        params = dict(params)
+        params[after] = str(self.start)
+        params[before] = str(self.end)
+
+        uri, kwargs = resource.uri, {'params': params}
+        first = True
+        while uri:
+            with activate(span):
+                resp, page = resource.request("GET", uri, **kwargs)
+
+            items = resource._page_items(page)
+            if items is None:
+                return
+
+            uri, kwargs = resource._next_page(page, uri, kwargs)
+            if first and uri and self.start < self.end:
+                # Too dense to list in one go: the first page is dropped,
+                # and the halves listed side by side
+                self.halves = self.split()
+                for half in self.halves:
+                    submit(half)
+                return
+
+            first = False
+            self.items.extend(items)
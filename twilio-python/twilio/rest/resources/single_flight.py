@@ -0,0 +1,92 @@
+import threading
+
+from .conditional import ConditionalCache
+
+
+class SingleFlight(object):
+    """
+    Lets concurrent identical requests share one trip to the API.
+
+    While a GET is in flight, any other thread making the same request (the
+    same account, URL, query parameters and headers) waits for it instead
+    of sending its own, and gets the same response, or the same exception.
+    Each caller loads its own copy of the decoded body. Requests that
+    aren't concurrent are never combined, so nothing is served stale.
+
+    Every client has one, shared by all of its resources. Pass one instance
+    to several clients to combine their requests too.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    @staticmethod
+    def key(resource, uri, kwargs):
+        """ The key identical requests of ``resource`` share """
+        account = resource.auth[0] if resource.auth else None
+        headers = kwargs.get('headers') or {}
+        return (account, ConditionalCache.key(uri, kwargs.get('params')),
+                tuple(sorted(headers.items())))
+
+    def do(self, key, fn):
+        """
+        Call ``fn``, unless a call for ``key`` is already in flight, in which
+        case wait for it and return its result instead
+
+        :return: the result, and whether it went to more than one caller
+        """
+        call, leader = self._join(key, _Call)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            self._leave(key)
+            call.done.set()
+        return call.result, call.followers > 0
+
+    def _join(self, key, new_call):
+        """
+        Return the call in flight for ``key``, starting one with
+        ``new_call`` if there is none, and whether it was started
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = new_call()
+                return call, True
+
+            call.followers += 1
+            self.shared += 1
+            return call, False
+
+    def _leave(self, key):
+        """ End the call for ``key``; later callers start a new one """
+        with self._lock:
+            del self._calls[key]
+
+    def stats(self):
+        """
+        :return: a dict with the number of requests ``in_flight`` and the
+            number of requests that were ``shared`` instead of sent
+        """
+        with self._lock:
+            return {"in_flight": len(self._calls), "shared": self.shared}
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
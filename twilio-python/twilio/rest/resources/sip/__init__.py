@@ -12,16 +12,24 @@ class Sip(object):
     name = "SIP"
     key = "sip"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, client=None,
+                 transport=None):
         self.uri = "%s/SIP" % base_uri
         self.auth = auth
         self.timeout = timeout
-        self.domains = Domains(self.uri, auth, timeout)
-        self.credential_lists = SipCredentialLists(self.uri, auth, timeout)
+        self.client = client
+        self.transport = transport
+        self.domains = Domains(self.uri, auth, timeout, client=client,
+                               transport=transport)
+        self.credential_lists = SipCredentialLists(self.uri, auth, timeout,
+                                                   client=client,
+                                                   transport=transport)
         self.ip_access_control_lists = SipIpAccessControlLists(
             self.uri,
             auth,
             timeout,
+            client=client,
+            transport=transport,
         )
 
     def ip_access_control_list_mappings(self, domain_sid):
@@ -30,7 +38,9 @@ class Sip(object):
         :class:`Domain` with the given domain_sid
         """
         base_uri = "%s/Domains/%s" % (self.uri, domain_sid)
-        return IpAccessControlListMappings(base_uri, self.auth, self.timeout)
+        return IpAccessControlListMappings(base_uri, self.auth, self.timeout,
+                                           client=self.client,
+                                           transport=self.transport)
 
     def credential_list_mappings(self, domain_sid):
         """
@@ -38,7 +48,9 @@ class Sip(object):
         :class:`Domain` with the given domain_sid
         """
         base_uri = "%s/Domains/%s" % (self.uri, domain_sid)
-        return CredentialListMappings(base_uri, self.auth, self.timeout)
+        return CredentialListMappings(base_uri, self.auth, self.timeout,
+                                      client=self.client,
+                                      transport=self.transport)
 
     def ip_addresses(self, ip_access_control_list_sid):
         """
@@ -49,7 +61,9 @@ class Sip(object):
             self.uri,
             ip_access_control_list_sid,
         )
-        return IpAddresses(base_uri, self.auth, self.timeout)
+        return IpAddresses(base_uri, self.auth, self.timeout,
+                           client=self.client,
+                           transport=self.transport)
 
     def credentials(self, credential_list_sid):
         """
@@ -60,4 +74,6 @@ class Sip(object):
             self.uri,
             credential_list_sid,
         )
-        return Credentials(base_uri, self.auth, self.timeout)
+        return Credentials(base_uri, self.auth, self.timeout,
+                           client=self.client,
+                           transport=self.transport)
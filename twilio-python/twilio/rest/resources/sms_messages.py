@@ -61,10 +61,10 @@ class Sms(object):
     name = "SMS"
     key = "sms"
 
-    def __init__(self, base_uri, auth, timeout):
+    def __init__(self, base_uri, auth, timeout, **kwargs):
         self.uri = "%s/SMS" % base_uri
-        self.messages = SmsMessages(self.uri, auth, timeout)
-        self.short_codes = ShortCodes(self.uri, auth, timeout)
+        self.messages = SmsMessages(self.uri, auth, timeout, **kwargs)
+        self.short_codes = ShortCodes(self.uri, auth, timeout, **kwargs)
 
 
 class SmsMessage(InstanceResource):
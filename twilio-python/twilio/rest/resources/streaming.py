@@ -0,0 +1,130 @@
+import codecs
+
+from .imports import json
+
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARS = '0123456789+-.eE'
+
+
+class PageParser(object):
+    """
+    Parses a page of a list resource while it is being downloaded.
+
+    Iterating over the parser yields the elements of the page's top-level
+    lists one at a time, as soon as each of them has arrived. Every other
+    top-level value, such as ``next_page_uri`` or ``meta``, is collected in
+    :attr:`page`, where the lists themselves show up as empty lists. Read
+    :attr:`page` once the iteration is over, as values that come after the
+    lists are only known by then.
+
+    :param chunks: An iterable of the body of the response, as bytes
+    :param keys: The names of the lists to yield elements of. None yields
+        the elements of every top-level list.
+    """
+
+    def __init__(self, chunks, keys=None):
+        self.chunks = iter(chunks)
+        self.keys = keys
+        self.page = {}
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buf = self._utf8.decode(b'')
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            self._expect(':')
+
+            if self._peek() == '[' and (self.keys is None or key in self.keys):
+                self._pos += 1
+                self.page[key] = []
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self.page[key] = self._value()
+
+            if self._expect(',}') == '}':
+                return
+
+    def _fill(self):
+        """ Read another chunk into the buffer, returning False at the end """
+        if self._eof:
+            return False
+
+        try:
+            text = self._utf8.decode(next(self.chunks))
+        except StopIteration:
+            self._eof = True
+            text = self._utf8.decode(b'', True)
+
+        # Drop whatever has been parsed already
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """ Return the next character that isn't whitespace, or '' """
+        while True:
+            while (self._pos < len(self._buf) and
+                    self._buf[self._pos] in WHITESPACE):
+                self._pos += 1
+
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError("Expected one of %r at %r" % (
+                chars, self._buf[self._pos:self._pos + 20]))
+
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """ Decode the JSON value starting at the current position """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # The value hasn't fully arrived yet
+                if not self._fill():
+                    raise
+                continue
+
+            # A number or literal running up to the end of the buffer may
+            # continue in the next chunk. So may a number followed only by
+            # the start of an exponent or fraction, such as "1.5e", which
+            # decodes as 1.5 on its own.
+            if self._continues(end) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+    def _continues(self, end):
+        """
+        Whether the value decoded from the current position up to ``end``
+        may go on past the end of the buffer
+        """
+        if end == len(self._buf):
+            return True
+        if self._buf[self._pos] not in '-0123456789':
+            return False
+        return all(c in NUMBER_CHARS for c in self._buf[end:])
@@ -0,0 +1,170 @@
+"""
+Listing only what is new since the last listing, for
+:meth:`~twilio.rest.resources.ListResource.sync`.
+"""
+import datetime
+import os
+import tempfile
+import threading
+
+from ...json_codec import get_json_codec
+from .scan import to_date
+from .util import parse_iso_date, parse_rfc2822_date
+
+
+class CheckpointStore(object):
+    """
+    Where :meth:`~twilio.rest.resources.ListResource.sync` keeps how far
+    each listing got between runs.
+
+    Subclass it to keep checkpoints in a database or a shared cache. A
+    checkpoint is a dict that can be encoded as JSON.
+    """
+
+    def load(self, key):
+        """ Return the checkpoint saved for ``key``, or None """
+        raise NotImplementedError
+
+    def save(self, key, checkpoint):
+        """ Save ``checkpoint`` for ``key``, replacing any other """
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """ Keeps checkpoints for as long as the process runs """
+
+    def __init__(self):
+        self.checkpoints = {}
+
+    def load(self, key):
+        return self.checkpoints.get(key)
+
+    def save(self, key, checkpoint):
+        self.checkpoints[key] = checkpoint
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints in a JSON file, replaced whole on every save so a
+    crash never leaves it half written
+
+    :param str path: The file to keep checkpoints in
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._codec = get_json_codec()
+
+    def load(self, key):
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key, checkpoint):
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = checkpoint
+            self._write(checkpoints)
+
+    def _read(self):
+        try:
+            with open(self.path, "rb") as f:
+                return self._codec.loads(f.read())
+        except (IOError, OSError):
+            return {}
+
+    def _write(self, checkpoints):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._codec.dumps(checkpoints).encode("utf-8"))
+            _replace(tmp, self.path)
+        except Exception:
+            os.remove(tmp)
+            raise
+
+
+def _replace(src, dst):
+    try:
+        os.replace(src, dst)
+    except AttributeError:
+        # Python 2 has no os.replace, and its rename only overwrites on
+        # POSIX systems
+        os.rename(src, dst)
+
+
+def record_time(value):
+    """
+    Return ``value``, an RFC 2822 or ISO 8601 date string, as a datetime in
+    UTC, or None
+    """
+    if not value:
+        return None
+    parsed = parse_rfc2822_date(value)
+    if parsed is None:
+        parsed = parse_iso_date(value)
+        if not isinstance(parsed, datetime.datetime):
+            return None
+    return parsed
+
+
+def record_day(value):
+    """ Return the day of ``value``, as for :func:`record_time` """
+    parsed = record_time(value)
+    return parsed.date() if parsed is not None else None
+
+
+def delta_sync(resource, store, key, params, since=None, overlap=0,
+               raw=False):
+    """
+    List the instances of ``resource`` matching ``params`` from the day
+    saved in ``store`` for ``key``, or from ``since`` the first time, and
+    yield those not yielded before. Once they have all been yielded, the
+    latest day seen is saved as the start of the next run.
+
+    Days are the finest the API's date filters allow, so the saved day is
+    listed again next time, along with the ``overlap`` days before it. The
+    instances listed on those days are saved too, with their
+    ``date_updated``, and only yielded again if that has changed.
+    """
+    after, _ = resource.date_filter
+    checkpoint = store.load(key) or {}
+    seen = checkpoint.get("seen", {})
+    watermark = checkpoint.get("watermark", since)
+
+    params = dict(params)
+    if watermark is not None:
+        watermark = to_date(watermark)
+        start = watermark - datetime.timedelta(days=overlap)
+        params[after] = str(start)
+
+    uri, kwargs = resource._first_page(params)
+    records = resource._iter_pages(uri, kwargs, raw=True)
+
+    latest = watermark
+    recent = {}
+    for record in records:
+        sid = record.get("sid")
+        updated = record.get("date_updated") or ""
+        day = record_day(record.get(resource.date_field))
+
+        if day is not None:
+            if latest is None or day > latest:
+                latest = day
+            if day >= latest - datetime.timedelta(days=overlap):
+                recent[sid] = (day, updated)
+
+        if seen.get(sid) != updated:
+            yield record if raw else resource.load_instance(record)
+
+    if latest is None:
+        return
+
+    cutoff = latest - datetime.timedelta(days=overlap)
+    store.save(key, {
+        "watermark": str(latest),
+        "seen": dict((sid, updated)
+                     for sid, (day, updated) in recent.items()
+                     if day >= cutoff),
+    })
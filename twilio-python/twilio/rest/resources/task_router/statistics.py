@@ -25,8 +25,8 @@ class Statistics(NextGenListResource):
 
     def get(self, **kwargs):
         params = transform_params(kwargs)
-        _, data = self.request('GET', self.uri, params=params)
-        return self.load_instance(data)
+        return self._request_then(lambda _, data: self.load_instance(data),
+                                  'GET', self.uri, params=params)
 
     def load_instance(self, data):
         # Overridden because Statistics instances
@@ -0,0 +1,154 @@
+"""
+A vendor-neutral tracing interface.
+
+The library opens spans through a :class:`Tracer` given to the client:
+
+* ``<Resource>.iter`` around a whole paging loop, with one child request
+  span per page
+* ``<Resource>.create``, ``<Resource>.update`` and ``<Resource>.delete``
+  around those operations
+* ``<METHOD> <uri template>`` around every request, its retries included
+
+Subclass :class:`Tracer` and :class:`Span` to bridge these to a tracing
+system. For OpenTelemetry:
+
+.. code-block:: python
+
+    from opentelemetry import trace
+
+    class OpenTelemetrySpan(Span):
+
+        def __init__(self, span):
+            self.span = span
+
+        def set_attribute(self, key, value):
+            self.span.set_attribute(key, value)
+
+        def record_exception(self, exception):
+            self.span.record_exception(exception)
+            self.span.set_status(trace.Status(trace.StatusCode.ERROR))
+
+        def end(self):
+            self.span.end()
+
+    class OpenTelemetryTracer(Tracer):
+
+        def __init__(self, tracer):
+            self.tracer = tracer
+
+        def start_span(self, name, parent=None, attributes=None):
+            context = None
+            if parent is not None:
+                context = trace.set_span_in_context(parent.span)
+            return OpenTelemetrySpan(self.tracer.start_span(
+                name, context=context, attributes=attributes))
+
+    client = TwilioRestClient(ACCOUNT_SID, AUTH_TOKEN,
+                              tracer=OpenTelemetryTracer(trace.get_tracer(
+                                  "twilio")))
+"""
+import threading
+from contextlib import contextmanager
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+
+class Span(object):
+    """ A span that records nothing; the interface tracers implement """
+
+    def set_attribute(self, key, value):
+        pass
+
+    def record_exception(self, exception):
+        """ Note that the operation failed with ``exception`` """
+        pass
+
+    def end(self):
+        pass
+
+
+class Tracer(object):
+    """ A tracer that records nothing; the interface tracers implement """
+
+    def start_span(self, name, parent=None, attributes=None):
+        """
+        Start a span
+
+        :param str name: What the span is called
+        :param parent: The :class:`Span` opened by this library that the new
+            span is part of. None if the library has no span open, in which
+            case the tracer may pick a parent from its own context.
+        :param dict attributes: Attributes to set on the span
+        :rtype: :class:`Span`
+        """
+        return Span()
+
+
+if contextvars is not None:
+    _current_span = contextvars.ContextVar('twilio_span', default=None)
+
+    def current_span():
+        """ Return the span this library opened last in this context """
+        return _current_span.get()
+
+    @contextmanager
+    def activate(span):
+        """ Make ``span`` the parent of the spans opened in the block """
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+else:
+    _local = threading.local()
+
+    def current_span():
+        """ Return the span this library opened last in this thread """
+        return getattr(_local, 'span', None)
+
+    @contextmanager
+    def activate(span):
+        """ Make ``span`` the parent of the spans opened in the block """
+        previous = current_span()
+        _local.span = span
+        try:
+            yield span
+        finally:
+            _local.span = previous
+
+
+@contextmanager
+def traced(tracer, name, attributes=None, parent=None, active=True):
+    """
+    Run the block in a span, ending it when the block is done
+
+    :param tracer: The :class:`Tracer` to start the span with. With None,
+        no span is started and the block gets None.
+    :param parent: The parent span. Defaults to :func:`current_span`.
+    :param bool active: Make the span the parent of spans opened in the
+        block. Leave this off in code that may be suspended in the middle of
+        the block, such as generators, and pass the span on instead.
+    """
+    if tracer is None:
+        yield None
+        return
+
+    if parent is None:
+        parent = current_span()
+
+    span = tracer.start_span(name, parent=parent, attributes=attributes)
+    try:
+        if active:
+            with activate(span):
+                yield span
+        else:
+            yield span
+    except Exception as e:
+        span.record_exception(e)
+        raise
+    finally:
+        span.end()
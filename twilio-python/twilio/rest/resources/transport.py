@@ -0,0 +1,482 @@
+import logging
+import os
+import threading
+
+from six.moves import queue
+
+from ...exceptions import TwilioException
+from .connection import Connection
+from .imports import (
+    httplib2,
+    urllib3,
+    PROXY_TYPE_HTTP,
+    PROXY_TYPE_SOCKS4,
+    PROXY_TYPE_SOCKS5
+)
+from .util import basic_auth_header
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_REDIRECTS = 5
+STREAM_CHUNK_SIZE = 64 * 1024
+
+logger = logging.getLogger('twilio')
+
+
+def get_cert_file():
+    """ Get the cert file location or bail """
+    # XXX - this currently fails test coverage because we don't actually go
+    # over the network anywhere. Might be good to have a test that stands up a
+    # local server and authenticates against it.
+    try:
+        # Apparently __file__ is not available in all places so wrapping this
+        # in a try/catch
+        current_path = os.path.realpath(__file__)
+        ca_cert_path = os.path.join(current_path, "..", "..", "..",
+                                    "conf", "cacert.pem")
+        return os.path.abspath(ca_cert_path)
+    except Exception:
+        # None means use the default system file
+        return None
+
+
+class Transport(object):
+    """
+    The interface between the library and the network.
+
+    A transport sends a single HTTP request and returns the raw response.
+    Anything it needs to keep between requests, such as open connections,
+    lives on the transport, so one instance should be shared by every
+    request that can reuse them. Transports must be safe to use from several
+    threads at once.
+
+    Pass an instance as the ``transport`` argument of any client or list
+    resource to route its requests through it.
+    """
+
+    def request(self, method, url, body=None, headers=None, timeout=None,
+                auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request
+
+        :param str method: The HTTP method to use
+        :param str url: The full URL, including the query string
+        :param str body: The encoded request body, or None
+        :param dict headers: HTTP headers to send with the request
+        :param float timeout: Socket/Read timeout for the request
+        :param tuple auth: A (username, password) pair for Basic auth
+        :param bool allow_redirects: Whether to follow redirects
+
+        :return: a tuple of the integer status code, a mapping of lower-cased
+            response header names to values and the response body as bytes
+        """
+        raise NotImplementedError
+
+    def stream(self, method, url, body=None, headers=None, timeout=None,
+               auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request, and return the response body as it
+        arrives. Takes the same arguments as :meth:`request`.
+
+        Compressed bodies are decompressed chunk by chunk, so neither the
+        compressed nor the decompressed body has to fit in memory at once.
+        Transports that can't stream return the whole body as one chunk.
+
+        :return: a tuple of the integer status code, a mapping of lower-cased
+            response header names to values and an iterator over the
+            decompressed body, as bytes
+        """
+        status, resp_headers, content = self.request(
+            method, url, body=body, headers=headers, timeout=timeout,
+            auth=auth, allow_redirects=allow_redirects,
+        )
+        return status, resp_headers, iter([content])
+
+    def warm_up(self, url, connections=1, timeout=None):
+        """
+        Open connections to the host of ``url`` ahead of the first request,
+        so that it doesn't pay for the DNS lookup and the TCP and TLS
+        handshakes. Each connection is opened with a HEAD request. Failures
+        are logged, not raised.
+
+        This implementation sends the requests one after the other, which
+        opens a single connection on transports that reuse them.
+
+        :param str url: A URL on the host to connect to
+        :param int connections: The number of connections to open
+        :param float timeout: The timeout requests will be sent with;
+            transports may keep separate connections per timeout
+        :return: the number of connections opened
+        """
+        opened = 0
+        for _ in range(connections):
+            try:
+                self.request("HEAD", url, timeout=timeout)
+            except Exception as e:
+                _warm_up_failed(url, e)
+            else:
+                opened += 1
+        return opened
+
+    def close(self):
+        """ Release any connections held by this transport """
+        pass
+
+    def pool_stats(self):
+        """
+        Count this transport's connections
+
+        :return: a dict with the number of connections ``in_use``, the
+            number of ``idle`` ones waiting to be reused and how many have
+            been ``created`` so far. Counts a transport can't tell are left
+            out.
+        """
+        return {}
+
+
+class Httplib2Transport(Transport):
+    """
+    Sends requests over a pool of long-lived :class:`httplib2.Http` objects.
+
+    Every Http object keeps a persistent connection to each host it talks
+    to, so reusing them lets consecutive requests skip the TCP and TLS
+    handshakes. Http objects are not thread-safe, so each request checks one
+    out of the pool and hands it back once the response has been read.
+
+    Objects are pooled separately for every (timeout, proxy) combination. At
+    most ``pool_size`` idle objects are kept in each pool; any extra objects
+    created under concurrent load are closed when they are handed back.
+
+    :param int pool_size: The number of idle connections to keep per host
+    :param str ca_certs: Path to a CA bundle. Defaults to the bundle shipped
+        with this library.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, ca_certs=None):
+        self.pool_size = pool_size
+        self.ca_certs = ca_certs or get_cert_file()
+        self._pools = {}
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._created = 0
+
+    def request(self, method, url, body=None, headers=None, timeout=None,
+                auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request. See :meth:`Transport.request`.
+        """
+        proxy_info = Connection.proxy_info()
+        pool = self._get_pool((timeout, proxy_info))
+
+        http = self._checkout(pool, timeout, proxy_info)
+        resp, content = self._send(http, method, url, body, headers, auth,
+                                   allow_redirects)
+        self._checkin(pool, http)
+
+        # httplib2 responses are dicts of lower-cased headers
+        return resp.status, resp, content
+
+    def warm_up(self, url, connections=1, timeout=None):
+        """
+        Open up to ``pool_size`` connections to the host of ``url``. See
+        :meth:`Transport.warm_up`.
+        """
+        proxy_info = Connection.proxy_info()
+        pool = self._get_pool((timeout, proxy_info))
+
+        # Hold every Http object until it has connected, so that each one
+        # opens a connection of its own
+        held = [self._checkout(pool, timeout, proxy_info)
+                for _ in range(min(connections, self.pool_size))]
+
+        opened = 0
+        for http in held:
+            try:
+                self._send(http, "HEAD", url)
+            except Exception as e:
+                _warm_up_failed(url, e)
+            else:
+                opened += 1
+                self._checkin(pool, http)
+        return opened
+
+    def close(self):
+        """ Close every idle connection held by this transport """
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+
+        for pool in pools:
+            while True:
+                try:
+                    self._close(pool.get_nowait())
+                except queue.Empty:
+                    break
+
+    def pool_stats(self):
+        """
+        Count this transport's connections. See :meth:`Transport.pool_stats`.
+        """
+        with self._lock:
+            return {
+                "in_use": self._in_use,
+                "idle": sum(p.qsize() for p in self._pools.values()),
+                "created": self._created,
+            }
+
+    def _count(self, in_use=0, created=0):
+        with self._lock:
+            self._in_use += in_use
+            self._created += created
+
+    def _get_pool(self, key):
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = queue.LifoQueue(self.pool_size)
+            return self._pools[key]
+
+    def _checkout(self, pool, timeout, proxy_info):
+        try:
+            return pool.get_nowait()
+        except queue.Empty:
+            self._count(created=1)
+            return httplib2.Http(
+                timeout=timeout,
+                ca_certs=self.ca_certs,
+                proxy_info=proxy_info,
+            )
+
+    def _checkin(self, pool, http):
+        try:
+            pool.put_nowait(http)
+        except queue.Full:
+            self._close(http)
+
+    def _send(self, http, method, url, body=None, headers=None, auth=None,
+              allow_redirects=False):
+        http.follow_redirects = allow_redirects
+
+        # Credentials stick to the Http object, so drop the ones used by
+        # whoever had it last
+        http.clear_credentials()
+        if auth is not None:
+            http.add_credentials(auth[0], auth[1])
+
+        self._count(in_use=1)
+        try:
+            return http.request(url, method, headers=headers, body=body)
+        except Exception:
+            # The connection may be in any state, don't hand it out again
+            self._close(http)
+            raise
+        finally:
+            self._count(in_use=-1)
+
+    def _close(self, http):
+        for conn in list(http.connections.values()):
+            conn.close()
+        http.connections.clear()
+
+
+class Urllib3Transport(Transport):
+    """
+    Sends requests through :mod:`urllib3` connection pools.
+
+    urllib3 keeps a thread-safe pool of persistent connections for every
+    host, which makes this transport a better fit than
+    :class:`Httplib2Transport` for applications that make many concurrent
+    requests. Credentials are always sent with the first request.
+
+    urllib3 is not installed with this library; install it separately to use
+    this transport.
+
+    :param int pool_size: The number of connections to keep open per host
+    :param str ca_certs: Path to a CA bundle. Defaults to the bundle shipped
+        with this library.
+    :param bool block: Wait for a free connection when all ``pool_size`` are
+        in use, instead of opening a new one that is closed once done
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, ca_certs=None,
+                 block=False):
+        if urllib3 is None:
+            raise TwilioException("Urllib3Transport requires urllib3. "
+                                  "Install it with "
+                                  "'pip install twilio[urllib3]'.")
+
+        self.pool_size = pool_size
+        self.ca_certs = ca_certs or get_cert_file()
+        self.block = block
+        self._managers = {}
+        self._lock = threading.Lock()
+        self._in_use = 0
+
+    def request(self, method, url, body=None, headers=None, timeout=None,
+                auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request. See :meth:`Transport.request`.
+        """
+        self._count(1)
+        try:
+            resp = self._urlopen(method, url, body, headers, timeout, auth,
+                                 allow_redirects, preload_content=True)
+        finally:
+            self._count(-1)
+        return resp.status, resp.headers, resp.data
+
+    def stream(self, method, url, body=None, headers=None, timeout=None,
+               auth=None, allow_redirects=False):
+        """
+        Send a single HTTP request and stream the response body. See
+        :meth:`Transport.stream`.
+        """
+        self._count(1)
+        try:
+            resp = self._urlopen(method, url, body, headers, timeout, auth,
+                                 allow_redirects, preload_content=False)
+        except Exception:
+            self._count(-1)
+            raise
+        return resp.status, resp.headers, self._iter_content(resp)
+
+    def _urlopen(self, method, url, body, headers, timeout, auth,
+                 allow_redirects, preload_content):
+        headers = dict(headers or {})
+        if auth is not None:
+            headers["Authorization"] = basic_auth_header(auth[0], auth[1])
+
+        if allow_redirects:
+            retries = urllib3.Retry(connect=0, read=0,
+                                    redirect=DEFAULT_MAX_REDIRECTS)
+        else:
+            retries = False
+
+        if timeout is None:
+            timeout = urllib3.Timeout.DEFAULT_TIMEOUT
+
+        manager = self._get_manager(Connection.proxy_info())
+        return manager.urlopen(method, url, body=body, headers=headers,
+                               timeout=timeout, retries=retries,
+                               redirect=allow_redirects,
+                               preload_content=preload_content)
+
+    def warm_up(self, url, connections=1, timeout=None):
+        """
+        Open up to ``pool_size`` connections to the host of ``url``. See
+        :meth:`Transport.warm_up`.
+        """
+        # Hold on to every response until the last one has arrived, so that
+        # each is sent over a connection of its own
+        responses = []
+        try:
+            for _ in range(min(connections, self.pool_size)):
+                try:
+                    responses.append(self._urlopen(
+                        "HEAD", url, None, None, timeout, None, False,
+                        preload_content=False,
+                    ))
+                except Exception as e:
+                    _warm_up_failed(url, e)
+        finally:
+            for resp in responses:
+                resp.release_conn()
+        return len(responses)
+
+    def _iter_content(self, resp):
+        try:
+            for chunk in resp.stream(STREAM_CHUNK_SIZE, decode_content=True):
+                yield chunk
+        finally:
+            resp.release_conn()
+            self._count(-1)
+
+    def close(self):
+        """ Close every connection held by this transport """
+        with self._lock:
+            managers = list(self._managers.values())
+            self._managers = {}
+
+        for manager in managers:
+            manager.clear()
+
+    def pool_stats(self):
+        """
+        Count this transport's connections. See :meth:`Transport.pool_stats`.
+        """
+        with self._lock:
+            managers = list(self._managers.values())
+            in_use = self._in_use
+
+        created = 0
+        for manager in managers:
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is not None:
+                    created += pool.num_connections
+
+        return {"in_use": in_use, "created": created}
+
+    def _count(self, in_use):
+        with self._lock:
+            self._in_use += in_use
+
+    def _get_manager(self, proxy_info):
+        with self._lock:
+            if proxy_info not in self._managers:
+                self._managers[proxy_info] = self._new_manager(proxy_info)
+            return self._managers[proxy_info]
+
+    def _new_manager(self, proxy_info):
+        kwargs = {
+            "maxsize": self.pool_size,
+            "block": self.block,
+            "cert_reqs": "CERT_REQUIRED",
+            "ca_certs": self.ca_certs,
+        }
+
+        if proxy_info is None:
+            return urllib3.PoolManager(**kwargs)
+
+        if proxy_info.proxy_user:
+            userinfo = "%s:%s@" % (proxy_info.proxy_user,
+                                   proxy_info.proxy_pass)
+        else:
+            userinfo = ""
+
+        if proxy_info.proxy_type == PROXY_TYPE_HTTP:
+            proxy_url = "http://%s%s:%s" % (userinfo, proxy_info.proxy_host,
+                                            proxy_info.proxy_port)
+            return urllib3.ProxyManager(proxy_url, **kwargs)
+
+        from urllib3.contrib.socks import SOCKSProxyManager
+
+        if proxy_info.proxy_type == PROXY_TYPE_SOCKS4:
+            scheme = "socks4a" if proxy_info.proxy_rdns else "socks4"
+        elif proxy_info.proxy_type == PROXY_TYPE_SOCKS5:
+            scheme = "socks5h" if proxy_info.proxy_rdns else "socks5"
+        else:
+            raise TwilioException("Unsupported proxy type %s" %
+                                  proxy_info.proxy_type)
+
+        proxy_url = "%s://%s%s:%s" % (scheme, userinfo, proxy_info.proxy_host,
+                                      proxy_info.proxy_port)
+        return SOCKSProxyManager(proxy_url, **kwargs)
+
+
+def _warm_up_failed(url, error):
+    logger.warning("Could not open a connection to %s: %s", url, error)
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport():
+    """
+    Return the transport shared by every request that isn't made through a
+    client with its own transport
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = Httplib2Transport()
+        return _default_transport
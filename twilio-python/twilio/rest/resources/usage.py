@@ -120,15 +120,18 @@ class BaseUsageRecords(ListResource):
 
 class UsageRecords(BaseUsageRecords):
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
-        super(UsageRecords, self).__init__(base_uri, auth, timeout)
-        self.daily = UsageRecordsDaily(base_uri, auth, timeout)
-        self.monthly = UsageRecordsMonthly(base_uri, auth, timeout)
-        self.yearly = UsageRecordsYearly(base_uri, auth, timeout)
-        self.today = UsageRecordsToday(base_uri, auth, timeout)
-        self.yesterday = UsageRecordsYesterday(base_uri, auth, timeout)
-        self.this_month = UsageRecordsThisMonth(base_uri, auth, timeout)
-        self.last_month = UsageRecordsLastMonth(base_uri, auth, timeout)
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT, **kwargs):
+        super(UsageRecords, self).__init__(base_uri, auth, timeout, **kwargs)
+        self.daily = UsageRecordsDaily(base_uri, auth, timeout, **kwargs)
+        self.monthly = UsageRecordsMonthly(base_uri, auth, timeout, **kwargs)
+        self.yearly = UsageRecordsYearly(base_uri, auth, timeout, **kwargs)
+        self.today = UsageRecordsToday(base_uri, auth, timeout, **kwargs)
+        self.yesterday = UsageRecordsYesterday(base_uri, auth, timeout,
+                                               **kwargs)
+        self.this_month = UsageRecordsThisMonth(base_uri, auth, timeout,
+                                                **kwargs)
+        self.last_month = UsageRecordsLastMonth(base_uri, auth, timeout,
+                                                **kwargs)
 
 
 class UsageRecordsDaily(BaseUsageRecords):
@@ -174,7 +177,8 @@ class Usage(object):
     Holds all the specific Usage list resources
     """
 
-    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT):
-        self.records = UsageRecords(base_uri, auth, timeout=timeout)
-        self.triggers = UsageTriggers(base_uri, auth, timeout=timeout)
+    def __init__(self, base_uri, auth, timeout=UNSET_TIMEOUT, **kwargs):
+        self.records = UsageRecords(base_uri, auth, timeout=timeout, **kwargs)
+        self.triggers = UsageTriggers(base_uri, auth, timeout=timeout,
+                                      **kwargs)
         self.timeout = timeout
@@ -1,9 +1,12 @@
+import base64
 import datetime
 
 from email.utils import parsedate
-from six import iteritems
+from six import binary_type, integer_types, iteritems, string_types
 import pytz
 
+from ...compat import urlencode
+
 
 def transform_params(parameters):
     """
@@ -73,6 +76,48 @@ def parse_iso_date(s):
         return s
 
 
+def basic_auth_header(username, password):
+    """
+    Return the value of an HTTP Basic Authorization header for the given
+    credentials
+
+    Ex:
+    ("user", "pass") -> "Basic dXNlcjpwYXNz"
+    """
+    credentials = ("%s:%s" % (username, password)).encode('utf-8')
+    return "Basic %s" % base64.b64encode(credentials).decode('ascii')
+
+
+def encode_data(data):
+    """
+    Form-encode a dictionary of request parameters for the body of a request
+
+    :param dict data: Parameter names mapped to integers, strings or
+        sequences of them
+    :rtype: str
+    """
+    def encode_atom(atom):
+            if isinstance(atom, (integer_types, binary_type)):
+                return atom
+            elif isinstance(atom, string_types):
+                return atom.encode('utf-8')
+            else:
+                raise ValueError('list elements should be an integer, '
+                                 'binary, or string')
+
+    udata = {}
+    for k, v in iteritems(data):
+        key = k.encode('utf-8')
+        if isinstance(v, (list, tuple, set)):
+            udata[key] = [encode_atom(x) for x in v]
+        elif isinstance(v, (integer_types, binary_type, string_types)):
+            udata[key] = encode_atom(v)
+        else:
+            raise ValueError('data should be an integer, '
+                             'binary, or string, or sequence ')
+    return urlencode(udata, doseq=True)
+
+
 def convert_boolean(boolean):
     if isinstance(boolean, bool):
         return 'true' if boolean else 'false'
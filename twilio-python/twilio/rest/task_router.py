@@ -21,21 +21,25 @@ class TwilioTaskRouterClient(TwilioClient):
     :param str token: Your Auth Token from `your dashboard
         <https://twilio.com/user/account>`_
     :param float timeout: The socket and read timeout for requests to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None,
                  base="https://taskrouter.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None, **kwargs):
         """
         Create a Twilio REST API client.
         """
         super(TwilioTaskRouterClient, self).__init__(account, token, base,
                                                      version, timeout,
-                                                     request_account)
+                                                     request_account, **kwargs)
         self.base_uri = "{0}/{1}".format(base, version)
         self.workspace_uri = "{0}/Workspaces".format(self.base_uri)
 
-        self.workspaces = Workspaces(self.base_uri, self.auth, timeout)
+        self.workspaces = Workspaces(self.base_uri, self.auth, timeout,
+                                     client=self)
 
     def activities(self, workspace_sid):
         """
@@ -43,7 +47,7 @@ class TwilioTaskRouterClient(TwilioClient):
         with the given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Activities(base_uri, self.auth, self.timeout)
+        return Activities(base_uri, self.auth, self.timeout, client=self)
 
     def events(self, workspace_sid):
         """
@@ -51,7 +55,7 @@ class TwilioTaskRouterClient(TwilioClient):
         workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Events(base_uri, self.auth, self.timeout)
+        return Events(base_uri, self.auth, self.timeout, client=self)
 
     def reservations(self, workspace_sid, task_sid):
         """
@@ -60,7 +64,7 @@ class TwilioTaskRouterClient(TwilioClient):
         """
         base_uri = "{0}/{1}/Tasks/{2}".format(self.workspace_uri,
                                               workspace_sid, task_sid)
-        return Reservations(base_uri, self.auth, self.timeout)
+        return Reservations(base_uri, self.auth, self.timeout, client=self)
 
     def worker_reservations(self, workspace_sid, worker_sid):
         """
@@ -69,7 +73,7 @@ class TwilioTaskRouterClient(TwilioClient):
         """
         base_uri = "{0}/{1}/Workers/{2}".format(self.workspace_uri,
                                                 workspace_sid, worker_sid)
-        return Reservations(base_uri, self.auth, self.timeout)
+        return Reservations(base_uri, self.auth, self.timeout, client=self)
 
     def task_queues(self, workspace_sid):
         """
@@ -77,7 +81,7 @@ class TwilioTaskRouterClient(TwilioClient):
         the given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return TaskQueues(base_uri, self.auth, self.timeout)
+        return TaskQueues(base_uri, self.auth, self.timeout, client=self)
 
     def tasks(self, workspace_sid):
         """
@@ -85,7 +89,7 @@ class TwilioTaskRouterClient(TwilioClient):
         workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Tasks(base_uri, self.auth, self.timeout)
+        return Tasks(base_uri, self.auth, self.timeout, client=self)
 
     def workers(self, workspace_sid):
         """
@@ -93,7 +97,7 @@ class TwilioTaskRouterClient(TwilioClient):
         given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Workers(base_uri, self.auth, self.timeout)
+        return Workers(base_uri, self.auth, self.timeout, client=self)
 
     def workflows(self, workspace_sid):
         """
@@ -101,4 +105,4 @@ class TwilioTaskRouterClient(TwilioClient):
         given workspace_sid
         """
         base_uri = "{0}/{1}".format(self.workspace_uri, workspace_sid)
-        return Workflows(base_uri, self.auth, self.timeout)
+        return Workflows(base_uri, self.auth, self.timeout, client=self)
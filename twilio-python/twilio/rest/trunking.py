@@ -18,17 +18,20 @@ class TwilioTrunkingClient(TwilioClient):
     :param str token: Your Auth Token from `your dashboard
         <https://twilio.com/user/account>`_
     :param float timeout: The socket and read timeout for requests to Twilio
+    :param kwargs: The other options of
+        :class:`~twilio.rest.base.TwilioClient`, such as ``transport`` and
+        ``retry_policy``
     """
 
     def __init__(self, account=None, token=None,
                  base="https://trunking.twilio.com", version="v1",
-                 timeout=UNSET_TIMEOUT, request_account=None):
+                 timeout=UNSET_TIMEOUT, request_account=None, **kwargs):
         """
         Create a Twilio REST API client.
         """
         super(TwilioTrunkingClient, self).__init__(account, token, base,
                                                    version, timeout,
-                                                   request_account)
+                                                   request_account, **kwargs)
         self.trunk_base_uri = "{0}/{1}".format(base, version)
 
     def credential_lists(self, trunk_sid):
@@ -37,7 +40,8 @@ class TwilioTrunkingClient(TwilioClient):
         """
         credential_lists_uri = "{0}/Trunks/{1}".format(
             self.trunk_base_uri, trunk_sid)
-        return CredentialLists(credential_lists_uri, self.auth, self.timeout)
+        return CredentialLists(credential_lists_uri, self.auth, self.timeout,
+                               client=self)
 
     def ip_access_control_lists(self, trunk_sid):
         """
@@ -46,7 +50,7 @@ class TwilioTrunkingClient(TwilioClient):
         ip_access_control_lists_uri = "{0}/Trunks/{1}".format(
             self.trunk_base_uri, trunk_sid)
         return IpAccessControlLists(ip_access_control_lists_uri, self.auth,
-                                    self.timeout)
+                                    self.timeout, client=self)
 
     def origination_urls(self, trunk_sid):
         """
@@ -54,7 +58,8 @@ class TwilioTrunkingClient(TwilioClient):
         """
         origination_urls_uri = "{0}/Trunks/{1}".format(
             self.trunk_base_uri, trunk_sid)
-        return OriginationUrls(origination_urls_uri, self.auth, self.timeout)
+        return OriginationUrls(origination_urls_uri, self.auth, self.timeout,
+                               client=self)
 
     def phone_numbers(self, trunk_sid):
         """
@@ -62,10 +67,12 @@ class TwilioTrunkingClient(TwilioClient):
         """
         phone_numbers_uri = "{0}/Trunks/{1}".format(self.trunk_base_uri,
                                                     trunk_sid)
-        return PhoneNumbers(phone_numbers_uri, self.auth, self.timeout)
+        return PhoneNumbers(phone_numbers_uri, self.auth, self.timeout,
+                            client=self)
 
     def trunks(self):
         """
         Return a :class:`Trunks` instance
         """
-        return Trunks(self.trunk_base_uri, self.auth, self.timeout)
+        return Trunks(self.trunk_base_uri, self.auth, self.timeout,
+                      client=self)
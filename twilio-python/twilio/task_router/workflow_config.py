@@ -1,5 +1,5 @@
 from .taskrouter_config import TaskRouterConfig
-import json
+from ..json_codec import get_json_codec
 
 
 class WorkflowConfig:
@@ -14,13 +14,13 @@ class WorkflowConfig:
         self.task_routing = TaskRouterConfig(workflow_rules, default_target)
 
     def to_json(self):
-        return json.dumps(self,
-                          default=lambda o: o.__dict__,
-                          sort_keys=True,
-                          indent=4)
+        return get_json_codec().dumps(self,
+                                      default=lambda o: o.__dict__,
+                                      sort_keys=True,
+                                      indent=4)
 
     @staticmethod
     def json2obj(data):
-        m = json.loads(data)
+        m = get_json_codec().loads(data)
         return WorkflowConfig(m['task_routing']['filters'],
                               m['task_routing']['default_filter'])